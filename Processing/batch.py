@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Headless Batch Runner
+Monte Carlo simulation of the decision funnel spread across a process pool - no Tk required
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from funnel import FunnelStage, ReliefGridDecisionEngine, CaseGenerator, StageTimings, case_rng
+from runlog import SCORE_COLUMNS, OutcomeBuffer, OutcomeLogWriter
+
+# Reaching this stage means the case was approved and care is mobilized
+TERMINAL_STAGE = FunnelStage.MOBILIZE_CARE
+
+# Generated timestamps are pinned so seeded runs are reproducible to the bit
+REFERENCE_TIME = datetime(2025, 1, 1)
+
+# ===== CASE SIMULATION =====
+@dataclass
+class CaseOutcome:
+    """Where a single simulated case left the funnel and why"""
+    exit_stage: FunnelStage
+    mobilized: bool
+    message: str
+
+    @property
+    def reason(self) -> str:
+        """The message without the case's score, for grouping exits"""
+        return self.message.split(" (")[0]
+
+def simulate_case(generator: CaseGenerator, timings: Optional[StageTimings] = None,
+                  row: Optional[Dict] = None) -> CaseOutcome:
+    """Drive one disaster from occurrence through director approval.
+
+    If row is given it is filled with the case's inputs and stage scores for the outcome log.
+    """
+    engine = ReliefGridDecisionEngine(rng=generator.rng)
+    if timings is not None:
+        engine.enable_timing(timings)
+    disaster = generator.generate_disaster()
+    if row is not None:
+        row.update(disaster_type=disaster.disaster_type, country=disaster.location["country"],
+                   security_level=disaster.security_level, magnitude=disaster.magnitude,
+                   affected_population=disaster.affected_population,
+                   casualty_estimate=disaster.casualty_estimate,
+                   infrastructure_damage=disaster.infrastructure_damage,
+                   accessibility=disaster.accessibility)
+
+    detected = engine.process_disaster_occurrence(disaster)
+    if row is not None:
+        row["detection_probability"] = engine.stage_score(FunnelStage.DISASTER_OCCURS)
+    if not detected:
+        return CaseOutcome(FunnelStage.DISASTER_OCCURS, False, "Disaster occurred but was not detected")
+
+    message = ""
+    while engine.current_funnel_stage != TERMINAL_STAGE:
+        stage = engine.current_funnel_stage
+        success, message = engine.process_stage(stage, generator.generate_stage_input(stage))
+        if row is not None:
+            if stage == FunnelStage.DISASTER_REPORTED:
+                row["report_count"] = engine.stage_results[stage].factors["total_reports"]
+            elif stage in SCORE_COLUMNS:
+                row[SCORE_COLUMNS[stage]] = engine.stage_results[stage].score
+        if not success:
+            return CaseOutcome(stage, False, message)
+
+    return CaseOutcome(TERMINAL_STAGE, True, message)
+
+def replay_case(base_seed: int, case_index: int, timings: Optional[StageTimings] = None,
+                row: Optional[Dict] = None, lazy: bool = True) -> CaseOutcome:
+    """Re-run a single case of a seeded batch on its own (lazy must match the batch's)"""
+    return simulate_case(CaseGenerator(case_rng(base_seed, case_index), REFERENCE_TIME, lazy), timings, row)
+
+# ===== AGGREGATION =====
+@dataclass
+class FunnelTally:
+    """Mergeable stage-by-stage counters for a batch of cases"""
+    cases: int = 0
+    mobilized: int = 0
+    reached: Dict[str, int] = field(default_factory=dict)  # stage name -> cases that entered it
+    exited: Dict[str, int] = field(default_factory=dict)  # stage name -> cases that left the funnel there
+    exit_reasons: Dict[str, int] = field(default_factory=dict)
+    timings: Optional[StageTimings] = None  # only collected when stage timing is switched on
+
+    def record(self, outcome: CaseOutcome):
+        """Add one case outcome to the tally"""
+        self.cases += 1
+        stages = list(FunnelStage)
+        for stage in stages[:stages.index(outcome.exit_stage) + 1]:
+            self.reached[stage.name] = self.reached.get(stage.name, 0) + 1
+
+        if outcome.mobilized:
+            self.mobilized += 1
+        else:
+            self.exited[outcome.exit_stage.name] = self.exited.get(outcome.exit_stage.name, 0) + 1
+            # Messages embed the case's score, so group on the text before it
+            self.exit_reasons[outcome.reason] = self.exit_reasons.get(outcome.reason, 0) + 1
+
+    def merge(self, other: "FunnelTally"):
+        """Fold another tally (e.g. from a worker process) into this one"""
+        self.cases += other.cases
+        self.mobilized += other.mobilized
+        for mine, theirs in ((self.reached, other.reached), (self.exited, other.exited),
+                             (self.exit_reasons, other.exit_reasons)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        if other.timings is not None:
+            if self.timings is None:
+                self.timings = StageTimings()
+            self.timings.merge(other.timings)
+
+    def summary(self) -> Dict:
+        """Summary statistics including per-stage pass and drop-off rates"""
+        stages = []
+        for stage in FunnelStage:
+            if stage == TERMINAL_STAGE:
+                break
+            reached = self.reached.get(stage.name, 0)
+            exited = self.exited.get(stage.name, 0)
+            stages.append({
+                "stage": stage.value,
+                "reached": reached,
+                "exited": exited,
+                "passed": reached - exited,
+                "pass_rate": (reached - exited) / reached if reached else 0.0,
+                "drop_off_rate": exited / reached if reached else 0.0,
+                "share_of_all_cases": reached / self.cases if self.cases else 0.0
+            })
+
+        summary = {
+            "cases": self.cases,
+            "mobilized": self.mobilized,
+            "mobilization_rate": self.mobilized / self.cases if self.cases else 0.0,
+            "stages": stages,
+            "exit_reasons": dict(sorted(self.exit_reasons.items(), key=lambda item: -item[1]))
+        }
+        if self.timings is not None:
+            summary["stage_timings"] = self.timings.snapshot()
+        return summary
+
+# ===== PARALLEL EXECUTION =====
+_STAGE_INDEX = {stage: index for index, stage in enumerate(FunnelStage)}
+
+def _run_chunk(job: Tuple[int, int, int, bool, bool, bool]) -> Tuple[FunnelTally, Optional[OutcomeBuffer]]:
+    """Worker entry point: simulate a contiguous range of cases and return its tally (and log rows)"""
+    first_case, count, base_seed, timed, logged, lazy = job
+    tally = FunnelTally(timings=StageTimings() if timed else None)
+    rows = OutcomeBuffer(count) if logged else None
+    for case_index in range(first_case, first_case + count):
+        row = {"case_index": case_index} if logged else None
+        outcome = replay_case(base_seed, case_index, tally.timings, row, lazy)
+        tally.record(outcome)
+        if logged:
+            row.update(exit_stage=_STAGE_INDEX[outcome.exit_stage], mobilized=outcome.mobilized,
+                       reason=outcome.reason)
+            rows.append(row)
+    return tally, rows
+
+def _chunk_jobs(cases: int, chunk_size: int, base_seed: int, timed: bool = False,
+                logged: bool = False, lazy: bool = True) -> List[Tuple[int, int, int, bool, bool, bool]]:
+    """Split the batch into (first case, count, base seed, timed, logged, lazy) jobs"""
+    return [(start, min(chunk_size, cases - start), base_seed, timed, logged, lazy)
+            for start in range(0, cases, chunk_size)]
+
+def _collect(results, tally: FunnelTally, log: Optional[OutcomeLogWriter]):
+    """Merge chunk results in job order, appending their rows to the log"""
+    for chunk_tally, rows in results:
+        tally.merge(chunk_tally)
+        if log is not None:
+            log.extend(rows)
+
+def run_batch(cases: int, workers: Optional[int] = None, chunk_size: int = 10000,
+              seed: Optional[int] = None, stage_timings: bool = False,
+              log_path: Optional[str] = None, lazy_cases: bool = True) -> Dict:
+    """Run a Monte Carlo batch across a process pool and return summary statistics.
+
+    Every case draws from its own stream derived from (seed, case index), so the
+    summary is identical for any worker count or chunk size. With log_path, every
+    case's inputs, scores and exit are appended to that outcome log in case order.
+    lazy_cases=False generates every input field up front (a different case stream).
+    """
+    workers = workers or os.cpu_count() or 1
+    if seed is None:
+        # Still record a seed so an unseeded run can be reproduced afterwards
+        seed = random.SystemRandom().getrandbits(63)
+    jobs = _chunk_jobs(cases, chunk_size, seed, stage_timings, log_path is not None, lazy_cases)
+    log = OutcomeLogWriter(log_path) if log_path else None
+
+    started = time.perf_counter()
+    tally = FunnelTally()
+    try:
+        if workers == 1:
+            _collect(map(_run_chunk, jobs), tally, log)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                _collect(executor.map(_run_chunk, jobs), tally, log)
+    finally:
+        if log is not None:
+            log.close()
+    elapsed = time.perf_counter() - started
+
+    summary = tally.summary()
+    summary.update({
+        "workers": workers,
+        "chunk_size": chunk_size,
+        "seed": seed,
+        "lazy_cases": lazy_cases,
+        "elapsed_seconds": elapsed,
+        "cases_per_second": cases / elapsed if elapsed > 0 else 0.0,
+        "completed_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+    })
+    if log_path:
+        summary["outcome_log"] = log_path
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Monte Carlo run of the Relief Grid decision funnel")
+    parser.add_argument("--cases", type=int, default=100000, help="number of simulated disasters")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="cases per worker task")
+    parser.add_argument("--seed", type=int, default=None, help="base seed for the per-case RNG streams")
+    parser.add_argument("--replay", type=int, default=None, metavar="CASE_INDEX",
+                        help="re-run one case of a seeded batch (requires --seed) and print its outcome")
+    parser.add_argument("--output", default="funnel_summary.json", help="where to write the summary JSON")
+    parser.add_argument("--log", default=None, metavar="DIRECTORY",
+                        help="append every case's inputs, scores and exit to a columnar outcome log")
+    parser.add_argument("--stage-timings", action="store_true",
+                        help="record per-stage latency histograms into the summary")
+    parser.add_argument("--eager-cases", action="store_true",
+                        help="generate every input field up front instead of on first read")
+    args = parser.parse_args()
+
+    if args.replay is not None:
+        if args.seed is None:
+            parser.error("--replay requires --seed")
+        outcome = replay_case(args.seed, args.replay, lazy=not args.eager_cases)
+        print(f"Case {args.replay} (seed {args.seed}): exited at {outcome.exit_stage.value} - {outcome.message}")
+        return
+
+    print(f"🚀 Simulating {args.cases:,} disasters through the Relief Grid decision funnel...")
+    summary = run_batch(args.cases, args.workers, args.chunk_size, args.seed, args.stage_timings, args.log,
+                        not args.eager_cases)
+
+    with open(args.output, "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"Completed in {summary['elapsed_seconds']:.1f}s ({summary['cases_per_second']:,.0f} cases/sec)")
+    for stage in summary["stages"]:
+        print(f"  {stage['stage']:<36} reached {stage['reached']:>10,}  pass rate {stage['pass_rate']:.1%}")
+    print(f"  Mobilized: {summary['mobilized']:,} ({summary['mobilization_rate']:.2%})")
+    for stage, timing in summary.get("stage_timings", {}).items():
+        print(f"  {stage:<36} {timing['calls']:>10,} calls  mean {timing['mean_us']:.1f}us  p99 <= {timing['p99_us']:.0f}us")
+    print(f"Summary written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Benchmark - report deduplication
+Builds one event's worth of overlapping reports (a set of distinct observations, each
+echoed many times with jittered counts and timestamps) and indexes them, reporting
+time per report and how closely the clusters recover the distinct observations.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from funnel import CaseGenerator, DisasterReport
+from dedup import ReportIndex
+
+def generate_reports(observations: int, echoes: int, seed: int = 0) -> List[DisasterReport]:
+    """observations distinct reports, each repeated about echoes times within a few minutes"""
+    rng = random.Random(seed)
+    generator = CaseGenerator(rng=rng, reference_time=datetime(2025, 1, 1))
+    generator.generate_disaster()
+    reports = []
+    for observation in range(observations):
+        original = generator.generate_disaster_reports()[0]
+        original = replace(original, report_id=f"OBS_{observation:06d}",
+                           reporter_location=f"Location_{rng.randrange(observations // 4 + 1)}")
+        for echo in range(rng.randint(1, 2 * echoes - 1)):
+            reports.append(replace(
+                original, report_id=f"{original.report_id}_{echo}",
+                report_timestamp=original.report_timestamp + timedelta(seconds=rng.uniform(0, 600)),
+                reported_casualties=int(original.reported_casualties * rng.uniform(0.97, 1.03)),
+                reported_affected=int(original.reported_affected * rng.uniform(0.97, 1.03)),
+                social_media_virality=min(100, original.social_media_virality + rng.randint(0, 20))))
+    rng.shuffle(reports)
+    return reports
+
+def run(observations: int = 2000, echoes: int = 15, seed: int = 0) -> dict:
+    reports = generate_reports(observations, echoes, seed)
+    index = ReportIndex()
+    started = time.perf_counter()
+    index.extend(reports)
+    index_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    representatives = index.representatives()
+    collapse_seconds = time.perf_counter() - started
+    return {
+        "reports": len(reports),
+        "observations": observations,
+        "clusters": len(representatives),
+        "us_per_report": index_seconds / len(reports) * 1e6,
+        "representatives_ms": collapse_seconds * 1000
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Near-duplicate report index throughput")
+    parser.add_argument("--observations", type=int, default=2000, help="distinct reports in the event")
+    parser.add_argument("--echoes", type=int, default=15, help="mean copies of each distinct report")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    result = run(args.observations, args.echoes, args.seed)
+    print(f"Indexed {result['reports']:,} reports at {result['us_per_report']:.2f}us each")
+    print(f"{result['clusters']:,} clusters for {result['observations']:,} distinct observations "
+          f"({result['reports'] / result['clusters']:.1f} reports per cluster); "
+          f"representatives built in {result['representatives_ms']:.1f}ms")
+
+if __name__ == "__main__":
+    main()
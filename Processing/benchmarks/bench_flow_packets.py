@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Benchmark - NetworkFlow packet memory
+Compares per-edge dict copies (the old behaviour) with one shared DataPacket per
+node emission, across increasing fan-out.
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neural import DataPacket, NetworkFlow
+
+# process_disaster_event freezes the location once per disaster
+LOCATION = DataPacket({"country": "Bangladesh", "province": "Chittagong",
+                       "district": "Cox's Bazar", "coordinates": (21.45, 92.0)})
+
+def _node_data() -> dict:
+    """Data dict shaped like a processed node's after a few hops"""
+    return {
+        "disaster_type": "Flash Flood Emergency",
+        "magnitude": 7.4,
+        "location": LOCATION,
+        "timestamp": "2025-01-01T00:00:00",
+        "raw_data_points": 64,
+        "source_confidence": 0.91,
+        "detection_accuracy": 0.95,
+        "processed_insights": 17,
+        "analysis_confidence": 0.88,
+        "data_quality_score": 0.93,
+        "processing_status": "completed"
+    }
+
+def _emit(emissions: int, fan_out: int, shared: bool) -> int:
+    """Retained bytes for emissions x fan_out flows"""
+    data = _node_data()
+    tracemalloc.start()
+    flows = []
+    for _ in range(emissions):
+        packet = DataPacket(data) if shared else None
+        for edge in range(fan_out):
+            flows.append(NetworkFlow(
+                from_node="source",
+                to_node=f"target_{edge}",
+                data_packet=packet if shared else data.copy(),
+                flow_rate=1.0, success_rate=1.0, latency_ms=10, packet_size=1024, priority=1
+            ))
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained
+
+def run(emissions: int = 1000, fan_outs=(1, 4, 16, 64)) -> list:
+    results = []
+    for fan_out in fan_outs:
+        copied = _emit(emissions, fan_out, shared=False)
+        shared = _emit(emissions, fan_out, shared=True)
+        flows = emissions * fan_out
+        results.append({
+            "fan_out": fan_out,
+            "flows": flows,
+            "copied_bytes_per_flow": copied / flows,
+            "shared_bytes_per_flow": shared / flows,
+            "reduction": 1 - shared / copied
+        })
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory used by NetworkFlow data packets")
+    parser.add_argument("--emissions", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'fan-out':>8} {'flows':>8} {'copy B/flow':>12} {'shared B/flow':>14} {'reduction':>10}")
+    for row in run(args.emissions):
+        print(f"{row['fan_out']:>8} {row['flows']:>8} {row['copied_bytes_per_flow']:>12.0f} "
+              f"{row['shared_bytes_per_flow']:>14.0f} {row['reduction']:>10.1%}")
+
+if __name__ == "__main__":
+    main()
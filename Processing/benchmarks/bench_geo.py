@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Benchmark - geospatial incident index
+Indexes N incidents (mostly gathered around disaster hotspots, the rest spread over
+the globe) and times inserts, 50 km radius queries, k-nearest queries, removals and
+single-linkage clustering, checking query results against brute-force haversine.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geo import GeoIndex, haversine_km
+
+def generate_coordinates(count: int, hotspots: int = 200, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centre_lat = np.degrees(np.arcsin(rng.uniform(-0.8, 0.9, hotspots)))
+    centre_lon = rng.uniform(-180, 180, hotspots)
+    clustered = int(count * 0.7)
+    which = rng.integers(0, hotspots, clustered)
+    lat = np.concatenate([centre_lat[which] + rng.normal(0, 2, clustered),
+                          np.degrees(np.arcsin(rng.uniform(-1, 1, count - clustered)))])
+    lon = np.concatenate([centre_lon[which] + rng.normal(0, 2, clustered),
+                          rng.uniform(-180, 180, count - clustered)])
+    return np.clip(lat, -90, 90), (lon + 180) % 360 - 180
+
+def run(incidents: int = 1000000, queries: int = 10000, radius_km: float = 50.0, k: int = 10,
+        cluster_sample: int = 50000, seed: int = 0) -> dict:
+    lat, lon = generate_coordinates(incidents, seed=seed)
+    index = GeoIndex()
+    started = time.perf_counter()
+    for item_id, (item_lat, item_lon) in enumerate(zip(lat.tolist(), lon.tolist())):
+        index.insert(item_id, item_lat, item_lon)
+    insert_seconds = time.perf_counter() - started
+
+    rng = np.random.default_rng(seed + 1)
+    picks = rng.integers(0, incidents, queries)
+    query_lat, query_lon = lat[picks].tolist(), lon[picks].tolist()
+
+    started = time.perf_counter()
+    hits = sum(len(index.within(a, b, radius_km)) for a, b in zip(query_lat, query_lon))
+    radius_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for a, b in zip(query_lat, query_lon):
+        index.nearest(a, b, k)
+    nearest_seconds = time.perf_counter() - started
+
+    mismatches = 0
+    for a, b in zip(query_lat[:20], query_lon[:20]):
+        distances = haversine_km(a, b, lat, lon)
+        mismatches += set(np.flatnonzero(distances <= radius_km).tolist()) != {i for i, _ in index.within(a, b, radius_km)}
+        mismatches += not np.allclose(np.sort(distances)[:k], [d for _, d in index.nearest(a, b, k)])
+
+    removed = rng.choice(incidents, incidents // 10, replace=False).tolist()
+    started = time.perf_counter()
+    for item_id in removed:
+        index.remove(item_id)
+    remove_seconds = time.perf_counter() - started
+
+    sample = GeoIndex()
+    for item_id in range(min(cluster_sample, incidents)):
+        sample.insert(item_id, lat[item_id], lon[item_id])
+    started = time.perf_counter()
+    clusters = sample.clusters(radius_km)
+    cluster_seconds = time.perf_counter() - started
+
+    return {
+        "incidents": incidents,
+        "insert_us": insert_seconds / incidents * 1e6,
+        "index_mb": index.nbytes / 1e6,
+        "radius_km": radius_km,
+        "radius_us": radius_seconds / queries * 1e6,
+        "mean_hits": hits / queries,
+        "k": k,
+        "nearest_us": nearest_seconds / queries * 1e6,
+        "remove_us": remove_seconds / len(removed) * 1e6,
+        "mismatches": mismatches,
+        "cluster_sample": len(sample),
+        "clusters": len(clusters),
+        "largest_cluster": len(clusters[0]) if clusters else 0,
+        "cluster_seconds": cluster_seconds
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Geospatial incident index throughput")
+    parser.add_argument("--incidents", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=10000)
+    parser.add_argument("--radius-km", type=float, default=50.0)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--cluster-sample", type=int, default=50000, help="incidents to cluster")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    r = run(args.incidents, args.queries, args.radius_km, args.k, args.cluster_sample, args.seed)
+    print(f"Inserted {r['incidents']:,} incidents at {r['insert_us']:.2f}us each ({r['index_mb']:.1f} MB of index)")
+    print(f"{r['radius_km']:g} km radius: {r['radius_us']:.1f}us per query, {r['mean_hits']:.1f} incidents on average")
+    print(f"{r['k']} nearest: {r['nearest_us']:.1f}us per query")
+    print(f"Removed 10% at {r['remove_us']:.2f}us each; {r['mismatches']} mismatches against brute force")
+    print(f"Clustered {r['cluster_sample']:,} incidents into {r['clusters']:,} groups "
+          f"(largest {r['largest_cluster']:,}) in {r['cluster_seconds']:.2f}s")
+
+if __name__ == "__main__":
+    main()
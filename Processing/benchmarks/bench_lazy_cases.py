@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Benchmark - lazy case generation
+Times each stage-input generator with unscored fields left undrawn (lazy) and drawn
+up front (eager), then runs the same seeded headless batch both ways on one worker
+and reports the cases/sec saving and that the funnel statistics agree.
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from funnel import CaseGenerator
+from batch import run_batch
+
+GENERATORS = ["generate_disaster_reports", "generate_multi_source_data", "generate_situation_assessment",
+              "generate_needs_analysis", "generate_local_assessment", "generate_approval_factors"]
+
+def time_generators(lazy: bool, calls: int, seed: int) -> dict:
+    generator = CaseGenerator(random.Random(seed), datetime(2025, 1, 1), lazy=lazy)
+    generator.generate_disaster()
+    return {name: min(timeit.repeat(getattr(generator, name), number=calls, repeat=3)) / calls * 1e6
+            for name in GENERATORS}
+
+def run(cases: int = 200000, calls: int = 20000, seed: int = 0) -> dict:
+    result = {"generators_us": {"lazy": time_generators(True, calls, seed),
+                                "eager": time_generators(False, calls, seed)}}
+    for mode, lazy in (("lazy", True), ("eager", False)):
+        summary = run_batch(cases, workers=1, seed=seed, lazy_cases=lazy)
+        result[mode] = {"cases_per_second": summary["cases_per_second"],
+                        "mobilization_rate": summary["mobilization_rate"],
+                        "verification_reached": summary["stages"][2]["share_of_all_cases"]}
+    result["cases"] = cases
+    result["speedup"] = result["lazy"]["cases_per_second"] / result["eager"]["cases_per_second"]
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Lazy vs eager case generation")
+    parser.add_argument("--cases", type=int, default=200000, help="cases in each headless batch")
+    parser.add_argument("--calls", type=int, default=20000, help="calls per generator timing")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    r = run(args.cases, args.calls, args.seed)
+    lazy_us, eager_us = r["generators_us"]["lazy"], r["generators_us"]["eager"]
+    for name in GENERATORS:
+        print(f"{name:<32} lazy {lazy_us[name]:6.2f}us  eager {eager_us[name]:6.2f}us")
+    for mode in ("eager", "lazy"):
+        print(f"{mode:>5} batch of {r['cases']:,}: {r[mode]['cases_per_second']:,.0f} cases/sec, "
+              f"{r[mode]['verification_reached']:.2%} reach verification, "
+              f"{r[mode]['mobilization_rate']:.2%} mobilized")
+    print(f"Lazy generation: {r['speedup']:.2f}x cases/sec")
+
+if __name__ == "__main__":
+    main()
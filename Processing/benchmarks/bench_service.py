@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Benchmark - scoring service load
+Drives the HTTP scoring service with many concurrent keep-alive clients, each posting
+generated stage inputs back to back, and reports throughput, client-side p50/p99
+latency and how the server coalesced the requests into micro-batches.
+
+Without --port an in-process service is started on a free port.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from funnel import CaseGenerator, FunnelStage
+from service import BatchScorer, MicroBatcher, ScoringService
+
+# The stages with vectorized scorers plus one engine-evaluated stage
+DEFAULT_STAGES = ["VERIFICATION", "SITUATION_ASSESSMENT", "LOCAL_SUPPORT_ASSESSMENT", "DIRECTOR_APPROVAL",
+                  "DATA_GATHERING"]
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+def generate_bodies(count: int, stages: List[FunnelStage], cases_per_request: int, seed: int) -> List[bytes]:
+    """Pre-encoded request bodies so the clients spend their time waiting on the server"""
+    generator = CaseGenerator(rng=random.Random(seed), reference_time=datetime(2025, 1, 1))
+    generator.generate_disaster()
+
+    def case() -> Dict:
+        stage = generator.rng.choice(stages)
+        if stage == FunnelStage.DISASTER_OCCURS:
+            stage_input = generator.generate_disaster()
+        else:
+            stage_input = generator.generate_stage_input(stage)
+        if isinstance(stage_input, list):
+            stage_input = [asdict(item) for item in stage_input]
+        else:
+            stage_input = asdict(stage_input)
+        return {"stage": stage.name, "input": stage_input}
+
+    bodies = []
+    for _ in range(count):
+        request = case() if cases_per_request == 1 else {"cases": [case() for _ in range(cases_per_request)]}
+        bodies.append(json.dumps(request, default=_json_default).encode())
+    return bodies
+
+async def _request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str,
+                   body: bytes = b"") -> Tuple[int, bytes]:
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+async def _client(host: str, port: int, bodies: List[bytes], latencies: List[float], failures: List[int]):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for body in bodies:
+            started = time.perf_counter()
+            status, _ = await _request(reader, writer, "POST", "/score", body)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                failures.append(status)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+async def run(host: str, port: Optional[int], clients: int, requests: int, cases_per_request: int,
+              stages: List[FunnelStage], max_delay: float, max_batch: int, seed: int) -> Dict:
+    service = None
+    if port is None:
+        service = ScoringService(MicroBatcher(BatchScorer(), max_delay, max_batch))
+        host, port = await service.start(host, 0)
+
+    bodies = generate_bodies(requests, stages, cases_per_request, seed)
+    latencies: List[float] = []
+    failures: List[int] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, bodies[index::clients], latencies, failures)
+                           for index in range(clients)))
+    elapsed = time.perf_counter() - started
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, stats = await _request(reader, writer, "GET", "/stats")
+    writer.close()
+    await writer.wait_closed()
+    if service is not None:
+        await service.stop()
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "cases": len(latencies) * cases_per_request,
+        "failures": len(failures),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "cases_per_second": len(latencies) * cases_per_request / elapsed,
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+        "server": json.loads(stats)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for the scoring service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="existing service to load (default: start one in-process)")
+    parser.add_argument("--clients", type=int, default=64, help="concurrent keep-alive connections")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--cases-per-request", type=int, default=1)
+    parser.add_argument("--stages", nargs="*", default=DEFAULT_STAGES, metavar="STAGE")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="batching window of the in-process service")
+    parser.add_argument("--max-batch", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stages = [FunnelStage[name.upper()] for name in args.stages]
+    result = asyncio.run(run(args.host, args.port, args.clients, args.requests, args.cases_per_request,
+                             stages, args.max_delay_ms / 1000, args.max_batch, args.seed))
+    batching = result["server"]["batching"]
+    print(f"{result['requests']:,} requests ({result['cases']:,} cases) from {result['clients']} clients "
+          f"in {result['seconds']:.2f}s: {result['requests_per_second']:,.0f} req/s, "
+          f"{result['cases_per_second']:,.0f} cases/s, {result['failures']} failures")
+    print(f"Client latency p50 {result['p50_ms']:.2f}ms, p99 {result['p99_ms']:.2f}ms")
+    print(f"Server latency p50 <={result['server']['latency_p50_us']:.0f}us, "
+          f"p99 <={result['server']['latency_p99_us']:.0f}us; "
+          f"{batching['flushes']:,} batches, mean {batching['mean_batch']:.1f} cases, max {batching['max_batch']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Benchmark - topology load time and adjacency memory
+Generates regional topologies of increasing size and compares JSON vs binary load
+time, engine construction time, and CSR adjacency memory vs per-node Python lists.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neural import ReliefGridNeuralEngine
+from topology import generate_regional_topology, load_binary, load_json, save_binary, save_json
+
+def _timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+def _retained_bytes(build) -> int:
+    tracemalloc.start()
+    kept = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return retained
+
+def run(district_counts=(100, 1000, 10000)) -> list:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for districts in district_counts:
+            topology = generate_regional_topology(districts)
+            json_path = os.path.join(directory, f"regional_{districts}.json")
+            binary_path = os.path.join(directory, f"regional_{districts}.rgt")
+            save_json(topology, json_path)
+            save_binary(topology, binary_path)
+
+            _, json_seconds = _timed(load_json, json_path)
+            loaded, binary_seconds = _timed(load_binary, binary_path)
+            _, engine_seconds = _timed(ReliefGridNeuralEngine, 256, 30.0, loaded)
+
+            edges = list(loaded.edges())
+            list_bytes = _retained_bytes(lambda: _adjacency_lists(edges))
+            results.append({
+                "nodes": len(loaded),
+                "edges": loaded.adjacency.edge_count,
+                "json_bytes": os.path.getsize(json_path),
+                "binary_bytes": os.path.getsize(binary_path),
+                "json_load_seconds": json_seconds,
+                "binary_load_seconds": binary_seconds,
+                "engine_build_seconds": engine_seconds,
+                "csr_bytes": loaded.adjacency.nbytes,
+                "list_adjacency_bytes": list_bytes
+            })
+    return results
+
+def _adjacency_lists(edges) -> dict:
+    """The pre-CSR representation: one Python list of successor ids per node"""
+    lists = {}
+    for source, target in edges:
+        lists.setdefault(source, []).append(target)
+    return lists
+
+def main():
+    parser = argparse.ArgumentParser(description="Topology load time and memory vs graph size")
+    parser.add_argument("--districts", type=int, nargs="+", default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    print(f"{'nodes':>9} {'edges':>9} {'json MB':>8} {'rgt MB':>7} {'json s':>7} {'rgt s':>7} "
+          f"{'engine s':>9} {'CSR KB':>8} {'lists KB':>9}")
+    for row in run(args.districts):
+        print(f"{row['nodes']:>9,} {row['edges']:>9,} {row['json_bytes'] / 1e6:>8.2f} "
+              f"{row['binary_bytes'] / 1e6:>7.2f} {row['json_load_seconds']:>7.3f} "
+              f"{row['binary_load_seconds']:>7.3f} {row['engine_build_seconds']:>9.3f} "
+              f"{row['csr_bytes'] / 1e3:>8.0f} {row['list_adjacency_bytes'] / 1e3:>9.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Benchmark Suite
+Times every decision-engine stage, scorer and case generator, the neural engine's
+process_network_step at several graph sizes, and draw_network. Results are written
+as JSON so two commits can be compared:
+
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --output after.json --compare before.json
+
+draw_network needs a display; without one the suite starts Xvfb if it is installed
+and otherwise records the rendering benchmarks as skipped.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from contextlib import contextmanager
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from funnel import CaseGenerator, ReliefGridDecisionEngine
+import neural
+from topology import generate_regional_topology
+
+REFERENCE_TIME = datetime(2025, 1, 1)
+GRAPH_SIZES = [None, 25, 250, 2500]  # None is the built-in 25-node network, others are district counts
+
+STAGE_INPUTS = [
+    ("process_disaster_occurrence", "generate_disaster"),
+    ("process_disaster_reporting", "generate_disaster_reports"),
+    ("process_verification", "generate_verification_data"),
+    ("process_data_gathering", "generate_multi_source_data"),
+    ("process_situation_assessment", "generate_situation_assessment"),
+    ("process_needs_vs_wants", "generate_needs_analysis"),
+    ("process_local_support", "generate_local_assessment"),
+    ("process_director_approval", "generate_approval_factors")
+]
+SCORER_INPUTS = [
+    ("_calculate_detection_probability", "generate_disaster"),
+    ("_calculate_verification_score", "generate_verification_data"),
+    ("_assess_data_completeness", "generate_multi_source_data"),
+    ("_calculate_severity_score", "generate_situation_assessment"),
+    ("_calculate_local_capacity", "generate_local_assessment"),
+    ("_calculate_approval_score", "generate_approval_factors")
+]
+
+# ===== TIMING =====
+def _time_per_item(function, items, repeat: int) -> dict:
+    """Best and median seconds per item over `repeat` passes through items"""
+    passes = timeit.Timer(lambda: [function(item) for item in items]).repeat(repeat, number=1)
+    per_item = [seconds / len(items) for seconds in passes]
+    return {"seconds": statistics.median(per_item), "best_seconds": min(per_item),
+            "repeat": repeat, "items": len(items)}
+
+def _case_inputs(cases: int, seed: int) -> dict:
+    """Inputs for every generator, one per case, from a fixed seed"""
+    generator = CaseGenerator(rng=random.Random(seed), reference_time=REFERENCE_TIME)
+    inputs = {name: [] for _, name in STAGE_INPUTS}
+    for _ in range(cases):
+        inputs["generate_disaster"].append(generator.generate_disaster())
+        for _, name in STAGE_INPUTS[1:]:
+            inputs[name].append(getattr(generator, name)())
+    return inputs
+
+# ===== FUNNEL ENGINE =====
+def bench_generators(cases: int, repeat: int, seed: int) -> dict:
+    """CaseGenerator.generate_* (the UI's _generate_* methods delegate to these)"""
+    results = {}
+    generator = CaseGenerator(rng=random.Random(seed), reference_time=REFERENCE_TIME)
+    generator.generate_disaster()
+    for _, name in STAGE_INPUTS:
+        method = getattr(generator, name)
+        results[f"generator.{name}"] = _time_per_item(lambda _: method(), range(cases), repeat)
+    return results
+
+def bench_stages(cases: int, repeat: int, seed: int) -> dict:
+    inputs = _case_inputs(cases, seed)
+    engine = ReliefGridDecisionEngine(rng=random.Random(seed))
+    return {f"stage.{stage}": _time_per_item(getattr(engine, stage), inputs[name], repeat)
+            for stage, name in STAGE_INPUTS}
+
+def bench_scorers(cases: int, repeat: int, seed: int) -> dict:
+    inputs = _case_inputs(cases, seed)
+    engine = ReliefGridDecisionEngine(rng=random.Random(seed))
+    return {f"scorer.{scorer}": _time_per_item(getattr(engine, scorer), inputs[name], repeat)
+            for scorer, name in SCORER_INPUTS}
+
+# ===== NEURAL ENGINE =====
+def _disaster() -> neural.DisasterEvent:
+    return neural.DisasterEvent(
+        event_id="RG_BENCH", disaster_type="Flash Flood Emergency",
+        location={"country": "Bangladesh", "province": "Chittagong", "district": "Cox's Bazar",
+                  "coordinates": (21.45, 92.0)},
+        magnitude=7.4, affected_population=120000, infrastructure_damage=0.6, casualty_estimate=800,
+        economic_impact_usd=4e8, environmental_impact=0.5, accessibility=0.5, security_level="Moderate Risk",
+        weather_conditions={"forecast": "Stormy"}, time_of_occurrence=REFERENCE_TIME,
+        duration_estimate_hours=72, media_attention=0.8, international_interest=0.7,
+        coordination_complexity=0.8, historical_precedent=True
+    )
+
+def _engine(districts) -> neural.ReliefGridNeuralEngine:
+    if districts is None:
+        return neural.ReliefGridNeuralEngine()
+    return neural.ReliefGridNeuralEngine(topology=generate_regional_topology(districts))
+
+def bench_network_steps(repeat: int, seed: int) -> dict:
+    """process_network_step over a full cascade, per step, at each graph size"""
+    results = {}
+    for districts in GRAPH_SIZES:
+        engine = _engine(districts)
+        per_step, steps = [], 0
+        for _ in range(repeat):
+            engine.reset_network()
+            random.seed(seed)
+            engine.process_disaster_event(_disaster())
+            steps, started = 1, time.perf_counter()
+            while engine.process_network_step():
+                steps += 1
+            per_step.append((time.perf_counter() - started) / steps)
+        label = "default" if districts is None else f"{len(engine.nodes)}_nodes"
+        results[f"neural.process_network_step.{label}"] = {
+            "seconds": statistics.median(per_step), "best_seconds": min(per_step),
+            "repeat": repeat, "items": steps, "nodes": len(engine.nodes)
+        }
+    return results
+
+# ===== RENDERING =====
+@contextmanager
+def virtual_display():
+    """Yield True when Tk can open a window, starting Xvfb if there is no display"""
+    if os.environ.get("DISPLAY"):
+        yield True
+        return
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        yield False
+        return
+    display = ":99"
+    server = subprocess.Popen([xvfb, display, "-screen", "0", "1920x1200x24"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 5
+    while not os.path.exists(f"/tmp/.X11-unix/X{display[1:]}") and time.monotonic() < deadline:
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = display
+    try:
+        yield True
+    finally:
+        del os.environ["DISPLAY"]
+        server.terminate()
+        server.wait()
+
+def bench_draw_network(repeat: int, seed: int) -> dict:
+    """Scene build, a frame after one step, and an idle frame, at each graph size"""
+    results = {}
+    for districts in GRAPH_SIZES:
+        ui = neural.ReliefGridNeuralUI(topology=None if districts is None else generate_regional_topology(districts))
+        ui.animation_active = False
+        ui.root.update()
+        label = "default" if districts is None else f"{len(ui.engine.nodes)}_nodes"
+        build, step, idle = [], [], []
+        for _ in range(repeat):
+            ui.engine.reset_network()
+            random.seed(seed)
+            ui.engine.process_disaster_event(_disaster())
+            ui.node_items = {}
+            started = time.perf_counter()
+            ui.draw_network(ui.engine.capture_frame())
+            build.append(time.perf_counter() - started)
+
+            ui.engine.process_network_step()
+            started = time.perf_counter()
+            ui.draw_network(ui.engine.capture_frame())
+            step.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            ui.draw_network(ui.engine.capture_frame())
+            idle.append(time.perf_counter() - started)
+        for name, samples in (("build", build), ("step_frame", step), ("idle_frame", idle)):
+            results[f"neural.draw_network.{name}.{label}"] = {
+                "seconds": statistics.median(samples), "best_seconds": min(samples),
+                "repeat": repeat, "items": 1, "nodes": len(ui.engine.nodes)
+            }
+        ui.root.destroy()
+    return results
+
+# ===== SUITE =====
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(cases: int = 500, repeat: int = 5, seed: int = 0, render: bool = True) -> dict:
+    benchmarks, skipped = {}, {}
+    benchmarks.update(bench_generators(cases, repeat, seed))
+    benchmarks.update(bench_stages(cases, repeat, seed))
+    benchmarks.update(bench_scorers(cases, repeat, seed))
+    benchmarks.update(bench_network_steps(repeat, seed))
+    if render and neural.tk is None:
+        skipped["neural.draw_network"] = "Python was built without tkinter"
+    elif render:
+        with virtual_display() as available:
+            if available:
+                benchmarks.update(bench_draw_network(repeat, seed))
+            else:
+                skipped["neural.draw_network"] = "no display and Xvfb is not installed"
+    else:
+        skipped["neural.draw_network"] = "disabled with --no-render"
+    return {
+        "metadata": {
+            "commit": _git_commit(),
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cases": cases,
+            "repeat": repeat,
+            "seed": seed
+        },
+        "benchmarks": benchmarks,
+        "skipped": skipped
+    }
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """Rows of (name, baseline seconds, current seconds, ratio, regressed).
+
+    Compares best-of-repeat times, which are far less noisy than medians.
+    """
+    rows = []
+    for name, result in current["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if before is None:
+            continue
+        ratio = result["best_seconds"] / before["best_seconds"] if before["best_seconds"] else float("inf")
+        rows.append((name, before["best_seconds"], result["best_seconds"], ratio, ratio > threshold))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Relief Grid benchmark suite")
+    parser.add_argument("--cases", type=int, default=500, help="cases per funnel benchmark pass")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-render", action="store_true", help="skip the draw_network benchmarks")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", metavar="BASELINE_JSON", help="report changes against an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="slowdown ratio reported as a regression (default 1.10)")
+    args = parser.parse_args()
+
+    results = run(args.cases, args.repeat, args.seed, render=not args.no_render)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"{'benchmark':<58} {'per call':>12}")
+    for name, result in results["benchmarks"].items():
+        print(f"{name:<58} {result['seconds'] * 1e6:>10.2f}us")
+    for name, reason in results["skipped"].items():
+        print(f"{name:<58} {'skipped':>12}  ({reason})")
+    print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare(baseline, results, args.threshold)
+        print(f"\n{'benchmark':<58} {'before':>10} {'after':>10} {'ratio':>7}")
+        for name, before, after, ratio, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<58} {before * 1e6:>8.2f}us {after * 1e6:>8.2f}us {ratio:>7.2f}{flag}")
+        if any(row[4] for row in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
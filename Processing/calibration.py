@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Threshold Calibration
+Tunes the stage cut-offs against a target funnel throughput without re-simulating.
+Each scored stage's score distribution is sorted once; the pass rate of any candidate
+cut-off is then a binary search into it, so whole threshold sets (or thousands of
+candidate cut-offs at once) are evaluated in O(log n) per stage.
+
+Stage inputs are drawn independently of each other - only the situation assessment
+builds on the disaster, and detection is the one stage that filters disasters - so the
+fraction of cases that reach mobilization is the product of the stage pass rates.
+"""
+
+import argparse
+import json
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from funnel import STAGE_THRESHOLDS, CaseGenerator, FunnelStage, ReliefGridDecisionEngine, SituationAssessment
+from runlog import SCORE_COLUMNS, STAGES, OutcomeLogReader
+from scoring import (approval_columns, batch_approval_score, batch_detection_probability,
+                     batch_local_capacity, batch_severity_score, batch_verification_score,
+                     detection_columns, local_capacity_columns, severity_columns,
+                     verification_columns)
+
+Thresholds = Dict[FunnelStage, Tuple[float, ...]]
+
+@dataclass(frozen=True)
+class PassRule:
+    """Which of a stage's cut-offs decides pass/fail, and on which side of it a case passes"""
+    index: int
+    below: bool = False  # local support passes when capacity is *below* the cut-off
+
+PASS_RULES = {
+    FunnelStage.VERIFICATION: PassRule(0),  # only high-confidence verification proceeds
+    FunnelStage.DATA_GATHERING: PassRule(0),
+    FunnelStage.SITUATION_ASSESSMENT: PassRule(1),  # critical and serious both proceed
+    FunnelStage.LOCAL_SUPPORT_ASSESSMENT: PassRule(1, below=True),  # insufficient and limited both proceed
+    FunnelStage.DIRECTOR_APPROVAL: PassRule(1)  # full and limited approval both proceed
+}
+
+# Stages before mobilization; the unscored ones pass at a fixed, measured rate
+FUNNEL_STAGES = STAGES[:STAGES.index(FunnelStage.MOBILIZE_CARE)]
+
+# ===== SCORE DISTRIBUTIONS =====
+class ScoreDistribution:
+    """One stage's scores, sorted once for binary-search pass rates"""
+
+    def __init__(self, stage: FunnelStage, scores: np.ndarray):
+        scores = np.asarray(scores, dtype=np.float64)
+        self.stage = stage
+        self.rule = PASS_RULES[stage]
+        self.scores = np.sort(scores[~np.isnan(scores)])
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def fraction_above(self, cutoffs) -> np.ndarray:
+        """Fraction of scores strictly above each cut-off"""
+        return (len(self.scores) - np.searchsorted(self.scores, cutoffs, side="right")) / max(len(self.scores), 1)
+
+    def fraction_below(self, cutoffs) -> np.ndarray:
+        """Fraction of scores strictly below each cut-off"""
+        return np.searchsorted(self.scores, cutoffs, side="left") / max(len(self.scores), 1)
+
+    def pass_rate(self, cutoffs) -> np.ndarray:
+        """Pass rate for a pass cut-off, or an array of candidate cut-offs"""
+        return self.fraction_below(cutoffs) if self.rule.below else self.fraction_above(cutoffs)
+
+    def bands(self, thresholds: Sequence[float]) -> np.ndarray:
+        """Fraction of cases in each band of a threshold tuple, in the order the stage checks them.
+
+        The result has one more entry than thresholds - the last is everything past the
+        final cut-off (e.g. "Low severity" or "Local capacity adequate").
+        """
+        cumulative = self.fraction_below(thresholds) if self.rule.below else self.fraction_above(thresholds)
+        return np.diff(np.concatenate(([0.0], cumulative, [1.0])))
+
+    def cutoff_for(self, rate: float) -> float:
+        """A pass cut-off that lets through as close to rate of the cases as ties allow"""
+        scores, n = self.scores, len(self.scores)
+        if not n:
+            raise ValueError(f"No scores recorded for {self.stage.value}")
+        rate = min(max(rate, 0.0), 1.0)
+        passing = int(round(rate * n))
+        if passing == n:
+            return float(np.nextafter(scores[-1], np.inf) if self.rule.below else np.nextafter(scores[0], -np.inf))
+        # Scores tied with the one at the boundary pass or fail together; take whichever side is closer
+        cutoff = scores[passing] if self.rule.below else scores[n - passing - 1]
+        widened = np.nextafter(cutoff, np.inf if self.rule.below else -np.inf)
+        return float(min((cutoff, widened), key=lambda value: abs(self.pass_rate(value) - rate)))
+
+def with_cutoff(stage: FunnelStage, thresholds: Sequence[float], cutoff: float) -> Tuple[float, ...]:
+    """Replace a stage's pass cut-off, pushing the other cut-offs aside so the bands stay ordered"""
+    rule = PASS_RULES[stage]
+    adjusted = []
+    for index, value in enumerate(thresholds):
+        if index == rule.index:
+            adjusted.append(cutoff)
+        elif (index < rule.index) != rule.below:
+            adjusted.append(max(value, cutoff))  # stricter bands sit above the pass cut-off
+        else:
+            adjusted.append(min(value, cutoff))
+    return tuple(adjusted)
+
+# ===== CALIBRATION =====
+@dataclass
+class FunnelEstimate:
+    """Predicted funnel behaviour under one threshold set"""
+    thresholds: Thresholds
+    pass_rates: Dict[FunnelStage, float]
+    reached: Dict[FunnelStage, float]  # fraction of all cases entering each stage
+    bands: Dict[FunnelStage, np.ndarray]
+    throughput: float  # fraction of cases mobilized
+
+class FunnelCalibrator:
+    """Sorted score distributions for the scored stages plus the measured pass rates of the rest"""
+
+    def __init__(self, distributions: Dict[FunnelStage, ScoreDistribution],
+                 fixed_rates: Dict[FunnelStage, float]):
+        self.distributions = distributions
+        self.fixed_rates = fixed_rates
+
+    @classmethod
+    def generate(cls, cases: int = 100000, seed: int = 0) -> "FunnelCalibrator":
+        """Draw cases independent inputs for every stage and score them in bulk"""
+        generator = CaseGenerator(rng=random.Random(seed), reference_time=datetime(2025, 1, 1))
+        engine = ReliefGridDecisionEngine(rng=random.Random(seed))
+        draws = np.random.default_rng(seed)
+        media_presence = draws.uniform(0.3, 0.9, cases)
+
+        disasters = [generator.generate_disaster() for _ in range(cases)]
+        detection = batch_detection_probability(**detection_columns(disasters), media_presence=media_presence)
+        # Later stages only ever see detected disasters, which skew towards low damage
+        detected = [disaster for disaster, hit in zip(disasters, draws.random(cases) < detection) if hit]
+
+        def assessment(index: int) -> SituationAssessment:
+            generator.current_case = detected[index % len(detected)]
+            return generator.generate_situation_assessment()
+
+        reported = 0
+        for disaster in detected:
+            generator.current_case = disaster
+            reported += engine.process_disaster_reporting(generator.generate_disaster_reports())[0]
+        needs = sum(engine.process_needs_vs_wants(generator.generate_needs_analysis())[0] for _ in range(cases))
+        engine.stage_results.clear()
+
+        scores = {
+            FunnelStage.VERIFICATION: batch_verification_score(**verification_columns(
+                [generator.generate_verification_data() for _ in range(cases)])),
+            FunnelStage.DATA_GATHERING: np.fromiter(
+                (engine._assess_data_completeness(generator.generate_multi_source_data()) for _ in range(cases)),
+                dtype=np.float64, count=cases),
+            FunnelStage.SITUATION_ASSESSMENT: batch_severity_score(**severity_columns(
+                [assessment(index) for index in range(cases)])),
+            FunnelStage.LOCAL_SUPPORT_ASSESSMENT: batch_local_capacity(**local_capacity_columns(
+                [generator.generate_local_assessment() for _ in range(cases)])),
+            FunnelStage.DIRECTOR_APPROVAL: batch_approval_score(**approval_columns(
+                [generator.generate_approval_factors() for _ in range(cases)]))
+        }
+        fixed_rates = {
+            FunnelStage.DISASTER_OCCURS: float(detection.mean()),  # detection is a draw against this probability
+            FunnelStage.DISASTER_REPORTED: reported / len(detected),
+            FunnelStage.NEEDS_VS_WANTS: needs / cases
+        }
+        return cls({stage: ScoreDistribution(stage, values) for stage, values in scores.items()}, fixed_rates)
+
+    @classmethod
+    def from_log(cls, reader: OutcomeLogReader) -> "FunnelCalibrator":
+        """Distributions from a batch outcome log (only the cases that reached each stage are scored)"""
+        exits = np.zeros(len(STAGES), dtype=np.int64)
+        for chunk in reader.scan(["exit_stage"]):
+            exits += np.bincount(chunk["exit_stage"], minlength=len(STAGES))
+        reached = exits[::-1].cumsum()[::-1]  # cases entering each stage
+
+        fixed_rates = {}
+        for stage in FUNNEL_STAGES:
+            if stage not in PASS_RULES:
+                index = STAGES.index(stage)
+                fixed_rates[stage] = float(reached[index + 1] / reached[index]) if reached[index] else 0.0
+        distributions = {stage: ScoreDistribution(stage, reader.read(SCORE_COLUMNS[stage])) for stage in PASS_RULES}
+        return cls(distributions, fixed_rates)
+
+    def resolve(self, thresholds: Optional[Thresholds] = None) -> Thresholds:
+        """Candidate thresholds with any stage left out taken from STAGE_THRESHOLDS"""
+        return {**{stage: STAGE_THRESHOLDS[stage] for stage in PASS_RULES}, **(thresholds or {})}
+
+    def pass_rates(self, thresholds: Optional[Thresholds] = None) -> Dict[FunnelStage, float]:
+        thresholds = self.resolve(thresholds)
+        rates = {}
+        for stage in FUNNEL_STAGES:
+            if stage in PASS_RULES:
+                distribution = self.distributions[stage]
+                rates[stage] = float(distribution.pass_rate(thresholds[stage][distribution.rule.index]))
+            else:
+                rates[stage] = self.fixed_rates[stage]
+        return rates
+
+    def throughput(self, thresholds: Optional[Thresholds] = None) -> float:
+        """Fraction of cases mobilized under a threshold set"""
+        return float(np.prod(list(self.pass_rates(thresholds).values())))
+
+    def evaluate(self, thresholds: Optional[Thresholds] = None) -> FunnelEstimate:
+        thresholds = self.resolve(thresholds)
+        pass_rates = self.pass_rates(thresholds)
+        reached, fraction = {}, 1.0
+        for stage in FUNNEL_STAGES:
+            reached[stage] = fraction
+            fraction *= pass_rates[stage]
+        bands = {stage: self.distributions[stage].bands(thresholds[stage]) for stage in PASS_RULES}
+        return FunnelEstimate(thresholds, pass_rates, reached, bands, fraction)
+
+    def stage_cutoffs(self, stage: FunnelStage, candidates) -> np.ndarray:
+        """End-to-end throughput for each candidate pass cut-off of one stage, the others held fixed"""
+        others = self.pass_rates()
+        others.pop(stage)
+        return self.distributions[stage].pass_rate(np.asarray(candidates, dtype=np.float64)) * np.prod(list(others.values()))
+
+    def solve(self, target: float, stages: Optional[Sequence[FunnelStage]] = None,
+              thresholds: Optional[Thresholds] = None) -> Thresholds:
+        """Thresholds that mobilize about target of all cases.
+
+        The adjustable stages (every scored stage by default) share the required pass rate
+        equally; the others keep their current cut-offs. Stages with the fewest distinct
+        scores are fixed first and the rest make up for their rounding. Stage rates are
+        capped at 1, so a target above what the fixed stages allow is approached but not reached.
+        """
+        thresholds = dict(self.resolve(thresholds))
+        stages = list(stages) if stages is not None else list(PASS_RULES)
+        rates = self.pass_rates(thresholds)
+        remaining = target / max(float(np.prod([rate for stage, rate in rates.items() if stage not in stages])), 1e-300)
+        stages.sort(key=lambda stage: len(np.unique(self.distributions[stage].scores)))
+        for solved, stage in enumerate(stages):
+            distribution = self.distributions[stage]
+            stage_rate = min(remaining ** (1 / (len(stages) - solved)), 1.0)
+            thresholds[stage] = with_cutoff(stage, thresholds[stage], distribution.cutoff_for(stage_rate))
+            remaining /= max(float(distribution.pass_rate(thresholds[stage][distribution.rule.index])), 1e-300)
+        return thresholds
+
+    def solve_rates(self, rates: Dict[FunnelStage, float],
+                    thresholds: Optional[Thresholds] = None) -> Thresholds:
+        """Thresholds giving each listed stage its own target pass rate"""
+        thresholds = self.resolve(thresholds)
+        return {**thresholds, **{stage: with_cutoff(stage, thresholds[stage], self.distributions[stage].cutoff_for(rate))
+                                 for stage, rate in rates.items()}}
+
+# ===== CLI =====
+def _parse_stage_values(items: Sequence[str]) -> Dict[FunnelStage, str]:
+    """STAGE=VALUE pairs, STAGE being a FunnelStage name such as DIRECTOR_APPROVAL"""
+    parsed = {}
+    for item in items:
+        name, _, value = item.partition("=")
+        stage = FunnelStage[name.strip().upper()]
+        if stage not in PASS_RULES:
+            raise SystemExit(f"{stage.name} has no score cut-off")
+        parsed[stage] = value
+    return parsed
+
+def print_estimate(estimate: FunnelEstimate):
+    for stage in FUNNEL_STAGES:
+        line = f"  {stage.value:<32} reached {estimate.reached[stage]:7.2%}  pass {estimate.pass_rates[stage]:7.2%}"
+        if stage in PASS_RULES:
+            cutoffs = ", ".join(f"{value:g}" for value in estimate.thresholds[stage])
+            bands = " / ".join(f"{share:.1%}" for share in estimate.bands[stage])
+            line += f"  cut-offs ({cutoffs})  bands {bands}"
+        print(line)
+    print(f"  Mobilized: {estimate.throughput:.3%} of cases")
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune stage cut-offs against target funnel throughput")
+    parser.add_argument("--cases", type=int, default=100000, help="generated cases per stage")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log", metavar="DIR", help="use the score distributions of a batch outcome log instead")
+    parser.add_argument("--set", nargs="*", default=[], metavar="STAGE=A,B,...",
+                        help="candidate cut-offs, e.g. DIRECTOR_APPROVAL=70,55,40")
+    parser.add_argument("--target", type=float, help="solve for cut-offs mobilizing this fraction of cases")
+    parser.add_argument("--rates", nargs="*", default=[], metavar="STAGE=RATE",
+                        help="solve for cut-offs giving these stage pass rates")
+    parser.add_argument("--output", help="write the resulting thresholds to this JSON file")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.log:
+        calibrator = FunnelCalibrator.from_log(OutcomeLogReader(args.log))
+        source = args.log
+    else:
+        calibrator = FunnelCalibrator.generate(args.cases, args.seed)
+        source = f"{args.cases:,} generated cases per stage"
+    print(f"Sorted score distributions from {source} in {time.perf_counter() - started:.2f}s")
+
+    print("\nCurrent cut-offs:")
+    print_estimate(calibrator.evaluate())
+
+    thresholds = {stage: tuple(float(v) for v in value.split(","))
+                  for stage, value in _parse_stage_values(args.set).items()}
+    if args.rates:
+        thresholds = calibrator.solve_rates({stage: float(value) for stage, value in _parse_stage_values(args.rates).items()},
+                                            thresholds)
+    if args.target is not None:
+        thresholds = calibrator.solve(args.target, thresholds=thresholds)
+    if not thresholds:
+        return
+
+    started = time.perf_counter()
+    estimate = calibrator.evaluate(thresholds)
+    print(f"\nCandidate cut-offs (evaluated in {(time.perf_counter() - started) * 1e6:.0f}us):")
+    print_estimate(estimate)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({stage.name: list(values) for stage, values in estimate.thresholds.items()}, f, indent=2)
+        print(f"\nThresholds written to {args.output}")
+
+if __name__ == "__main__":
+    main()
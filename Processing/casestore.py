@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Columnar Case Store
+Struct-of-arrays storage for the funnel dataclasses: one typed NumPy array per numeric
+field, interned category codes for repeated strings and nested dicts, and lightweight
+row views that round-trip back to the original dataclasses.
+"""
+
+import copy
+import sys
+from dataclasses import fields
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from funnel import (DisasterEvent, DisasterReport, VerificationData, SituationAssessment,
+                    LocalSupportAssessment, DirectorApprovalFactors)
+from scoring import LIFE_THREAT_LEVELS
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_INITIAL_CAPACITY = 1024
+
+# ===== COLUMN TYPES =====
+class NumericColumn:
+    """Typed array for bool, int and float fields"""
+
+    def __init__(self, dtype):
+        self.dtype = np.dtype(dtype)
+        self.data = np.zeros(_INITIAL_CAPACITY, dtype=self.dtype)
+
+    def resize(self, capacity: int):
+        grown = np.zeros(capacity, dtype=self.dtype)
+        grown[:len(self.data)] = self.data
+        self.data = grown
+
+    def set(self, index: int, value):
+        self.data[index] = value
+
+    def get(self, index: int):
+        return self.data[index].item()
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+class DatetimeColumn(NumericColumn):
+    """Naive datetimes stored as int64 microseconds since the epoch (exact round-trip)"""
+
+    def __init__(self):
+        super().__init__(np.int64)
+
+    def set(self, index: int, value: datetime):
+        if value.tzinfo is not None:
+            raise ValueError("DatetimeColumn only stores naive datetimes")
+        self.data[index] = (value - _EPOCH) // _MICROSECOND
+
+    def get(self, index: int) -> datetime:
+        return _EPOCH + timedelta(microseconds=int(self.data[index]))
+
+def _freeze(value) -> Any:
+    """Hashable key for interning strings, dicts, lists and tuples"""
+    if isinstance(value, dict):
+        return ("dict", tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return ("list", tuple(_freeze(item) for item in value))
+    if isinstance(value, tuple):
+        return ("tuple", tuple(_freeze(item) for item in value))
+    return value
+
+def _deep_sizeof(value) -> int:
+    """Bytes held by a value and the containers and items nested inside it"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_sizeof(key) + _deep_sizeof(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_deep_sizeof(item) for item in value)
+    return size
+
+class CategoryColumn:
+    """Interned values: each distinct value is stored once, rows hold small integer codes"""
+
+    def __init__(self, vocabulary: Sequence = (), dtype=np.int32):
+        self.vocabulary: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+        self.vocabulary_nbytes = 0
+        self.data = np.zeros(_INITIAL_CAPACITY, dtype=dtype)
+        for value in vocabulary:
+            self.intern(value)
+
+    def intern(self, value) -> int:
+        key = _freeze(value)
+        code = self._codes.get(key)
+        if code is None:
+            code = len(self.vocabulary)
+            if code > np.iinfo(self.data.dtype).max:
+                raise OverflowError(f"Too many distinct values for {self.data.dtype} category codes")
+            self._codes[key] = code
+            self.vocabulary.append(copy.deepcopy(value))
+            self.vocabulary_nbytes += _deep_sizeof(value)
+        return code
+
+    def resize(self, capacity: int):
+        grown = np.zeros(capacity, dtype=self.data.dtype)
+        grown[:len(self.data)] = self.data
+        self.data = grown
+
+    def set(self, index: int, value):
+        self.data[index] = self.intern(value)
+
+    def get(self, index: int):
+        value = self.vocabulary[self.data[index]]
+        # Mutable values are shared by every row using them, so hand out copies
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    @property
+    def nbytes(self) -> int:
+        """Codes plus the interned values they index into"""
+        return self.data.nbytes + self.vocabulary_nbytes
+
+class NumericDictColumn:
+    """Dict with a fixed set of numeric keys flattened into a (rows, keys) array
+
+    CaseTable swaps it for a CategoryColumn (see to_category) when a row arrives with other keys.
+    """
+
+    def __init__(self, keys: Tuple[str, ...], dtype):
+        self.keys = tuple(keys)
+        self.dtype = np.dtype(dtype)
+        self.data = np.zeros((_INITIAL_CAPACITY, len(self.keys)), dtype=self.dtype)
+
+    def resize(self, capacity: int):
+        grown = np.zeros((capacity, len(self.keys)), dtype=self.dtype)
+        grown[:len(self.data)] = self.data
+        self.data = grown
+
+    def accepts(self, value) -> bool:
+        return isinstance(value, dict) and tuple(value.keys()) == self.keys
+
+    def set(self, index: int, value: dict):
+        if not self.accepts(value):
+            raise ValueError(f"Expected keys {self.keys}, got {tuple(value.keys())}")
+        self.data[index] = [value[key] for key in self.keys]
+
+    def get(self, index: int) -> dict:
+        return dict(zip(self.keys, self.data[index].tolist()))
+
+    def to_category(self, size: int) -> CategoryColumn:
+        """The first `size` rows re-stored as a generic interned column"""
+        column = CategoryColumn()
+        column.resize(len(self.data))
+        for index in range(size):
+            column.set(index, self.get(index))
+        return column
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+# ===== SCHEMAS =====
+SECURITY_LEVELS = ["Safe", "Moderate Risk", "High Risk", "Extremely Dangerous"]
+
+# Column factories per field; any field not listed is interned as a category
+CASE_SCHEMAS: Dict[Type, Dict[str, Any]] = {
+    DisasterEvent: {
+        "magnitude": lambda: NumericColumn(np.float64),
+        "affected_population": lambda: NumericColumn(np.int64),
+        "infrastructure_damage": lambda: NumericColumn(np.float64),
+        "casualty_estimate": lambda: NumericColumn(np.int64),
+        "economic_impact_usd": lambda: NumericColumn(np.float64),
+        "environmental_impact": lambda: NumericColumn(np.float64),
+        "accessibility": lambda: NumericColumn(np.float64),
+        "security_level": lambda: CategoryColumn(SECURITY_LEVELS, np.int8),
+        "time_of_occurrence": DatetimeColumn,
+        "duration_estimate_hours": lambda: NumericColumn(np.int32)
+    },
+    DisasterReport: {
+        "source_reliability": lambda: NumericColumn(np.float64),
+        "report_timestamp": DatetimeColumn,
+        "reported_casualties": lambda: NumericColumn(np.int64),
+        "reported_affected": lambda: NumericColumn(np.int64),
+        "includes_media": lambda: NumericColumn(np.bool_),
+        "translation_confidence": lambda: NumericColumn(np.float64),
+        "contains_coordinates": lambda: NumericColumn(np.bool_),
+        "social_media_virality": lambda: NumericColumn(np.int16),
+        "government_acknowledgment": lambda: NumericColumn(np.bool_)
+    },
+    VerificationData: {
+        "satellite_imagery_available": lambda: NumericColumn(np.bool_),
+        "satellite_damage_assessment": lambda: NumericColumn(np.float64),
+        "multiple_source_correlation": lambda: NumericColumn(np.float64),
+        "government_confirmation": lambda: NumericColumn(np.bool_),
+        "international_media_coverage": lambda: NumericColumn(np.bool_),
+        "social_media_verification_score": lambda: NumericColumn(np.float64),
+        "expert_analysis_available": lambda: NumericColumn(np.bool_),
+        "historical_disaster_pattern_match": lambda: NumericColumn(np.float64),
+        "verification_confidence": lambda: NumericColumn(np.float64)
+    },
+    SituationAssessment: {
+        "confirmed_casualties": lambda: NumericColumn(np.int64),
+        "confirmed_affected_population": lambda: NumericColumn(np.int64),
+        "infrastructure_damage_verified": lambda: NumericColumn(np.float64),
+        "immediate_life_threat_level": lambda: CategoryColumn(LIFE_THREAT_LEVELS, np.int8),
+        "displacement_numbers": lambda: NumericColumn(np.int64),
+        "security_assessment": lambda: CategoryColumn(SECURITY_LEVELS, np.int8),
+        "disease_outbreak_risk": lambda: NumericColumn(np.float64),
+        "food_security_impact": lambda: NumericColumn(np.float64),
+        "water_access_impact": lambda: NumericColumn(np.float64),
+        "shelter_needs_assessment": lambda: NumericColumn(np.int64),
+        "medical_needs_assessment": lambda: NumericDictColumn(("critical", "serious"), np.int32)
+    },
+    LocalSupportAssessment: {
+        "government_response_capacity": lambda: NumericColumn(np.float64),
+        "local_ngo_capacity": lambda: NumericColumn(np.float64),
+        "community_self_help_capacity": lambda: NumericColumn(np.float64),
+        "private_sector_involvement": lambda: NumericColumn(np.float64),
+        "religious_organization_support": lambda: NumericColumn(np.float64),
+        "diaspora_community_support": lambda: NumericColumn(np.float64),
+        "existing_infrastructure_usability": lambda: NumericColumn(np.float64),
+        "local_medical_capacity": lambda: NumericColumn(np.float64),
+        "local_food_supply_capacity": lambda: NumericColumn(np.float64),
+        "political_stability_factor": lambda: NumericColumn(np.float64)
+    },
+    DirectorApprovalFactors: {
+        "total_estimated_cost": lambda: NumericColumn(np.float64),
+        "funding_source_availability": lambda: NumericDictColumn(
+            ("emergency_fund", "donor_pledges", "government_support"), np.float64),
+        "organizational_mandate_alignment": lambda: NumericColumn(np.float64),
+        "political_sensitivity_score": lambda: NumericColumn(np.float64),
+        "media_attention_level": lambda: NumericColumn(np.int16),
+        "donor_interest_likelihood": lambda: NumericColumn(np.float64),
+        "operational_complexity": lambda: NumericColumn(np.float64),
+        "security_risk_to_staff": lambda: NumericColumn(np.float64),
+        "reputation_risk_assessment": lambda: NumericColumn(np.float64),
+        "success_probability": lambda: NumericColumn(np.float64),
+        "timeline_to_implementation": lambda: NumericColumn(np.int32),
+        "staff_availability": lambda: NumericDictColumn(("field_workers", "specialists"), np.int32),
+        "equipment_availability": lambda: NumericDictColumn(("vehicles", "medical"), np.int32)
+    }
+}
+
+# ===== TABLES =====
+class CaseRow:
+    """Lightweight view of one stored row - fields are decoded on access"""
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "CaseTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str):
+        return self._table.value(self._index, name)
+
+    @property
+    def case_id(self) -> int:
+        return int(self._table.case_ids[self._index])
+
+    def to_dataclass(self):
+        return self._table.row(self._index)
+
+    def __repr__(self):
+        return f"CaseRow({self._table.record_type.__name__}, case_id={self.case_id})"
+
+class CaseTable:
+    """Columnar table of one funnel dataclass type"""
+
+    def __init__(self, record_type: Type):
+        self.record_type = record_type
+        self.field_names = [f.name for f in fields(record_type)]
+        schema = CASE_SCHEMAS.get(record_type, {})
+        self.columns = {name: schema[name]() if name in schema else CategoryColumn()
+                        for name in self.field_names}
+        self.case_ids = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> CaseRow:
+        if not -self._size <= index < self._size:
+            raise IndexError("CaseTable index out of range")
+        return CaseRow(self, index % self._size)
+
+    def __iter__(self):
+        return (CaseRow(self, index) for index in range(self._size))
+
+    def _ensure_capacity(self, needed: int):
+        capacity = len(self.case_ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for column in self.columns.values():
+            column.resize(capacity)
+        grown = np.zeros(capacity, dtype=np.int64)
+        grown[:self._size] = self.case_ids[:self._size]
+        self.case_ids = grown
+
+    def append(self, record, case_id: Optional[int] = None) -> int:
+        """Store a dataclass instance and return its row index"""
+        if not isinstance(record, self.record_type):
+            raise TypeError(f"Expected {self.record_type.__name__}, got {type(record).__name__}")
+        index = self._size
+        self._ensure_capacity(index + 1)
+        for name in self.field_names:
+            column, value = self.columns[name], getattr(record, name)
+            if isinstance(column, NumericDictColumn) and not column.accepts(value):
+                # A different key set (e.g. another donor mix) cannot share the flat array,
+                # so this field falls back to interned objects from here on
+                column = self.columns[name] = column.to_category(index)
+            column.set(index, value)
+        self.case_ids[index] = index if case_id is None else case_id
+        self._size += 1
+        return index
+
+    def extend(self, records, case_ids: Optional[Sequence[int]] = None):
+        """Store several records, optionally with matching case ids"""
+        for offset, record in enumerate(records):
+            self.append(record, None if case_ids is None else case_ids[offset])
+
+    def value(self, index: int, name: str):
+        if name not in self.columns:
+            raise AttributeError(f"{self.record_type.__name__} has no field '{name}'")
+        return self.columns[name].get(index)
+
+    def row(self, index: int):
+        """Rebuild the original dataclass for one row"""
+        return self.record_type(**{name: self.columns[name].get(index) for name in self.field_names})
+
+    def column(self, name: str) -> np.ndarray:
+        """Array view over one column's stored values (category codes for interned fields)"""
+        return self.columns[name].data[:self._size]
+
+    def categories(self, name: str) -> List[Any]:
+        """Vocabulary that a category column's codes index into"""
+        return self.columns[name].vocabulary
+
+    @property
+    def nbytes(self) -> int:
+        return self.case_ids.nbytes + sum(column.nbytes for column in self.columns.values())
+
+class CaseStore:
+    """One columnar table per funnel dataclass, rows linked by case id"""
+
+    RECORD_TYPES = (DisasterEvent, DisasterReport, VerificationData, SituationAssessment,
+                    LocalSupportAssessment, DirectorApprovalFactors)
+
+    def __init__(self):
+        self.tables: Dict[Type, CaseTable] = {record_type: CaseTable(record_type)
+                                              for record_type in self.RECORD_TYPES}
+
+    def add(self, case_id: int, record) -> int:
+        """Store a record for a case; the table is chosen by the record's type"""
+        return self.tables[type(record)].append(record, case_id)
+
+    def table(self, record_type: Type) -> CaseTable:
+        return self.tables[record_type]
+
+    def records_for(self, case_id: int, record_type: Type) -> List:
+        """All records of one type stored for a case, as dataclasses"""
+        table = self.tables[record_type]
+        rows = np.flatnonzero(table.case_ids[:len(table)] == case_id)
+        return [table.row(int(index)) for index in rows]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(table.nbytes for table in self.tables.values())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Report Deduplication
+Collapses near-duplicate DisasterReports - the same place, source type and story
+within minutes of each other, reposts included - into weighted clusters, so that
+process_disaster_reporting and everything downstream see one report per cluster.
+
+Reports are bucketed by (reporter_location, source_type, time bucket, similarity key),
+where the similarity key is the reported severity plus log-scale bins of the casualty
+and affected counts. Each report costs at most three dict lookups (its own time bucket
+and the two adjacent ones), so the index stays O(1) per report however many reports
+an event produces.
+"""
+
+import heapq
+import math
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # funnel imports this module for process_disaster_reporting
+    from funnel import DisasterReport
+
+# Width of a count bin in natural-log units: counts within ~25% of each other usually share a bin
+COUNT_BIN_WIDTH = 0.25
+
+BucketKey = Tuple[str, str, int, str, int, int]
+
+def similarity_key(report: "DisasterReport", bin_width: float = COUNT_BIN_WIDTH) -> Tuple[str, int, int]:
+    """Cheap near-duplicate key: severity and binned casualty/affected counts.
+
+    Counts either side of a bin edge get different keys, so near-duplicates can
+    occasionally stay apart - never the other way round.
+    """
+    return (report.reported_severity,
+            int(math.log1p(max(report.reported_casualties, 0)) / bin_width),
+            int(math.log1p(max(report.reported_affected, 0)) / bin_width))
+
+@dataclass
+class ReportCluster:
+    """Near-duplicate reports of one observation, represented by their most reliable member"""
+    report: "DisasterReport"
+    weight: int = 1
+    first_seen: float = 0.0  # report_timestamp bounds, POSIX seconds
+    last_seen: float = 0.0
+    government_acknowledgment: bool = False
+    social_media_virality: int = 0
+    includes_media: bool = False
+    keys: List[BucketKey] = field(default_factory=list)  # index entries pointing at this cluster
+
+    def add(self, report: "DisasterReport", timestamp: float):
+        self.weight += 1
+        self.first_seen = min(self.first_seen, timestamp)
+        self.last_seen = max(self.last_seen, timestamp)
+        self.government_acknowledgment |= report.government_acknowledgment
+        self.social_media_virality = max(self.social_media_virality, report.social_media_virality)
+        self.includes_media |= report.includes_media
+        if report.source_reliability > self.report.source_reliability:
+            self.report = report
+
+    def representative(self) -> "DisasterReport":
+        """The most reliable member, carrying any acknowledgment, peak virality or media from the rest"""
+        report = self.report
+        if (report.government_acknowledgment == self.government_acknowledgment
+                and report.social_media_virality == self.social_media_virality
+                and report.includes_media == self.includes_media):
+            return report
+        return replace(report, government_acknowledgment=self.government_acknowledgment,
+                       social_media_virality=self.social_media_virality, includes_media=self.includes_media)
+
+class ReportIndex:
+    """Incremental near-duplicate index over a stream of reports for one event.
+
+    A report joins an existing cluster when it shares location, source type and
+    similarity key with it and falls within window of the cluster's time span;
+    otherwise it starts a new cluster. A heap of (last_seen, cluster id) entries,
+    one pushed whenever a cluster's last_seen moves, lets expire() pop just the
+    clusters it removes plus the superseded entries.
+    """
+
+    def __init__(self, window: timedelta = timedelta(minutes=30), bin_width: float = COUNT_BIN_WIDTH):
+        self.window = window.total_seconds()
+        self.bin_width = bin_width
+        self.clusters: Dict[int, ReportCluster] = {}  # insertion ordered, keyed by cluster id
+        self.reports = 0  # reports in the current clusters
+        self._buckets: Dict[BucketKey, int] = {}
+        self._by_last_seen: List[Tuple[float, int]] = []
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    @property
+    def duplicates(self) -> int:
+        """Reports absorbed into one of the current clusters"""
+        return self.reports - len(self.clusters)
+
+    def add(self, report: "DisasterReport") -> ReportCluster:
+        """Index one report and return its cluster (weight 1 if the report is new)"""
+        self.reports += 1
+        timestamp = report.report_timestamp.timestamp()
+        bucket = int(timestamp // self.window)
+        prefix = (report.reporter_location, report.source_type)
+        similarity = similarity_key(report, self.bin_width)
+        key = (*prefix, bucket, *similarity)
+
+        for candidate in (bucket, bucket - 1, bucket + 1):
+            cluster_id = self._buckets.get(key if candidate == bucket else (*prefix, candidate, *similarity))
+            if cluster_id is None:
+                continue
+            cluster = self.clusters[cluster_id]
+            if cluster.first_seen - self.window <= timestamp <= cluster.last_seen + self.window:
+                last_seen = cluster.last_seen
+                cluster.add(report, timestamp)
+                if cluster.last_seen != last_seen:
+                    heapq.heappush(self._by_last_seen, (cluster.last_seen, cluster_id))
+                if key not in self._buckets:
+                    self._buckets[key] = cluster_id
+                    cluster.keys.append(key)
+                return cluster
+
+        cluster = ReportCluster(report, first_seen=timestamp, last_seen=timestamp,
+                                government_acknowledgment=report.government_acknowledgment,
+                                social_media_virality=report.social_media_virality,
+                                includes_media=report.includes_media, keys=[key])
+        self.clusters[self._next_id] = cluster
+        self._buckets[key] = self._next_id
+        heapq.heappush(self._by_last_seen, (timestamp, self._next_id))
+        self._next_id += 1
+        return cluster
+
+    def extend(self, reports: Iterable["DisasterReport"]):
+        for report in reports:
+            self.add(report)
+
+    def representatives(self) -> List["DisasterReport"]:
+        """One report per cluster, in order of each cluster's first report"""
+        return [cluster.representative() for cluster in self.clusters.values()]
+
+    def expire(self, before: datetime) -> List[ReportCluster]:
+        """Forget and return the clusters whose newest report is older than before"""
+        cutoff = before.timestamp()
+        expired = []
+        while self._by_last_seen and self._by_last_seen[0][0] < cutoff:
+            last_seen, cluster_id = heapq.heappop(self._by_last_seen)
+            cluster = self.clusters.get(cluster_id)
+            if cluster is None or cluster.last_seen != last_seen:
+                continue  # superseded by a later entry for the same cluster
+            del self.clusters[cluster_id]
+            self.reports -= cluster.weight
+            for key in cluster.keys:
+                if self._buckets.get(key) == cluster_id:
+                    del self._buckets[key]
+            expired.append(cluster)
+        return expired
+
+def collapse_reports(reports: Iterable["DisasterReport"], window: Optional[timedelta] = None) -> List["DisasterReport"]:
+    """Near-duplicate-free reports for process_disaster_reporting"""
+    reports = list(reports)
+    # Reports only cluster within a (location, source type) group; with no group repeated there is nothing to do
+    if len({(report.reporter_location, report.source_type) for report in reports}) == len(reports):
+        return reports
+    index = ReportIndex(window) if window is not None else ReportIndex()
+    index.extend(reports)
+    return index.representatives()
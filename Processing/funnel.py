@@ -0,0 +1,1046 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Decision Funnel Engine
+The funnel stages, their input dataclasses, the decision engine, streaming report
+ingestion and case generation - everything but the Tk UI in Main.py, so the batch
+runner and the tools built on it work on Python builds without Tk.
+"""
+
+import random
+import hashlib
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Dict, Optional, Tuple
+from enum import Enum
+import json
+
+from dedup import ReportIndex, collapse_reports
+
+# ===== DECISION FUNNEL STAGES =====
+class FunnelStage(Enum):
+    DISASTER_OCCURS = "1. Disaster Occurs"
+    DISASTER_REPORTED = "2. Disaster Reported" 
+    VERIFICATION = "3. Verification Process"
+    DATA_GATHERING = "4. Multi-Source Data Gathering"
+    SITUATION_ASSESSMENT = "5. Real Situation Assessment"
+    NEEDS_VS_WANTS = "6. Process Needs vs Wants"
+    LOCAL_SUPPORT_ASSESSMENT = "7. Process Local Support"
+    DIRECTOR_APPROVAL = "8. Director Approval Required"
+    MOBILIZE_CARE = "9. Mobilize Care"
+    IMPACT_REPORTING = "10. Report Reduction/Impact"
+
+# ===== LAZY FIELDS =====
+class LazyFields:
+    """Mixin for generated inputs whose unscored fields are drawn on first access.
+
+    A lazy instance holds only the fields the engine scores. The rest come from a
+    details function the first time any of them is read, all at once and from a
+    Random seeded when the instance was generated - so their values do not depend
+    on when, in what order, or whether they are read.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def lazy(cls, details: Callable[..., Dict[str, Any]], seed: int, context: tuple, **fields):
+        """Instance with the given fields; details(Random(seed), *context) supplies the rest"""
+        instance = cls.__new__(cls)
+        instance.__dict__.update(fields)
+        instance.__dict__["_details"] = (details, seed, context)
+        return instance
+
+    @property
+    def materialized(self) -> bool:
+        return "_details" not in self.__dict__
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes missing from the instance, i.e. undrawn fields
+        pending = self.__dict__.get("_details")
+        if pending is None or name not in self.__dataclass_fields__:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        details, seed, context = pending
+        self.__dict__.update(details(random.Random(seed), *context))
+        del self.__dict__["_details"]
+        return self.__dict__[name]
+
+# ===== ALL VARIABLES THAT AFFECT DECISIONS =====
+
+@dataclass
+class DisasterEvent:
+    """The actual disaster occurrence with all measurable variables"""
+    event_id: str
+    disaster_type: str
+    location: dict  # {country, province, district, coordinates}
+    magnitude: float  # 1-10 scale
+    affected_population: int
+    infrastructure_damage: float  # 0-1 scale
+    casualty_estimate: int
+    economic_impact_usd: float
+    environmental_impact: float  # 0-1 scale
+    accessibility: float  # 0-1 scale (how easy to reach)
+    security_level: str  # "Safe", "Moderate Risk", "High Risk", "Extremely Dangerous"
+    weather_conditions: dict
+    time_of_occurrence: datetime
+    duration_estimate_hours: int
+
+@dataclass 
+class DisasterReport(LazyFields):
+    """A report about the disaster from various sources"""
+    report_id: str
+    source_type: str
+    source_reliability: float  # 0-1
+    reporter_location: str
+    report_timestamp: datetime
+    reported_casualties: int
+    reported_affected: int
+    reported_severity: str
+    includes_media: bool
+    language: str
+    translation_confidence: float
+    contains_coordinates: bool
+    social_media_virality: int  # 0-100
+    government_acknowledgment: bool
+
+@dataclass
+class VerificationData:
+    """All data used in verification process"""
+    satellite_imagery_available: bool
+    satellite_damage_assessment: float  # 0-1
+    multiple_source_correlation: float  # 0-1
+    government_confirmation: bool
+    international_media_coverage: bool
+    social_media_verification_score: float
+    expert_analysis_available: bool
+    historical_disaster_pattern_match: float
+    verification_confidence: float  # Final score 0-1
+
+@dataclass
+class MultiSourceData(LazyFields):
+    """Data gathered from multiple sources"""
+    un_ocha_report: Optional[dict]
+    government_official_statement: Optional[dict]
+    ngo_field_reports: List[dict]
+    media_reports: List[dict]
+    satellite_analysis: Optional[dict]
+    social_media_sentiment: dict
+    academic_expert_assessment: Optional[dict]
+    local_authority_reports: List[dict]
+    humanitarian_partner_intel: List[dict]
+
+@dataclass
+class SituationAssessment(LazyFields):
+    """Real situation assessment after data analysis"""
+    confirmed_casualties: int
+    confirmed_affected_population: int
+    infrastructure_damage_verified: float
+    immediate_life_threat_level: str  # "None", "Low", "Medium", "High", "Critical"
+    displacement_numbers: int
+    access_routes_status: dict
+    security_assessment: str
+    weather_forecast_impact: str
+    disease_outbreak_risk: float
+    food_security_impact: float
+    water_access_impact: float
+    shelter_needs_assessment: int
+    medical_needs_assessment: dict
+
+@dataclass
+class NeedsVsWantsAnalysis(LazyFields):
+    """Analysis separating critical needs from wants"""
+    life_saving_needs: List[str]
+    critical_medical_needs: List[str] 
+    basic_survival_needs: List[str]
+    protection_needs: List[str]
+    nice_to_have_items: List[str]
+    luxury_items: List[str]
+    needs_priority_ranking: List[Tuple[str, int]]  # (need, priority_score)
+    resource_scarcity_factors: dict
+    cost_benefit_analysis: dict
+
+@dataclass
+class LocalSupportAssessment(LazyFields):
+    """Assessment of local capacity and support"""
+    government_response_capacity: float  # 0-1
+    local_ngo_capacity: float
+    community_self_help_capacity: float
+    private_sector_involvement: float
+    religious_organization_support: float
+    diaspora_community_support: float
+    existing_infrastructure_usability: float
+    local_medical_capacity: float
+    local_food_supply_capacity: float
+    cultural_acceptance_factors: dict
+    language_barriers: List[str]
+    political_stability_factor: float
+
+@dataclass
+class DirectorApprovalFactors(LazyFields):
+    """All factors directors consider for approval"""
+    total_estimated_cost: float
+    funding_source_availability: dict
+    organizational_mandate_alignment: float
+    political_sensitivity_score: float
+    media_attention_level: int
+    donor_interest_likelihood: float
+    operational_complexity: float
+    security_risk_to_staff: float
+    reputation_risk_assessment: float
+    competitor_organization_involvement: dict
+    success_probability: float
+    timeline_to_implementation: int
+    staff_availability: dict
+    equipment_availability: dict
+
+@dataclass
+class MobilizationPlan:
+    """Actual care mobilization details"""
+    approved_interventions: List[str]
+    resource_allocation: dict
+    personnel_deployment: dict
+    timeline_milestones: List[Tuple[str, datetime]]
+    budget_breakdown: dict
+    logistics_plan: dict
+    monitoring_framework: dict
+    exit_strategy: dict
+    coordination_structure: dict
+
+@dataclass
+class ImpactMeasurement:
+    """Measuring reduction/impact of intervention"""
+    lives_saved: int
+    people_assisted: int
+    reduction_in_suffering_score: float
+    infrastructure_restored: dict
+    economic_impact_prevented: float
+    long_term_resilience_built: float
+    community_satisfaction_score: float
+    cost_per_beneficiary: float
+    intervention_efficiency_score: float
+
+# ===== STAGE TIMING =====
+# The engine method that processes each stage
+STAGE_METHODS = {
+    FunnelStage.DISASTER_OCCURS: "process_disaster_occurrence",
+    FunnelStage.DISASTER_REPORTED: "process_disaster_reporting",
+    FunnelStage.VERIFICATION: "process_verification",
+    FunnelStage.DATA_GATHERING: "process_data_gathering",
+    FunnelStage.SITUATION_ASSESSMENT: "process_situation_assessment",
+    FunnelStage.NEEDS_VS_WANTS: "process_needs_vs_wants",
+    FunnelStage.LOCAL_SUPPORT_ASSESSMENT: "process_local_support",
+    FunnelStage.DIRECTOR_APPROVAL: "process_director_approval"
+}
+
+# Upper bucket bounds in microseconds; anything slower lands in the overflow bucket
+LATENCY_BUCKETS_US = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 50000)
+# 48 log-spaced bounds per decade from 1us to 100s, so a percentile read off a bucket
+# bound is within 5% of the true value
+FINE_LATENCY_BUCKETS_US = tuple(float(f"{10 ** (i / 48):.3g}") for i in range(8 * 48 + 1))
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram - constant memory, mergeable across workers"""
+    __slots__ = ("bounds_us", "_bounds_ns", "counts", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self, bounds_us: Tuple[float, ...] = LATENCY_BUCKETS_US):
+        self.bounds_us = bounds_us
+        self._bounds_ns = tuple(bound * 1000 for bound in bounds_us)
+        self.counts = [0] * (len(bounds_us) + 1)
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def record(self, duration_ns: int):
+        self.counts[bisect_left(self._bounds_ns, duration_ns)] += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def merge(self, other: "LatencyHistogram"):
+        if other.bounds_us != self.bounds_us:
+            raise ValueError("Cannot merge histograms with different buckets")
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.total_ns += other.total_ns
+        if other.min_ns is not None and (self.min_ns is None or other.min_ns < self.min_ns):
+            self.min_ns = other.min_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def percentile_us(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of calls, capped at the slowest call"""
+        target, seen = fraction * self.count, 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= target:
+                bound = self.bounds_us[bucket] if bucket < len(self.bounds_us) else float("inf")
+                return min(float(bound), self.max_ns / 1000)
+        return 0.0
+
+    def snapshot(self) -> Dict:
+        """Summary statistics and the counts of the non-empty buckets"""
+        count = self.count
+        labels = [f"<={bound:g}us" for bound in self.bounds_us] + [f">{self.bounds_us[-1]:g}us"]
+        return {
+            "calls": count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / count / 1000 if count else 0.0,
+            "min_us": self.min_ns / 1000 if self.min_ns is not None else 0.0,
+            "max_us": self.max_ns / 1000,
+            "p50_us": self.percentile_us(0.5),
+            "p99_us": self.percentile_us(0.99),
+            "buckets": {label: n for label, n in zip(labels, self.counts) if n}
+        }
+
+class StageTimings:
+    """Per-stage call counts and latency histograms, keyed by FunnelStage"""
+
+    def __init__(self):
+        self.histograms: Dict[FunnelStage, LatencyHistogram] = {stage: LatencyHistogram() for stage in STAGE_METHODS}
+
+    def record(self, stage: FunnelStage, duration_ns: int):
+        self.histograms[stage].record(duration_ns)
+
+    def merge(self, other: "StageTimings"):
+        for stage, histogram in other.histograms.items():
+            self.histograms[stage].merge(histogram)
+
+    def reset(self):
+        self.histograms = {stage: LatencyHistogram() for stage in STAGE_METHODS}
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """JSON-ready per-stage statistics for stages that were called"""
+        return {stage.value: histogram.snapshot() for stage, histogram in self.histograms.items() if histogram.count}
+
+    def export(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+def _timed_stage(method, stage: FunnelStage, timings: StageTimings):
+    def timed(stage_input):
+        started = time.perf_counter_ns()
+        try:
+            return method(stage_input)
+        finally:
+            timings.record(stage, time.perf_counter_ns() - started)
+    return timed
+
+# Score cut-offs of each scored stage, in the order the stage checks them
+STAGE_THRESHOLDS = {
+    FunnelStage.VERIFICATION: (0.8, 0.6, 0.4),  # verified / medium confidence / disputed
+    FunnelStage.DATA_GATHERING: (0.7,),  # sufficient data
+    FunnelStage.SITUATION_ASSESSMENT: (80, 60, 40),  # critical / serious / moderate
+    FunnelStage.LOCAL_SUPPORT_ASSESSMENT: (0.3, 0.6),  # capacity insufficient / limited (lower is weaker)
+    FunnelStage.DIRECTOR_APPROVAL: (75, 60, 40)  # full / limited / conditional approval
+}
+
+# What a scored stage reports for each band its cut-offs split scores into, in the same
+# order, ending with the band past the last cut-off; {score} is the stage's score
+STAGE_MESSAGES = {
+    FunnelStage.VERIFICATION: (
+        "High confidence verification - proceed to data gathering",
+        "Medium confidence - requesting additional verification sources",
+        "Low confidence - disputed reports, investigating further",
+        "Verification failed - likely false alarm"),
+    FunnelStage.DATA_GATHERING: (
+        "Sufficient data gathered ({score:.1%} complete)",
+        "Insufficient data ({score:.1%} complete) - continuing data collection"),
+    FunnelStage.SITUATION_ASSESSMENT: (
+        "Critical situation confirmed (severity: {score}/100)",
+        "Serious situation requiring response (severity: {score}/100)",
+        "Moderate situation - monitoring but no immediate response (severity: {score}/100)",
+        "Low severity - no humanitarian response needed (severity: {score}/100)"),
+    FunnelStage.LOCAL_SUPPORT_ASSESSMENT: (
+        "Local capacity insufficient ({score:.1%}) - external intervention required",
+        "Local capacity limited ({score:.1%}) - supporting intervention recommended",
+        "Local capacity adequate ({score:.1%}) - no external intervention needed"),
+    FunnelStage.DIRECTOR_APPROVAL: (
+        "Approved for full intervention (score: {score}/100)",
+        "Approved for limited intervention (score: {score}/100)",
+        "Conditional approval - pending additional information (score: {score}/100)",
+        "Approval denied (score: {score}/100)")
+}
+
+@dataclass
+class StageResult:
+    """What a stage decided from: its score (None for unscored stages) and the factors behind it"""
+    stage: FunnelStage
+    score: Optional[float]
+    factors: Dict[str, float]
+
+class ReliefGridDecisionEngine:
+    def __init__(self, rng: Optional[random.Random] = None,
+                 thresholds: Optional[Dict[FunnelStage, Tuple[float, ...]]] = None):
+        # Explicit RNG stream so sharded runs can reproduce any case from its seed
+        self.rng = rng if rng is not None else random.Random()
+        # Cut-offs default to STAGE_THRESHOLDS; calibrated ones can replace any stage's
+        self.thresholds = {**STAGE_THRESHOLDS, **(thresholds or {})}
+        self.current_funnel_stage = FunnelStage.DISASTER_OCCURS
+        self.decision_variables = {}
+        self.funnel_data = {}
+        # Latest result of each stage that has run - displays and exports read from here
+        self.stage_results: Dict[FunnelStage, StageResult] = {}
+        self.timings: Optional[StageTimings] = None
+
+    def _record(self, stage: FunnelStage, score: Optional[float], factors: Dict[str, float]) -> Optional[float]:
+        self.stage_results[stage] = StageResult(stage, score, factors)
+        return score
+
+    def stage_score(self, stage: FunnelStage) -> Optional[float]:
+        """Score the stage was decided on, or None if it has not run or has no score"""
+        result = self.stage_results.get(stage)
+        return result.score if result is not None else None
+
+    def enable_timing(self, timings: Optional[StageTimings] = None) -> StageTimings:
+        """Record per-stage durations into timings (shared if given, new otherwise).
+
+        The stage methods are shadowed by timed wrappers on this instance, so a
+        disabled engine runs the plain methods with no extra work at all.
+        """
+        self.disable_timing()
+        self.timings = timings if timings is not None else StageTimings()
+        for stage, name in STAGE_METHODS.items():
+            setattr(self, name, _timed_stage(getattr(self, name), stage, self.timings))
+        return self.timings
+
+    def disable_timing(self):
+        for name in STAGE_METHODS.values():
+            self.__dict__.pop(name, None)
+        self.timings = None
+
+    def process_disaster_occurrence(self, disaster: DisasterEvent) -> bool:
+        """Stage 1: Disaster Occurs - Natural phenomenon happens"""
+        self.funnel_data['disaster_event'] = disaster
+        
+        # Some disasters may not be immediately detectable
+        factors = self._detection_factors(disaster)
+        detection_probability = self._record(FunnelStage.DISASTER_OCCURS,
+                                             sum(factors.values()) / len(factors), factors)
+        
+        if self.rng.random() < detection_probability:
+            self.current_funnel_stage = FunnelStage.DISASTER_REPORTED
+            return True
+        return False  # Disaster occurred but not detected yet
+    
+    def _calculate_detection_probability(self, disaster: DisasterEvent) -> float:
+        """Calculate probability of disaster being detected/reported"""
+        factors = self._detection_factors(disaster)
+        return sum(factors.values()) / len(factors)
+
+    def _detection_factors(self, disaster: DisasterEvent) -> Dict[str, float]:
+        return {
+            'magnitude': disaster.magnitude / 10,
+            'population_density': min(disaster.affected_population / 10000, 1),
+            'accessibility': disaster.accessibility,
+            'infrastructure': 1 - disaster.infrastructure_damage,
+            'media_presence': self.rng.uniform(0.3, 0.9)
+        }
+    
+    def process_disaster_reporting(self, reports: List[DisasterReport]) -> Tuple[bool, str]:
+        """Stage 2: Disaster gets reported through various channels"""
+        # Echoes and reposts of one observation count once
+        received = len(reports)
+        reports = collapse_reports(reports)
+        self.funnel_data['reports'] = reports
+
+        # Multiple decision paths possible here
+        if not reports:
+            self._record(FunnelStage.DISASTER_REPORTED, None, {**ReportCounts().factors(), 'duplicates_collapsed': 0})
+            return False, "No reports received"
+
+        # One pass over the reports for all three signals
+        counts = ReportCounts()
+        for report in reports:
+            counts.add(report)
+        self._record(FunnelStage.DISASTER_REPORTED, None,
+                     {**counts.factors(), 'duplicates_collapsed': received - len(reports)})
+
+        trigger = counts.verification_trigger()
+        if trigger:
+            self.current_funnel_stage = FunnelStage.VERIFICATION
+            return True, trigger
+        return False, "Insufficient credible reports to trigger verification"
+    
+    def process_verification(self, verification_data: VerificationData) -> Tuple[bool, str, float]:
+        """Stage 3: Verification Process - Multiple paths possible"""
+        self.funnel_data['verification'] = verification_data
+        
+        # Complex verification algorithm
+        factors = self._verification_factors(verification_data)
+        verification_score = self._record(FunnelStage.VERIFICATION, sum(factors.values()), factors)
+        verified, medium, disputed = self.thresholds[FunnelStage.VERIFICATION]
+        messages = STAGE_MESSAGES[FunnelStage.VERIFICATION]
+        
+        if verification_score > verified:
+            self.current_funnel_stage = FunnelStage.DATA_GATHERING
+            return True, messages[0], verification_score
+        elif verification_score > medium:
+            # Need additional verification
+            return False, messages[1], verification_score
+        elif verification_score > disputed:
+            # Disputed/uncertain
+            return False, messages[2], verification_score
+        else:
+            return False, messages[3], verification_score
+    
+    def _calculate_verification_score(self, vd: VerificationData) -> float:
+        """Complex verification scoring algorithm"""
+        return sum(self._verification_factors(vd).values())
+
+    def _verification_factors(self, vd: VerificationData) -> Dict[str, float]:
+        return {
+            'satellite_imagery': 0.25 if vd.satellite_imagery_available else 0,
+            'satellite_damage': vd.satellite_damage_assessment * 0.2,
+            'source_correlation': vd.multiple_source_correlation * 0.2,
+            'government_confirm': 0.15 if vd.government_confirmation else 0,
+            'media_coverage': 0.1 if vd.international_media_coverage else 0,
+            'social_verification': vd.social_media_verification_score * 0.05,
+            'expert_analysis': 0.1 if vd.expert_analysis_available else 0,
+            'pattern_match': vd.historical_disaster_pattern_match * 0.05
+        }
+    
+    def process_data_gathering(self, multi_source: MultiSourceData) -> Tuple[bool, str]:
+        """Stage 4: Gather data from multiple sources"""
+        self.funnel_data['multi_source_data'] = multi_source
+        
+        # Check data completeness
+        factors = self._data_source_factors(multi_source)
+        data_completeness = self._record(FunnelStage.DATA_GATHERING,
+                                         sum(factors.values()) / len(factors), factors)
+        (sufficient,) = self.thresholds[FunnelStage.DATA_GATHERING]
+        messages = STAGE_MESSAGES[FunnelStage.DATA_GATHERING]
+        
+        if data_completeness > sufficient:
+            self.current_funnel_stage = FunnelStage.SITUATION_ASSESSMENT
+            return True, messages[0].format(score=data_completeness)
+        else:
+            return False, messages[1].format(score=data_completeness)
+    
+    def _assess_data_completeness(self, msd: MultiSourceData) -> float:
+        """Assess how complete the multi-source data is"""
+        sources = self._data_source_factors(msd)
+        return sum(sources.values()) / len(sources)
+
+    def _data_source_factors(self, msd: MultiSourceData) -> Dict[str, float]:
+        """1.0 for each source that is present, 0.0 otherwise"""
+        return {
+            'un_ocha_report': float(msd.un_ocha_report is not None),
+            'government_statement': float(msd.government_official_statement is not None),
+            'ngo_field_reports': float(len(msd.ngo_field_reports) > 0),
+            'media_reports': float(len(msd.media_reports) > 2),
+            'satellite_analysis': float(msd.satellite_analysis is not None),
+            'local_authority_reports': float(len(msd.local_authority_reports) > 0),
+            'partner_intel': float(len(msd.humanitarian_partner_intel) > 0)
+        }
+    
+    def process_situation_assessment(self, assessment: SituationAssessment) -> Tuple[bool, str]:
+        """Stage 5: Assess the real situation"""
+        self.funnel_data['situation_assessment'] = assessment
+        
+        # Determine if situation warrants humanitarian response
+        factors = self._severity_factors(assessment)
+        severity_score = self._record(FunnelStage.SITUATION_ASSESSMENT, sum(factors.values()), factors)
+        critical, serious, moderate = self.thresholds[FunnelStage.SITUATION_ASSESSMENT]
+        messages = STAGE_MESSAGES[FunnelStage.SITUATION_ASSESSMENT]
+        
+        if severity_score > critical:
+            self.current_funnel_stage = FunnelStage.NEEDS_VS_WANTS
+            return True, messages[0].format(score=severity_score)
+        elif severity_score > serious:
+            self.current_funnel_stage = FunnelStage.NEEDS_VS_WANTS  
+            return True, messages[1].format(score=severity_score)
+        elif severity_score > moderate:
+            return False, messages[2].format(score=severity_score)
+        else:
+            return False, messages[3].format(score=severity_score)
+    
+    def _calculate_severity_score(self, sa: SituationAssessment) -> float:
+        """Calculate overall severity score"""
+        return sum(self._severity_factors(sa).values())
+
+    def _severity_factors(self, sa: SituationAssessment) -> Dict[str, float]:
+        return {
+            'life_threat': {'None': 0, 'Low': 20, 'Medium': 40, 'High': 70, 'Critical': 100}[sa.immediate_life_threat_level],
+            'casualties': min(sa.confirmed_casualties / 100, 1) * 30,
+            'displacement': min(sa.displacement_numbers / 10000, 1) * 20,
+            'infrastructure': sa.infrastructure_damage_verified * 15,
+            'disease_risk': sa.disease_outbreak_risk * 10,
+            'access_difficulty': (1 - sa.water_access_impact) * 5
+        }
+    
+    def process_needs_vs_wants(self, analysis: NeedsVsWantsAnalysis) -> Tuple[bool, str]:
+        """Stage 6: Process needs vs wants"""
+        self.funnel_data['needs_analysis'] = analysis
+        
+        # Calculate intervention scope
+        critical_needs_count = len(analysis.life_saving_needs) + len(analysis.critical_medical_needs)
+        total_needs = len(analysis.life_saving_needs) + len(analysis.critical_medical_needs) + len(analysis.basic_survival_needs)
+        self._record(FunnelStage.NEEDS_VS_WANTS, None,
+                     {'critical_needs': critical_needs_count, 'total_needs': total_needs})
+        
+        if critical_needs_count > 5:
+            self.current_funnel_stage = FunnelStage.LOCAL_SUPPORT_ASSESSMENT
+            return True, f"Major intervention required - {critical_needs_count} critical needs identified"
+        elif total_needs > 3:
+            self.current_funnel_stage = FunnelStage.LOCAL_SUPPORT_ASSESSMENT
+            return True, f"Moderate intervention required - {total_needs} total needs"
+        else:
+            return False, "Minimal needs identified - local capacity may be sufficient"
+    
+    def process_local_support(self, local_assessment: LocalSupportAssessment) -> Tuple[bool, str]:
+        """Stage 7: Assess local support capacity"""
+        self.funnel_data['local_support'] = local_assessment
+        
+        factors = self._local_capacity_factors(local_assessment)
+        local_capacity_score = self._record(FunnelStage.LOCAL_SUPPORT_ASSESSMENT,
+                                            sum(factors.values()) / len(factors), factors)
+        insufficient, limited = self.thresholds[FunnelStage.LOCAL_SUPPORT_ASSESSMENT]
+        messages = STAGE_MESSAGES[FunnelStage.LOCAL_SUPPORT_ASSESSMENT]
+        
+        if local_capacity_score < insufficient:
+            self.current_funnel_stage = FunnelStage.DIRECTOR_APPROVAL
+            return True, messages[0].format(score=local_capacity_score)
+        elif local_capacity_score < limited:
+            self.current_funnel_stage = FunnelStage.DIRECTOR_APPROVAL  
+            return True, messages[1].format(score=local_capacity_score)
+        else:
+            return False, messages[2].format(score=local_capacity_score)
+    
+    def _calculate_local_capacity(self, lsa: LocalSupportAssessment) -> float:
+        """Calculate overall local capacity score"""
+        capacities = self._local_capacity_factors(lsa)
+        return sum(capacities.values()) / len(capacities)
+
+    def _local_capacity_factors(self, lsa: LocalSupportAssessment) -> Dict[str, float]:
+        return {
+            'government': lsa.government_response_capacity,
+            'local_ngo': lsa.local_ngo_capacity,
+            'community_self_help': lsa.community_self_help_capacity,
+            'private_sector': lsa.private_sector_involvement,
+            'medical': lsa.local_medical_capacity,
+            'food_supply': lsa.local_food_supply_capacity
+        }
+    
+    def process_director_approval(self, approval_factors: DirectorApprovalFactors) -> Tuple[bool, str]:
+        """Stage 8: Director approval process"""
+        self.funnel_data['approval_factors'] = approval_factors
+        
+        factors = self._approval_factors(approval_factors)
+        approval_score = self._record(FunnelStage.DIRECTOR_APPROVAL, sum(factors.values()), factors)
+        full, limited, conditional = self.thresholds[FunnelStage.DIRECTOR_APPROVAL]
+        messages = STAGE_MESSAGES[FunnelStage.DIRECTOR_APPROVAL]
+        
+        if approval_score > full:
+            self.current_funnel_stage = FunnelStage.MOBILIZE_CARE
+            return True, messages[0].format(score=approval_score)
+        elif approval_score > limited:
+            self.current_funnel_stage = FunnelStage.MOBILIZE_CARE
+            return True, messages[1].format(score=approval_score)
+        elif approval_score > conditional:
+            return False, messages[2].format(score=approval_score)
+        else:
+            return False, messages[3].format(score=approval_score)
+    
+    def _calculate_approval_score(self, af: DirectorApprovalFactors) -> float:
+        """Calculate director approval score"""
+        return sum(self._approval_factors(af).values())
+
+    def _approval_factors(self, af: DirectorApprovalFactors) -> Dict[str, float]:
+        # This is where organizational politics and constraints come in
+        return {
+            'mandate_alignment': af.organizational_mandate_alignment * 20,
+            'success_probability': af.success_probability * 15,
+            'funding_available': min(sum(af.funding_source_availability.values()) / af.total_estimated_cost, 1) * 15,
+            'security_risk': (1 - af.security_risk_to_staff) * 15,
+            'reputation_risk': (1 - af.reputation_risk_assessment) * 10,
+            'donor_interest': af.donor_interest_likelihood * 10,
+            'media_attention': min(af.media_attention_level / 50, 1) * 5,
+            'operational_complexity': (1 - af.operational_complexity) * 5,
+            'political_sensitivity': (1 - af.political_sensitivity_score) * 5
+        }
+
+    def process_stage(self, stage: FunnelStage, stage_input) -> Tuple[bool, str]:
+        """Run the process_* method for the given stage on its generated input"""
+        handlers = {
+            FunnelStage.DISASTER_REPORTED: self.process_disaster_reporting,
+            FunnelStage.VERIFICATION: self.process_verification,
+            FunnelStage.DATA_GATHERING: self.process_data_gathering,
+            FunnelStage.SITUATION_ASSESSMENT: self.process_situation_assessment,
+            FunnelStage.NEEDS_VS_WANTS: self.process_needs_vs_wants,
+            FunnelStage.LOCAL_SUPPORT_ASSESSMENT: self.process_local_support,
+            FunnelStage.DIRECTOR_APPROVAL: self.process_director_approval
+        }
+        if stage not in handlers:
+            raise ValueError(f"Stage has no processing step: {stage.value}")
+        result = handlers[stage](stage_input)
+        return result[0], result[1]
+
+# ===== STREAMING REPORT INGESTION =====
+HIGH_RELIABILITY_THRESHOLD = 0.7
+VIRALITY_THRESHOLD = 50
+VIRAL_REPORTS_REQUIRED = 3  # more than this many viral reports trigger verification
+REPORT_VOLUME_REQUIRED = 5  # more than this many reports of any kind trigger verification
+
+class ReportCounts:
+    """Running counts of the report signals that decide the verification trigger"""
+    __slots__ = ("total", "high_reliability", "viral", "government")
+
+    def __init__(self):
+        self.total = 0
+        self.high_reliability = 0
+        self.viral = 0
+        self.government = 0
+
+    def add(self, report: DisasterReport, weight: int = 1):
+        self.total += weight
+        if report.source_reliability > HIGH_RELIABILITY_THRESHOLD:
+            self.high_reliability += weight
+        if report.social_media_virality > VIRALITY_THRESHOLD:
+            self.viral += weight
+        if report.government_acknowledgment:
+            self.government += weight
+
+    def remove(self, report: DisasterReport):
+        self.add(report, -1)
+
+    def factors(self) -> Dict[str, float]:
+        return {'total_reports': self.total, 'high_reliability': self.high_reliability,
+                'viral': self.viral, 'government_acknowledged': self.government}
+
+    def verification_trigger(self) -> Optional[str]:
+        """The reason these reports trigger verification, or None if they don't"""
+        if self.high_reliability or self.viral > VIRAL_REPORTS_REQUIRED or self.government:
+            return "Reports trigger verification process"
+        if self.total > REPORT_VOLUME_REQUIRED:
+            return "Volume of reports triggers verification"
+        return None
+
+class ReportStream:
+    """Incremental report ingestion over a sliding window of report_timestamp.
+
+    Reports can arrive one at a time or from any iterable, in any order. As in
+    process_disaster_reporting, echoes and reposts of one observation count once:
+    reports go through a ReportIndex and the counters hold one representative per
+    cluster, swapped whenever a new member changes it. The window ends at the newest
+    timestamp seen; clusters whose newest report falls out of it expire from the
+    counters as it advances, and reports already outside it on arrival are counted
+    as late and dropped. The engine moves to VERIFICATION as soon as the clusters in
+    the window meet the same trigger as process_disaster_reporting.
+    """
+
+    def __init__(self, engine: ReliefGridDecisionEngine, window: timedelta = timedelta(hours=24)):
+        self.engine = engine
+        self.window = window
+        self.counts = ReportCounts()
+        self.index = ReportIndex()
+        self.watermark: Optional[datetime] = None  # newest report_timestamp seen
+        self.ingested = 0
+        self.late_reports = 0
+        self.trigger_message: Optional[str] = None
+        self._counted: Dict[int, DisasterReport] = {}  # id(cluster) -> its representative in counts
+
+    @property
+    def triggered(self) -> bool:
+        return self.trigger_message is not None
+
+    def __len__(self) -> int:
+        """Clusters inside the window"""
+        return len(self.index)
+
+    def ingest(self, report: DisasterReport) -> bool:
+        """Add one report; returns True once verification has been triggered"""
+        self.ingested += 1
+        timestamp = report.report_timestamp
+        if self.watermark is None or timestamp > self.watermark:
+            self.watermark = timestamp
+            self._expire()
+        elif timestamp < self.watermark - self.window:
+            self.late_reports += 1
+            return self.triggered
+
+        cluster = self.index.add(report)
+        previous = self._counted.get(id(cluster))
+        if previous is not None:
+            self.counts.remove(previous)
+        representative = cluster.representative()
+        self._counted[id(cluster)] = representative
+        self.counts.add(representative)
+
+        if not self.triggered:
+            self.trigger_message = self.counts.verification_trigger()
+            if self.trigger_message:
+                self.engine.funnel_data['reports'] = self.reports()
+                self.engine._record(FunnelStage.DISASTER_REPORTED, None,
+                                    {**self.counts.factors(), 'duplicates_collapsed': self.index.duplicates})
+                self.engine.current_funnel_stage = FunnelStage.VERIFICATION
+        return self.triggered
+
+    def ingest_many(self, reports: Iterable[DisasterReport]) -> bool:
+        """Ingest from a chunk or generator, stopping at the report that triggers verification"""
+        for report in reports:
+            if self.ingest(report):
+                return True
+        return self.triggered
+
+    def reports(self) -> List[DisasterReport]:
+        """One representative per cluster inside the window, oldest cluster first"""
+        clusters = sorted(self.index.clusters.values(), key=lambda cluster: cluster.first_seen)
+        return [self._counted[id(cluster)] for cluster in clusters]
+
+    def _expire(self):
+        for cluster in self.index.expire(self.watermark - self.window):
+            self.counts.remove(self._counted.pop(id(cluster)))
+
+# ===== CASE GENERATION =====
+def case_seed(base_seed: int, case_index: int) -> int:
+    """Derive an independent 64-bit seed for one case of a seeded run"""
+    digest = hashlib.blake2b(f"{base_seed}:{case_index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+def case_rng(base_seed: int, case_index: int) -> random.Random:
+    """RNG stream for one case - identical no matter which worker or shard runs it"""
+    return random.Random(case_seed(base_seed, case_index))
+
+# Fields no scorer reads, drawn by LazyFields only when something (the UI, dedup) reads them
+def _report_details(rng: random.Random, index: int, casualties: int, affected: int) -> Dict[str, Any]:
+    return {
+        "report_id": f"RPT_{index:03d}",
+        "reported_casualties": casualties + rng.randint(-100, 200),
+        "reported_affected": affected + rng.randint(-1000, 5000),
+        "reported_severity": rng.choice(["Minor", "Moderate", "Severe", "Catastrophic"]),
+        "includes_media": rng.choice([True, False]),
+        "language": rng.choice(["English", "Local Language"]),
+        "translation_confidence": rng.uniform(0.7, 1.0),
+        "contains_coordinates": rng.choice([True, False])
+    }
+
+def _multi_source_details(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "social_media_sentiment": {"positive": 0.2, "negative": 0.6, "neutral": 0.2},
+        "academic_expert_assessment": {"confidence": rng.uniform(0.7, 0.95)} if rng.choice([True, False]) else None
+    }
+
+def _situation_details(rng: random.Random, affected: int, security_level: str) -> Dict[str, Any]:
+    return {
+        "confirmed_affected_population": affected + rng.randint(-500, 2000),
+        "access_routes_status": {"main_road": "blocked", "secondary": "limited", "air": "available"},
+        "security_assessment": security_level,
+        "weather_forecast_impact": "deteriorating conditions expected",
+        "food_security_impact": rng.uniform(0.2, 0.9),
+        "shelter_needs_assessment": rng.randint(500, 10000),
+        "medical_needs_assessment": {"critical": rng.randint(10, 200), "serious": rng.randint(50, 500)}
+    }
+
+def _needs_details(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "protection_needs": ["Child Protection", "Women's Safety", "Elderly Care"],
+        "nice_to_have_items": ["Educational Materials", "Recreation Supplies"],
+        "luxury_items": ["Non-essential electronics", "Comfort items"],
+        "needs_priority_ranking": [("Medical Care", 100), ("Water", 95), ("Food", 90), ("Shelter", 85)],
+        "resource_scarcity_factors": {"medical": 0.8, "water": 0.6, "food": 0.4},
+        "cost_benefit_analysis": {"intervention_cost": rng.uniform(100000, 5000000), "lives_saved_estimate": rng.randint(10, 1000)}
+    }
+
+def _local_support_details(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "religious_organization_support": rng.uniform(0.4, 0.8),
+        "diaspora_community_support": rng.uniform(0.2, 0.7),
+        "existing_infrastructure_usability": rng.uniform(0.1, 0.6),
+        "cultural_acceptance_factors": {"aid_acceptance": 0.8, "female_workers": 0.6, "foreign_presence": 0.5},
+        "language_barriers": ["Local dialect", "Literacy rates"],
+        "political_stability_factor": rng.uniform(0.3, 0.9)
+    }
+
+def _approval_details(rng: random.Random) -> Dict[str, Any]:
+    return {
+        "competitor_organization_involvement": {"MSF": True, "Oxfam": False, "Red_Cross": True},
+        "timeline_to_implementation": rng.randint(24, 168),  # hours
+        "staff_availability": {"field_workers": rng.randint(5, 50), "specialists": rng.randint(2, 15)},
+        "equipment_availability": {"vehicles": rng.randint(2, 20), "medical": rng.randint(1, 10)}
+    }
+
+class CaseGenerator:
+    """Generates synthetic inputs for every funnel stage without any UI.
+
+    Inputs are produced only when a case reaches their stage. With lazy (the
+    default), fields the engine never scores are left undrawn until first read;
+    lazy=False draws everything up front, from a different stream.
+    """
+
+    DISASTER_TYPES = ["Earthquake", "Flood", "Cyclone", "Disease Outbreak", "Conflict Displacement", "Drought"]
+    LOCATIONS = [
+        {"country": "Democratic Republic of Congo", "province": "North Kivu", "district": "Goma", "coordinates": (-1.67, 29.23)},
+        {"country": "Bangladesh", "province": "Chittagong", "district": "Cox's Bazar", "coordinates": (21.45, 92.0)},
+        {"country": "Yemen", "province": "Hodeidah", "district": "Al Hudaydah", "coordinates": (14.8, 42.95)},
+        {"country": "Philippines", "province": "Leyte", "district": "Tacloban", "coordinates": (11.25, 125.0)}
+    ]
+
+    def __init__(self, rng: Optional[random.Random] = None, reference_time: Optional[datetime] = None,
+                 lazy: bool = True):
+        self.rng = rng if rng is not None else random.Random()
+        self.lazy = lazy
+        # Fixed clock for reproducible runs; None means timestamps use datetime.now()
+        self.reference_time = reference_time
+        self.current_case: Optional[DisasterEvent] = None
+
+    def _now(self) -> datetime:
+        return self.reference_time if self.reference_time is not None else datetime.now()
+
+    def generate_disaster(self) -> DisasterEvent:
+        """Generate a realistic disaster and make it the current case"""
+        disaster = DisasterEvent(
+            event_id=f"DST_{self.rng.randint(1000, 9999)}",
+            disaster_type=self.rng.choice(self.DISASTER_TYPES),
+            location=self.rng.choice(self.LOCATIONS),
+            magnitude=self.rng.uniform(4.0, 9.5),
+            affected_population=self.rng.randint(1000, 100000),
+            infrastructure_damage=self.rng.uniform(0.1, 0.9),
+            casualty_estimate=self.rng.randint(10, 5000),
+            economic_impact_usd=self.rng.uniform(1e6, 1e9),
+            environmental_impact=self.rng.uniform(0.0, 0.8),
+            accessibility=self.rng.uniform(0.2, 0.9),
+            security_level=self.rng.choice(["Safe", "Moderate Risk", "High Risk", "Extremely Dangerous"]),
+            weather_conditions={"visibility": "good", "roads": "passable"},
+            time_of_occurrence=self._now(),
+            duration_estimate_hours=self.rng.randint(2, 72)
+        )
+        self.current_case = disaster
+        return disaster
+
+    def generate_stage_input(self, stage: FunnelStage):
+        """Generate the input consumed by the engine at the given stage"""
+        generators = {
+            FunnelStage.DISASTER_REPORTED: self.generate_disaster_reports,
+            FunnelStage.VERIFICATION: self.generate_verification_data,
+            FunnelStage.DATA_GATHERING: self.generate_multi_source_data,
+            FunnelStage.SITUATION_ASSESSMENT: self.generate_situation_assessment,
+            FunnelStage.NEEDS_VS_WANTS: self.generate_needs_analysis,
+            FunnelStage.LOCAL_SUPPORT_ASSESSMENT: self.generate_local_assessment,
+            FunnelStage.DIRECTOR_APPROVAL: self.generate_approval_factors
+        }
+        if stage not in generators:
+            raise ValueError(f"No input generator for stage: {stage.value}")
+        return generators[stage]()
+
+    def _build(self, cls, details: Callable[..., Dict[str, Any]], context: tuple, **fields):
+        """A generated input: lazy, or with its details drawn right away from the case stream"""
+        if self.lazy:
+            return cls.lazy(details, self.rng.getrandbits(64), context, **fields)
+        fields.update(details(self.rng, *context))
+        return cls(**fields)
+
+    def generate_disaster_reports(self) -> List[DisasterReport]:
+        """Generate realistic disaster reports"""
+        reports = []
+        num_reports = self.rng.randint(1, 8)
+        now = self._now()
+        
+        sources = [
+            ("Local News", 0.6), ("Social Media", 0.4), ("Field Worker", 0.8),
+            ("Government Official", 0.9), ("UN Partner", 0.85), ("NGO", 0.7)
+        ]
+        
+        for i in range(num_reports):
+            source_type, reliability = self.rng.choice(sources)
+            
+            report = self._build(
+                DisasterReport, _report_details,
+                (i, self.current_case.casualty_estimate, self.current_case.affected_population),
+                source_type=source_type,
+                source_reliability=reliability + self.rng.uniform(-0.2, 0.2),
+                # Eager: report deduplication groups by location, ReportStream orders by time
+                reporter_location=f"Location_{i}",
+                report_timestamp=now - timedelta(hours=self.rng.randint(1, 24)),
+                social_media_virality=self.rng.randint(0, 100),
+                government_acknowledgment=self.rng.choice([True, False])
+            )
+            reports.append(report)
+            
+        return reports
+        
+    def generate_verification_data(self) -> VerificationData:
+        """Generate verification data"""
+        # Always eager: every field but verification_confidence is scored
+        return VerificationData(
+            satellite_imagery_available=self.rng.choice([True, False]),
+            satellite_damage_assessment=self.rng.uniform(0.0, 1.0),
+            multiple_source_correlation=self.rng.uniform(0.3, 0.95),
+            government_confirmation=self.rng.choice([True, False]),
+            international_media_coverage=self.rng.choice([True, False]),
+            social_media_verification_score=self.rng.uniform(0.2, 0.9),
+            expert_analysis_available=self.rng.choice([True, False]),
+            historical_disaster_pattern_match=self.rng.uniform(0.1, 0.8),
+            verification_confidence=self.rng.uniform(0.4, 0.95)
+        )
+        
+    def generate_multi_source_data(self) -> MultiSourceData:
+        """Generate multi-source data"""
+        return self._build(
+            MultiSourceData, _multi_source_details, (),
+            un_ocha_report={"status": "preliminary", "confidence": self.rng.uniform(0.6, 0.9)} if self.rng.choice([True, False]) else None,
+            government_official_statement={"level": "ministerial", "details": "official response"} if self.rng.choice([True, False]) else None,
+            ngo_field_reports=[{"org": f"NGO_{i}", "assessment": "field data"} for i in range(self.rng.randint(0, 5))],
+            media_reports=[{"outlet": f"Media_{i}", "credibility": self.rng.uniform(0.3, 0.8)} for i in range(self.rng.randint(1, 8))],
+            satellite_analysis={"damage_assessment": self.rng.uniform(0.2, 0.9)} if self.rng.choice([True, False]) else None,
+            local_authority_reports=[{"authority": f"Local_{i}", "status": "active"} for i in range(self.rng.randint(0, 3))],
+            humanitarian_partner_intel=[{"partner": f"Partner_{i}", "intel": "field data"} for i in range(self.rng.randint(1, 4))]
+        )
+        
+    def generate_situation_assessment(self) -> SituationAssessment:
+        """Generate situation assessment"""
+        return self._build(
+            SituationAssessment, _situation_details,
+            (self.current_case.affected_population, self.current_case.security_level),
+            confirmed_casualties=self.current_case.casualty_estimate + self.rng.randint(-50, 100),
+            infrastructure_damage_verified=self.current_case.infrastructure_damage + self.rng.uniform(-0.2, 0.1),
+            immediate_life_threat_level=self.rng.choice(["None", "Low", "Medium", "High", "Critical"]),
+            displacement_numbers=self.rng.randint(100, 20000),
+            disease_outbreak_risk=self.rng.uniform(0.1, 0.8),
+            water_access_impact=self.rng.uniform(0.3, 0.8)
+        )
+        
+    def generate_needs_analysis(self) -> NeedsVsWantsAnalysis:
+        """Generate needs vs wants analysis"""
+        life_saving = ["Emergency Medical Care", "Clean Water", "Food", "Shelter"]
+        critical_medical = ["Trauma Surgery", "Blood Supply", "Antibiotics", "Vaccines"]
+        basic_survival = ["Blankets", "Cooking Supplies", "Sanitation", "Communication"]
+        
+        return self._build(
+            NeedsVsWantsAnalysis, _needs_details, (),
+            life_saving_needs=self.rng.sample(life_saving, self.rng.randint(1, len(life_saving))),
+            critical_medical_needs=self.rng.sample(critical_medical, self.rng.randint(0, len(critical_medical))),
+            basic_survival_needs=self.rng.sample(basic_survival, self.rng.randint(1, len(basic_survival)))
+        )
+        
+    def generate_local_assessment(self) -> LocalSupportAssessment:
+        """Generate local support assessment"""
+        return self._build(
+            LocalSupportAssessment, _local_support_details, (),
+            government_response_capacity=self.rng.uniform(0.1, 0.8),
+            local_ngo_capacity=self.rng.uniform(0.2, 0.7),
+            community_self_help_capacity=self.rng.uniform(0.3, 0.9),
+            private_sector_involvement=self.rng.uniform(0.1, 0.6),
+            local_medical_capacity=self.rng.uniform(0.2, 0.7),
+            local_food_supply_capacity=self.rng.uniform(0.1, 0.8)
+        )
+        
+    def generate_approval_factors(self) -> DirectorApprovalFactors:
+        """Generate director approval factors"""
+        return self._build(
+            DirectorApprovalFactors, _approval_details, (),
+            total_estimated_cost=self.rng.uniform(500000, 10000000),
+            funding_source_availability={"emergency_fund": self.rng.uniform(100000, 2000000), 
+                                        "donor_pledges": self.rng.uniform(200000, 3000000),
+                                        "government_support": self.rng.uniform(0, 1000000)},
+            organizational_mandate_alignment=self.rng.uniform(0.6, 1.0),
+            political_sensitivity_score=self.rng.uniform(0.1, 0.8),
+            media_attention_level=self.rng.randint(10, 90),
+            donor_interest_likelihood=self.rng.uniform(0.3, 0.9),
+            operational_complexity=self.rng.uniform(0.2, 0.9),
+            security_risk_to_staff=self.rng.uniform(0.1, 0.7),
+            reputation_risk_assessment=self.rng.uniform(0.1, 0.6),
+            success_probability=self.rng.uniform(0.4, 0.9)
+        )
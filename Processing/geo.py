@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Geospatial Index
+Incidents keyed by their (lat, lon) coordinates in a fixed-degree grid, geohash
+style. Radius queries visit only the cells the search circle can touch and filter
+the candidates with one vectorized haversine; k-nearest queries widen a radius
+query until it holds k incidents. Inserts and removals are O(1).
+"""
+
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; any argument may be a NumPy array"""
+    lat1, lon1, lat2, lon2 = (np.radians(value) for value in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+class GeoIndex:
+    """Point index over a lat/lon grid of cell_degrees cells.
+
+    Coordinates live in two growable float64 arrays indexed by slot; each grid cell
+    holds the slots inside it, and each slot remembers its place in that list so a
+    removal can swap the cell's last slot into it. Removed slots are reused by later
+    inserts.
+    """
+
+    def __init__(self, cell_degrees: float = 0.5, capacity: int = 1024):
+        self.cell_degrees = cell_degrees
+        self.lat_cells = int(math.ceil(180 / cell_degrees))
+        self.lon_cells = int(math.ceil(360 / cell_degrees))
+        self.ids: List[Optional[Hashable]] = []
+        self.slots: Dict[Hashable, int] = {}
+        self.lats = np.empty(capacity, dtype=np.float64)
+        self.lons = np.empty(capacity, dtype=np.float64)
+        self.cells: Dict[int, List[int]] = {}
+        self.cell_positions: List[int] = []  # slot -> its index in its cell's list
+        self._free_slots: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        return item_id in self.slots
+
+    def _cell(self, lat: float, lon: float) -> int:
+        row = min(int((lat + 90) / self.cell_degrees), self.lat_cells - 1)
+        column = int((lon + 180) / self.cell_degrees) % self.lon_cells
+        return row * self.lon_cells + column
+
+    # ===== UPDATES =====
+    def insert(self, item_id: Hashable, lat: float, lon: float):
+        """Add an incident, or move it if it is already indexed"""
+        if not -90 <= lat <= 90:
+            raise ValueError(f"Latitude out of range: {lat}")
+        lon = (lon + 180) % 360 - 180
+        if item_id in self.slots:
+            self.remove(item_id)
+        members = self.cells.setdefault(self._cell(lat, lon), [])
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self.ids[slot] = item_id
+            self.cell_positions[slot] = len(members)
+        else:
+            slot = len(self.ids)
+            if slot == len(self.lats):
+                self.lats = np.resize(self.lats, 2 * slot)
+                self.lons = np.resize(self.lons, 2 * slot)
+            self.ids.append(item_id)
+            self.cell_positions.append(len(members))
+        self.lats[slot] = lat
+        self.lons[slot] = lon
+        self.slots[item_id] = slot
+        members.append(slot)
+
+    def remove(self, item_id: Hashable):
+        slot = self.slots.pop(item_id)
+        cell = self._cell(self.lats[slot], self.lons[slot])
+        members = self.cells[cell]
+        last = members.pop()
+        if last != slot:
+            position = self.cell_positions[slot]
+            members[position] = last
+            self.cell_positions[last] = position
+        if not members:
+            del self.cells[cell]
+        self.ids[slot] = None
+        self._free_slots.append(slot)
+
+    def clear(self):
+        self.ids.clear()
+        self.slots.clear()
+        self.cells.clear()
+        self.cell_positions.clear()
+        self._free_slots.clear()
+
+    def position(self, item_id: Hashable) -> Tuple[float, float]:
+        slot = self.slots[item_id]
+        return float(self.lats[slot]), float(self.lons[slot])
+
+    # ===== QUERIES =====
+    def _candidate_cells(self, lat: float, lon: float, radius_km: float) -> Iterable[int]:
+        """Cells that can hold a point within radius_km of (lat, lon)"""
+        angle = radius_km / EARTH_RADIUS_KM
+        spread = math.degrees(angle)
+        low, high = lat - spread, lat + spread
+        first_row = max(int((low + 90) / self.cell_degrees), 0)
+        last_row = min(int((high + 90) / self.cell_degrees), self.lat_cells - 1)
+        # Longitude half-width of the circle; a pole inside it means every longitude
+        if low <= -90 or high >= 90 or math.sin(angle) >= math.cos(math.radians(lat)):
+            columns = range(self.lon_cells)
+        else:
+            half_width = math.degrees(math.asin(math.sin(angle) / math.cos(math.radians(lat))))
+            first = int(math.floor((lon - half_width + 180) / self.cell_degrees))
+            last = int(math.floor((lon + half_width + 180) / self.cell_degrees))
+            columns = range(self.lon_cells) if last - first + 1 >= self.lon_cells else \
+                [column % self.lon_cells for column in range(first, last + 1)]
+
+        if len(self.cells) < (last_row - first_row + 1) * len(columns):
+            # Sparse index or huge radius: scan the occupied cells instead of the grid
+            rows = range(first_row, last_row + 1)
+            wanted = set(columns)
+            return [cell for cell in self.cells
+                    if cell // self.lon_cells in rows and cell % self.lon_cells in wanted]
+        return [row * self.lon_cells + column for row in range(first_row, last_row + 1) for column in columns]
+
+    def within(self, lat: float, lon: float, radius_km: float,
+               exclude: Optional[Hashable] = None) -> List[Tuple[Hashable, float]]:
+        """(id, distance km) of every incident within radius_km, nearest first"""
+        cells = self.cells
+        candidates: List[int] = []
+        for cell in self._candidate_cells(lat, lon, radius_km):
+            members = cells.get(cell)
+            if members:
+                candidates.extend(members)
+        if not candidates:
+            return []
+
+        slots = np.array(candidates, dtype=np.intp)
+        distances = haversine_km(lat, lon, self.lats[slots], self.lons[slots])
+        inside = np.flatnonzero(distances <= radius_km)
+        order = inside[np.argsort(distances[inside], kind="stable")]
+        ids = self.ids
+        return [(ids[slot], distance) for slot, distance in zip(slots[order].tolist(), distances[order].tolist())
+                if ids[slot] != exclude]
+
+    def nearest(self, lat: float, lon: float, k: int = 1,
+                exclude: Optional[Hashable] = None) -> List[Tuple[Hashable, float]]:
+        """The k incidents closest to (lat, lon), nearest first.
+
+        Exact: a radius query that returns at least k incidents contains the k nearest.
+        """
+        available = len(self.slots) - (exclude in self.slots if exclude is not None else 0)
+        wanted = min(k, available)
+        if wanted <= 0:
+            return []
+        radius = self.cell_degrees * 111.2  # about one cell
+        while True:
+            found = self.within(lat, lon, radius, exclude)
+            if len(found) >= wanted or radius >= math.pi * EARTH_RADIUS_KM:
+                return found[:k]
+            # Grow by the area needed for the missing incidents at the density seen so far
+            radius *= min(max(math.sqrt(wanted / max(len(found), 1)), 1.5), 8.0)
+
+    def clusters(self, radius_km: float) -> List[List[Hashable]]:
+        """Groups of incidents linked by chains of pairs within radius_km (single linkage)"""
+        parent = {slot: slot for slot in self.slots.values()}
+
+        def root(slot: int) -> int:
+            while parent[slot] != slot:
+                parent[slot] = parent[parent[slot]]
+                slot = parent[slot]
+            return slot
+
+        for item_id, slot in self.slots.items():
+            for other, _ in self.within(self.lats[slot], self.lons[slot], radius_km, exclude=item_id):
+                a, b = root(slot), root(self.slots[other])
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+
+        groups: Dict[int, List[Hashable]] = {}
+        for item_id, slot in self.slots.items():
+            groups.setdefault(root(slot), []).append(item_id)
+        return sorted(groups.values(), key=len, reverse=True)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the coordinate arrays and the grid's slot lists (excluding ids)"""
+        pointer = 8
+        return (self.lats.nbytes + self.lons.nbytes + pointer * len(self.cell_positions)
+                + sum(56 + pointer * len(members) for members in self.cells.values()))
+
+class IncidentProximity:
+    """Node analyzer: other indexed incidents near the incident in the node's data.
+
+    Reads data["event_id"] and data["location"]["coordinates"]. It needs the whole
+    index, so wavefront engines run it in the parent (in_parent) instead of pickling
+    the index into every pool task.
+    """
+    in_parent = True
+
+    def __init__(self, index: GeoIndex, radius_km: float = 50.0, nearest: int = 5):
+        self.index = index
+        self.radius_km = radius_km
+        self.nearest = nearest
+
+    def __call__(self, data: Dict, rng) -> Dict:
+        location = data.get("location") or {}
+        coordinates = location.get("coordinates")
+        if coordinates is None:
+            return {}
+        lat, lon = coordinates
+        event_id = data.get("event_id")
+        nearby = self.index.within(lat, lon, self.radius_km, exclude=event_id)
+        return {
+            "incidents_within_km": self.radius_km,
+            "nearby_incidents": len(nearby),
+            "nearest_incidents": tuple((other, round(distance, 1))
+                                       for other, distance in self.index.nearest(lat, lon, self.nearest, exclude=event_id))
+        }
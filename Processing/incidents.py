@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Multi-Incident Manager
+Tracks many concurrent disasters through the decision funnel. Per-incident state is a
+slot in a few flat arrays, and stage evaluations are scheduled through a heap so the
+most critical incident with new input always advances first.
+"""
+
+import heapq
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from funnel import DisasterEvent, FunnelStage, ReliefGridDecisionEngine
+
+# Reaching this stage means the incident was approved and care is mobilized
+TERMINAL_STAGE = FunnelStage.MOBILIZE_CARE
+
+STAGES = list(FunnelStage)
+_STAGE_CODES = {stage: code for code, stage in enumerate(STAGES)}
+
+def provisional_severity(disaster: DisasterEvent) -> float:
+    """Priority before a situation assessment exists: magnitude on the 0-100 severity scale"""
+    return disaster.magnitude * 10
+
+@dataclass
+class StageEvaluation:
+    """Result of advancing one incident by one stage"""
+    incident_id: str
+    stage: FunnelStage
+    success: bool
+    message: str
+    priority: float
+
+class IncidentManager:
+    """Funnel state for many incidents, advanced most-critical-first.
+
+    Each incident holds its current stage, its latest priority (provisional severity,
+    then the severity score from the situation assessment, then the approval score)
+    and its last message. Stage inputs are submitted as they arrive; only incidents
+    with a pending input are in the heap. Priority changes push a new heap entry and
+    bump the incident's version, so stale entries are skipped when popped.
+
+    A single ReliefGridDecisionEngine evaluates every stage - its per-case fields are
+    set from the incident's slot before each call and read back afterwards.
+    """
+
+    def __init__(self, engine: Optional[ReliefGridDecisionEngine] = None):
+        self.engine = engine if engine is not None else ReliefGridDecisionEngine()
+        self.incident_ids: List[Optional[str]] = []
+        self.slots: Dict[str, int] = {}
+        self.stage_codes = array("b")
+        self.priorities = array("d")
+        self.versions = array("L")
+        self.messages: List[str] = []
+        self.pending: Dict[int, Any] = {}  # slot -> input for the incident's current stage
+        self.mobilized = 0
+        self._free_slots: List[int] = []
+        self._heap: List[Tuple[float, int, int, int]] = []  # (-priority, sequence, slot, version)
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, incident_id: str) -> bool:
+        return incident_id in self.slots
+
+    @property
+    def ready(self) -> int:
+        """Incidents waiting to have their next stage evaluated"""
+        return len(self.pending)
+
+    # ===== INCIDENT LIFECYCLE =====
+    def open(self, incident_id: str, disaster: DisasterEvent, priority: Optional[float] = None):
+        """Track a new incident; its occurrence stage is evaluated when it reaches the top of the heap"""
+        if incident_id in self.slots:
+            raise ValueError(f"Incident already open: {incident_id}")
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self.incident_ids[slot] = incident_id
+            self.stage_codes[slot] = _STAGE_CODES[FunnelStage.DISASTER_OCCURS]
+            self.priorities[slot] = 0.0
+            self.messages[slot] = ""
+        else:
+            slot = len(self.incident_ids)
+            self.incident_ids.append(incident_id)
+            self.stage_codes.append(_STAGE_CODES[FunnelStage.DISASTER_OCCURS])
+            self.priorities.append(0.0)
+            self.versions.append(0)
+            self.messages.append("")
+        self.slots[incident_id] = slot
+        self.pending[slot] = disaster
+        self._set_priority(slot, provisional_severity(disaster) if priority is None else priority)
+
+    def submit(self, incident_id: str, stage_input: Any):
+        """Provide (or replace) the input for an incident's current stage and queue it"""
+        slot = self.slots[incident_id]
+        requeue = slot not in self.pending
+        self.pending[slot] = stage_input
+        if requeue:
+            self._push(slot)
+
+    def close(self, incident_id: str):
+        """Stop tracking an incident and recycle its slot"""
+        slot = self.slots.pop(incident_id)
+        self.pending.pop(slot, None)
+        self.versions[slot] += 1  # invalidates any heap entry still pointing at the slot
+        self.incident_ids[slot] = None
+        self.messages[slot] = ""
+        self._free_slots.append(slot)
+
+    def stage(self, incident_id: str) -> FunnelStage:
+        return STAGES[self.stage_codes[self.slots[incident_id]]]
+
+    def priority(self, incident_id: str) -> float:
+        return self.priorities[self.slots[incident_id]]
+
+    def message(self, incident_id: str) -> str:
+        return self.messages[self.slots[incident_id]]
+
+    # ===== SCHEDULING =====
+    def _push(self, slot: int):
+        heapq.heappush(self._heap, (-self.priorities[slot], self._sequence, slot, self.versions[slot]))
+        self._sequence += 1
+
+    def _set_priority(self, slot: int, priority: float):
+        self.priorities[slot] = priority
+        self.versions[slot] += 1
+        if slot in self.pending:
+            self._push(slot)
+
+    def _pop_ready(self) -> Optional[int]:
+        while self._heap:
+            _, _, slot, version = heapq.heappop(self._heap)
+            if version == self.versions[slot] and slot in self.pending:
+                return slot
+        return None
+
+    def step(self) -> Optional[StageEvaluation]:
+        """Evaluate the pending stage of the most critical ready incident"""
+        slot = self._pop_ready()
+        if slot is None:
+            return None
+
+        stage = STAGES[self.stage_codes[slot]]
+        stage_input = self.pending.pop(slot)
+        engine = self.engine
+        engine.current_funnel_stage = stage
+        if stage == FunnelStage.DISASTER_OCCURS:
+            success = engine.process_disaster_occurrence(stage_input)
+            message = "Disaster detected and reported" if success else "Disaster occurred but was not detected"
+        else:
+            success, message = engine.process_stage(stage, stage_input)
+        engine.funnel_data.clear()
+
+        self.stage_codes[slot] = _STAGE_CODES[engine.current_funnel_stage]
+        self.messages[slot] = message
+        if stage in (FunnelStage.SITUATION_ASSESSMENT, FunnelStage.DIRECTOR_APPROVAL):
+            self._set_priority(slot, engine.stage_score(stage))
+        engine.stage_results.clear()
+
+        incident_id = self.incident_ids[slot]
+        evaluation = StageEvaluation(incident_id, stage, success, message, self.priorities[slot])
+        if engine.current_funnel_stage == TERMINAL_STAGE:
+            self.mobilized += 1
+            self.close(incident_id)
+        return evaluation
+
+    def run(self, input_source: Callable[[str, FunnelStage], Any], max_steps: Optional[int] = None,
+            close_failed: bool = False) -> Iterator[StageEvaluation]:
+        """Advance incidents until none are ready, asking input_source for each next stage's input.
+
+        input_source(incident_id, stage) returns the input for that stage, or None if
+        nothing is available yet (the incident then waits for submit()). An incident
+        whose stage fails stays at that stage for a retry unless close_failed is set;
+        an undetected disaster never enters the funnel, so its incident is always closed.
+        """
+        steps = 0
+        while max_steps is None or steps < max_steps:
+            evaluation = self.step()
+            if evaluation is None:
+                return
+            steps += 1
+            yield evaluation
+            incident_id = evaluation.incident_id
+            if not evaluation.success and (close_failed or evaluation.stage == FunnelStage.DISASTER_OCCURS):
+                self.close(incident_id)
+            elif incident_id in self.slots:
+                stage_input = input_source(incident_id, self.stage(incident_id))
+                if stage_input is not None:
+                    self.submit(incident_id, stage_input)
+
+    def stage_counts(self) -> Dict[str, int]:
+        """Open incidents per stage"""
+        counts: Dict[str, int] = {}
+        for slot in self.slots.values():
+            name = STAGES[self.stage_codes[slot]].name
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the per-incident arrays (excluding ids, messages and pending inputs)"""
+        return sum(values.itemsize * len(values) for values in (self.stage_codes, self.priorities, self.versions))
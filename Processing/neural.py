@@ -5,18 +5,31 @@ Advanced visualization of the complete humanitarian response decision-making pro
 with interconnected nodes, real-time data flow, and comprehensive analytics.
 """
 
-import tkinter as tk
-from tkinter import ttk, scrolledtext, Canvas
+import argparse
+try:
+    import tkinter as tk
+    from tkinter import ttk, scrolledtext, Canvas
+except ImportError:  # Python built without Tk: the engine still works, only ReliefGridNeuralUI needs it
+    tk = ttk = scrolledtext = Canvas = None
 import random
+import sys
 import time
-import threading
 import math
+import copy
+import heapq
+from array import array
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Deque, Iterable, Set, Callable
 from enum import Enum
 import json
 
+from geo import GeoIndex, IncidentProximity
+from worker import BackgroundWorker
+
 # ===== COLOR SCHEME - MODERN HUMANITARIAN UI =====
 class Colors:
     # Primary Colors
@@ -147,32 +160,341 @@ class ProcessingMetrics:
     error_rate: float
     success_probability: float
 
+class DataPacket(Mapping):
+    """Immutable snapshot of a node's data, shared by every flow of one emission"""
+    __slots__ = ("_data",)
+    
+    def __init__(self, data: Mapping):
+        self._data = {key: _freeze_value(value) for key, value in data.items()}
+        
+    def __getitem__(self, key):
+        return self._data[key]
+        
+    def __iter__(self):
+        return iter(self._data)
+        
+    def __len__(self) -> int:
+        return len(self._data)
+        
+    def __repr__(self):
+        return f"DataPacket({self._data!r})"
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable (shallow) copy for callers that need to edit the data"""
+        return dict(self._data)
+
+def _freeze_value(value):
+    """Make nested containers read-only so a shared packet cannot change under readers"""
+    if isinstance(value, DataPacket):
+        return value
+    if isinstance(value, Mapping):
+        return DataPacket(value)
+    if isinstance(value, list):
+        return tuple(_freeze_value(item) for item in value)
+    return value
+
 @dataclass
 class NetworkFlow:
     """Represents data flow between nodes"""
     from_node: str
     to_node: str
-    data_packet: Dict[str, Any]
+    data_packet: DataPacket
     flow_rate: float
     success_rate: float
     latency_ms: int
     packet_size: int
     priority: int
 
+@dataclass
+class NetworkFrame:
+    """What one redraw needs, copied out of the engine so the engine can keep running
+    while the frame renders"""
+    nodes: Dict[str, NetworkNode]  # copies of the nodes changed since the previous frame
+    flows: List[Tuple[str, str]]  # (from, to) of each live flow
+    status: Dict[str, Any]
+    disaster: Optional[DisasterEvent]
+
+# ===== NODE WORK =====
+def run_node_analysis(node_type: NodeType, data: Dict[str, Any], metrics: ProcessingMetrics,
+                      rng, analyzer: Optional[Callable] = None) -> Tuple[bool, Dict[str, Any], str, int]:
+    """Simulate realistic node processing without touching engine state.
+    
+    Returns (success, data update, verification status, processing time in ms).
+    rng is anything with the random module's interface.
+    """
+    # Simulate processing based on node type
+    if node_type == NodeType.INPUT:
+        # Input nodes detect and gather data
+        success_rate = 0.95
+        data_update = {
+            "raw_data_points": rng.randint(10, 100),
+            "source_confidence": rng.uniform(0.7, 0.95),
+            "detection_accuracy": rng.uniform(0.85, 0.99)
+        }
+        
+    elif node_type == NodeType.PROCESSING:
+        # Processing nodes analyze and transform data
+        success_rate = metrics.success_probability
+        data_update = {
+            "processed_insights": rng.randint(5, 25),
+            "analysis_confidence": metrics.confidence_level,
+            "data_quality_score": metrics.data_completeness,
+            "processing_status": "completed"
+        }
+        
+    elif node_type == NodeType.DECISION:
+        # Decision nodes make critical choices
+        success_rate = 0.88
+        decision_score = rng.uniform(0.5, 0.95)
+        data_update = {
+            "decision_confidence": decision_score,
+            "alternatives_considered": rng.randint(3, 8),
+            "risk_assessment": rng.uniform(0.1, 0.7),
+            "recommendation": "proceed" if decision_score > 0.75 else "review_required"
+        }
+        
+    elif node_type == NodeType.OUTPUT:
+        # Output nodes execute actions
+        success_rate = 0.92
+        data_update = {
+            "action_items": rng.randint(2, 12),
+            "deployment_readiness": rng.uniform(0.8, 1.0),
+            "resource_allocation": f"${rng.randint(100000, 5000000):,}",
+            "timeline_estimate": f"{rng.randint(4, 48)} hours"
+        }
+
+    elif node_type == NodeType.DATA:
+        # Data nodes store and relay records for downstream nodes
+        success_rate = 0.97
+        data_update = {
+            "records_stored": rng.randint(50, 500),
+            "data_freshness": rng.uniform(0.6, 1.0),
+            "storage_status": "synchronized"
+        }
+
+    else:
+        raise ValueError(f"No processing defined for node type: {node_type.value}")
+
+    # Node-specific analysis (e.g. satellite or credibility processing)
+    if analyzer is not None:
+        data_update.update(analyzer({**data, **data_update}, rng))
+        
+    # Update metrics
+    verification_status = "Verified" if rng.random() < success_rate else "Failed"
+    processing_time_ms = rng.randint(metrics.processing_time_ms - 50, metrics.processing_time_ms + 100)
+    
+    return rng.random() < success_rate, data_update, verification_status, processing_time_ms
+
+@dataclass
+class NodeTask:
+    """Self-contained node work item that can run on a worker thread or process"""
+    node_id: str
+    node_type: NodeType
+    data: Dict[str, Any]
+    metrics: ProcessingMetrics
+    seed: int
+    analyzer: Optional[Callable] = None
+
+@dataclass
+class NodeTaskResult:
+    """Outcome of a NodeTask, merged back into the engine by the caller"""
+    node_id: str
+    success: bool
+    data_update: Dict[str, Any]
+    verification_status: str
+    processing_time_ms: int
+
+class PrecomputedAnalysis:
+    """Analyzer that returns a result computed up front by the engine"""
+
+    def __init__(self, result: Dict[str, Any]):
+        self.result = result
+
+    def __call__(self, data: Dict[str, Any], rng) -> Dict[str, Any]:
+        return self.result
+
+def execute_node_task(task: NodeTask) -> NodeTaskResult:
+    """Worker entry point for wavefront execution"""
+    success, data_update, verification_status, processing_time_ms = run_node_analysis(
+        task.node_type, task.data, task.metrics, random.Random(task.seed), task.analyzer)
+    return NodeTaskResult(task.node_id, success, data_update, verification_status, processing_time_ms)
+
+class NodeScheduler:
+    """FIFO frontier of node ids with O(1) push, pop and membership checks"""
+    
+    def __init__(self, node_ids: Iterable[str] = ()):
+        self._frontier: Deque[str] = deque()
+        self._members: Set[str] = set()
+        for node_id in node_ids:
+            self.push(node_id)
+            
+    def push(self, node_id: str) -> bool:
+        """Queue a node unless it is already waiting; returns True if it was added"""
+        if node_id in self._members:
+            return False
+        self._members.add(node_id)
+        self._frontier.append(node_id)
+        return True
+        
+    def pop(self) -> str:
+        node_id = self._frontier.popleft()
+        self._members.discard(node_id)
+        return node_id
+        
+    def clear(self):
+        self._frontier.clear()
+        self._members.clear()
+        
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._members
+        
+    def __len__(self) -> int:
+        return len(self._frontier)
+        
+    def __iter__(self):
+        return iter(self._frontier)
+
+class FlowBuffer:
+    """Fixed-capacity ring buffer of recent flows with age-based expiry.
+    
+    Evicted flows still count towards the per-edge and overall totals.
+    """
+    
+    def __init__(self, capacity: int = 256, max_age_seconds: Optional[float] = 30.0):
+        self.capacity = capacity
+        self.max_age_seconds = max_age_seconds
+        self._flows: Deque[Tuple[float, NetworkFlow]] = deque(maxlen=capacity)
+        self.edge_totals: Dict[Tuple[str, str], int] = {}
+        self.total_flows = 0
+        self.evicted_flows = 0
+        
+    def append(self, flow: NetworkFlow):
+        now = time.monotonic()
+        self._expire(now)
+        if len(self._flows) == self.capacity:
+            self.evicted_flows += 1
+        self._flows.append((now, flow))
+        edge = (flow.from_node, flow.to_node)
+        self.edge_totals[edge] = self.edge_totals.get(edge, 0) + 1
+        self.total_flows += 1
+        
+    def _expire(self, now: float):
+        if self.max_age_seconds is None:
+            return
+        cutoff = now - self.max_age_seconds
+        while self._flows and self._flows[0][0] < cutoff:
+            self._flows.popleft()
+            self.evicted_flows += 1
+            
+    def clear(self):
+        """Drop recent flows and reset the historical totals"""
+        self._flows.clear()
+        self.edge_totals.clear()
+        self.total_flows = 0
+        self.evicted_flows = 0
+        
+    def __iter__(self):
+        self._expire(time.monotonic())
+        return (flow for _, flow in list(self._flows))
+        
+    def __len__(self) -> int:
+        self._expire(time.monotonic())
+        return len(self._flows)
+
+class CSRAdjacency(Mapping):
+    """Successor lists in compressed-sparse-row form.
+    
+    Node i's successors are indices[indptr[i]:indptr[i + 1]], stored as two flat
+    int arrays instead of one Python list per node. Maps node id -> list of ids.
+    """
+    
+    def __init__(self, node_ids: List[str], indptr: array, indices: array):
+        self.node_ids = node_ids
+        self.index = {node_id: position for position, node_id in enumerate(node_ids)}
+        self.indptr = indptr
+        self.indices = indices
+        
+    @classmethod
+    def from_edges(cls, node_ids: List[str], edges: Iterable[Tuple[str, str]]) -> "CSRAdjacency":
+        """Build from (source, target) pairs, keeping each source's edge order.
+        Edges touching unknown nodes are dropped."""
+        index = {node_id: position for position, node_id in enumerate(node_ids)}
+        pairs = [(index[source], index[target]) for source, target in edges
+                 if source in index and target in index]
+        
+        # Counting sort by source keeps edges stable within each row
+        indptr = array("q", [0]) * (len(node_ids) + 1)
+        for source, _ in pairs:
+            indptr[source + 1] += 1
+        for position in range(len(node_ids)):
+            indptr[position + 1] += indptr[position]
+        indices = array("i", [0]) * len(pairs)
+        cursor = array("q", indptr[:-1])
+        for source, target in pairs:
+            indices[cursor[source]] = target
+            cursor[source] += 1
+        return cls(node_ids, indptr, indices)
+        
+    def __getitem__(self, node_id: str) -> List[str]:
+        position = self.index[node_id]
+        node_ids = self.node_ids
+        return [node_ids[target] for target in self.indices[self.indptr[position]:self.indptr[position + 1]]]
+        
+    def __iter__(self):
+        return iter(self.node_ids)
+        
+    def __len__(self) -> int:
+        return len(self.node_ids)
+        
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+        
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.itemsize * len(self.indptr) + self.indices.itemsize * len(self.indices)
+
+# Node whose processing looks up nearby incidents in the engine's incident_index
+GEOGRAPHIC_NODE = "geographic_mapper"
+
 class ReliefGridNeuralEngine:
     """Advanced neural network decision engine"""
     
-    def __init__(self):
+    def __init__(self, flow_capacity: int = 256, flow_max_age_seconds: Optional[float] = 30.0,
+                 topology=None, max_open_incidents: int = 10000, rng: Optional[random.Random] = None):
+        # Own RNG stream, so a seeded engine reproduces its run whatever else draws from random
+        self.rng = rng if rng is not None else random.Random()
         self.nodes: Dict[str, NetworkNode] = {}
         self.connections: List[NetworkFlow] = []
-        self.active_flows: List[NetworkFlow] = []
-        self.processing_queue: List[str] = []
+        self.active_flows = FlowBuffer(flow_capacity, flow_max_age_seconds)
+        self.processing_queue = NodeScheduler()
+        self.successors = CSRAdjacency([], array("q", [0]), array("i"))
+        # Open incidents by coordinates; geographic_mapper reports each new one's neighbours.
+        # An incident closes when its estimated duration has passed (as of the newest
+        # occurrence seen), on resolve_incident, or - oldest end first - past max_open_incidents
+        self.incident_index = GeoIndex()
+        self.max_open_incidents = max_open_incidents
+        self._incident_ends: Dict[str, datetime] = {}
+        self._incident_expiry: List[Tuple[datetime, str]] = []  # heap of (end, event_id); may hold stale entries
+        # Optional per-node analysis hooks: analyzer(data, rng) -> dict of extra data
+        self.node_analyzers: Dict[str, Callable[[Dict[str, Any], Any], Dict[str, Any]]] = {
+            GEOGRAPHIC_NODE: IncidentProximity(self.incident_index)
+        }
         self.decision_history: List[Dict[str, Any]] = []
         self.performance_metrics: Dict[str, ProcessingMetrics] = {}
+        # Status aggregates, maintained incrementally by set_node_state and friends
+        self.state_counts: Dict[NodeState, int] = {state: 0 for state in NodeState}
+        # Nodes whose state or throughput changed since the last drain (for renderers)
+        self.changed_nodes: Set[str] = set()
+        self.total_throughput = 0
+        self._success_probability_sum = 0.0
         self.current_disaster: Optional[DisasterEvent] = None
         self.network_active = False
         
-        self._initialize_network()
+        if topology is None:
+            self._initialize_network()
+        else:
+            self.load_topology(topology)
         
     def _initialize_network(self):
         """Initialize the complete neural network structure"""
@@ -286,158 +608,379 @@ class ReliefGridNeuralEngine:
             if from_node in self.nodes:
                 self.nodes[from_node].connections.append(to_node)
                 
-        # Initialize performance metrics
+        self._build_successor_index()
+        self._initialize_metrics()
+        self._rebuild_counters()
+        
+    def _initialize_metrics(self):
+        """Initialize performance metrics"""
         for node_id in self.nodes:
             self.performance_metrics[node_id] = ProcessingMetrics(
-                processing_speed=random.uniform(0.5, 2.0),
-                accuracy_score=random.uniform(0.85, 0.99),
-                confidence_level=random.uniform(0.7, 0.95),
-                data_completeness=random.uniform(0.6, 1.0),
-                source_reliability=random.uniform(0.7, 0.95),
+                processing_speed=self.rng.uniform(0.5, 2.0),
+                accuracy_score=self.rng.uniform(0.85, 0.99),
+                confidence_level=self.rng.uniform(0.7, 0.95),
+                data_completeness=self.rng.uniform(0.6, 1.0),
+                source_reliability=self.rng.uniform(0.7, 0.95),
                 verification_status="Pending",
-                processing_time_ms=random.randint(50, 500),
-                throughput_rate=random.uniform(10, 100),
-                error_rate=random.uniform(0.01, 0.05),
-                success_probability=random.uniform(0.8, 0.98)
+                processing_time_ms=self.rng.randint(50, 500),
+                throughput_rate=self.rng.uniform(10, 100),
+                error_rate=self.rng.uniform(0.01, 0.05),
+                success_probability=self.rng.uniform(0.8, 0.98)
             )
 
+    def _build_successor_index(self):
+        """Pack node connections into CSR form, dropping connections to unknown nodes"""
+        self.successors = CSRAdjacency.from_edges(
+            list(self.nodes),
+            ((node_id, target) for node_id, node in self.nodes.items() for target in node.connections))
+        
+    def load_topology(self, topology):
+        """Replace the network with a loaded topology (see topology.py).
+        
+        NetworkNode.connections is filled from the CSR index, so loaded nodes
+        match the built-in graph.
+        """
+        self.nodes = {}
+        self.performance_metrics = {}
+        for position, node_id in enumerate(topology.node_ids):
+            self.nodes[node_id] = NetworkNode(
+                id=node_id,
+                name=topology.names[position],
+                node_type=topology.node_type(position),
+                position=topology.position(position),
+                connections=topology.adjacency[node_id],
+                description=f"Advanced {topology.names[position].lower()} with AI-powered analysis"
+            )
+        self.successors = topology.adjacency
+        self.processing_queue.clear()
+        self.active_flows.clear()
+        self._initialize_metrics()
+        self._rebuild_counters()
+
     def process_disaster_event(self, disaster: DisasterEvent):
         """Process a new disaster event through the neural network"""
         self.current_disaster = disaster
         self.network_active = True
         
+        # Frozen once here so every packet downstream shares it instead of copying
+        location = DataPacket(disaster.location)
+        
+        coordinates = disaster.location.get("coordinates")
+        if coordinates is not None:
+            self.resolve_incidents_ended(disaster.time_of_occurrence)
+            self._open_incident(disaster, coordinates)
+        if GEOGRAPHIC_NODE in self.nodes:
+            self.nodes[GEOGRAPHIC_NODE].data.update(event_id=disaster.event_id, location=location)
+        
         # Activate input nodes
-        input_nodes = ["disaster_sensor", "social_monitor", "news_feeds", "citizen_reports", "government_alerts"]
+        input_nodes = [node_id for node_id, node in self.nodes.items() if node.node_type == NodeType.INPUT]
         for node_id in input_nodes:
-            if node_id in self.nodes:
-                self.nodes[node_id].state = NodeState.ACTIVE
-                self.nodes[node_id].data = {
-                    "disaster_type": disaster.disaster_type,
-                    "magnitude": disaster.magnitude,
-                    "location": disaster.location,
-                    "timestamp": disaster.time_of_occurrence.isoformat()
-                }
+            self.set_node_state(self.nodes[node_id], NodeState.ACTIVE)
+            self.nodes[node_id].data = {
+                "disaster_type": disaster.disaster_type,
+                "magnitude": disaster.magnitude,
+                "location": location,
+                "timestamp": disaster.time_of_occurrence.isoformat()
+            }
                 
         # Start processing cascade
-        self.processing_queue = input_nodes.copy()
-        
+        self.processing_queue = NodeScheduler(input_nodes)
+        
+    def _open_incident(self, disaster: DisasterEvent, coordinates: Tuple[float, float]):
+        ends = disaster.time_of_occurrence + timedelta(hours=disaster.duration_estimate_hours)
+        self.incident_index.insert(disaster.event_id, *coordinates)
+        self._incident_ends[disaster.event_id] = ends
+        heapq.heappush(self._incident_expiry, (ends, disaster.event_id))
+        while len(self._incident_ends) > self.max_open_incidents:
+            self._close_next_incident()
+        if len(self._incident_expiry) > 2 * len(self._incident_ends) + 64:
+            # Drop entries left behind by resolve_incident and re-opened ids
+            self._incident_expiry = [(ends, event_id) for event_id, ends in self._incident_ends.items()]
+            heapq.heapify(self._incident_expiry)
+
+    def _close_next_incident(self) -> datetime:
+        """Close the open incident that ends first and return its end"""
+        while True:
+            ends, event_id = heapq.heappop(self._incident_expiry)
+            if self._incident_ends.get(event_id) == ends:
+                self.resolve_incident(event_id)
+                return ends
+
+    def resolve_incident(self, event_id: str) -> bool:
+        """Remove an incident from the open incidents; False if it was not open"""
+        if self._incident_ends.pop(event_id, None) is None:
+            return False
+        self.incident_index.remove(event_id)
+        return True
+
+    def resolve_incidents_ended(self, now: datetime) -> int:
+        """Close every incident whose estimated duration is over by now"""
+        closed = 0
+        while self._incident_expiry and self._incident_expiry[0][0] <= now:
+            ends, event_id = heapq.heappop(self._incident_expiry)
+            if self._incident_ends.get(event_id) == ends:
+                self.resolve_incident(event_id)
+                closed += 1
+        return closed
+
+    def clear_incidents(self):
+        self.incident_index.clear()
+        self._incident_ends.clear()
+        self._incident_expiry.clear()
+
     def process_network_step(self) -> bool:
         """Process one step of the neural network"""
         if not self.processing_queue or not self.network_active:
             return False
             
-        current_node_id = self.processing_queue.pop(0)
+        current_node_id = self.processing_queue.pop()
         current_node = self.nodes[current_node_id]
         
         # Simulate processing time
-        current_node.state = NodeState.PROCESSING
+        self.set_node_state(current_node, NodeState.PROCESSING)
         current_node.processing_time = time.time()
         
         # Process the node
         processing_success = self._simulate_node_processing(current_node)
+        self._complete_node(current_node_id, processing_success)
+            
+        return len(self.processing_queue) > 0
+        
+    def _complete_node(self, node_id: str, processing_success: bool):
+        """Record a node's outcome and, on success, activate its successors"""
+        current_node = self.nodes[node_id]
         
         if processing_success:
-            current_node.state = NodeState.SUCCESS
+            self.set_node_state(current_node, NodeState.SUCCESS)
             current_node.throughput += 1
+            self.total_throughput += 1
+            self.changed_nodes.add(node_id)
+            
+            # One immutable snapshot shared by all outgoing flows
+            packet = DataPacket(current_node.data) if self.successors[node_id] else None
             
             # Activate connected nodes
-            for connected_node_id in current_node.connections:
-                if connected_node_id in self.nodes:
-                    connected_node = self.nodes[connected_node_id]
-                    if connected_node.state == NodeState.INACTIVE:
-                        connected_node.state = NodeState.PENDING
-                        if connected_node_id not in self.processing_queue:
-                            self.processing_queue.append(connected_node_id)
-                            
-                    # Create data flow
-                    flow = NetworkFlow(
-                        from_node=current_node_id,
-                        to_node=connected_node_id,
-                        data_packet=current_node.data.copy(),
-                        flow_rate=random.uniform(0.8, 1.0),
-                        success_rate=random.uniform(0.9, 1.0),
-                        latency_ms=random.randint(10, 100),
-                        packet_size=random.randint(1024, 8192),
-                        priority=random.randint(1, 5)
-                    )
-                    self.active_flows.append(flow)
+            for connected_node_id in self.successors[node_id]:
+                connected_node = self.nodes[connected_node_id]
+                if connected_node.state == NodeState.INACTIVE:
+                    self.set_node_state(connected_node, NodeState.PENDING)
+                    self.processing_queue.push(connected_node_id)
+                        
+                # Create data flow
+                flow = NetworkFlow(
+                    from_node=node_id,
+                    to_node=connected_node_id,
+                    data_packet=packet,
+                    flow_rate=self.rng.uniform(0.8, 1.0),
+                    success_rate=self.rng.uniform(0.9, 1.0),
+                    latency_ms=self.rng.randint(10, 100),
+                    packet_size=self.rng.randint(1024, 8192),
+                    priority=self.rng.randint(1, 5)
+                )
+                self.active_flows.append(flow)
         else:
-            current_node.state = NodeState.ERROR
+            self.set_node_state(current_node, NodeState.ERROR)
+        
+    def run_to_completion(self, max_steps: Optional[int] = None) -> int:
+        """Drain the processing queue, returning the number of nodes processed"""
+        steps = 0
+        while self.processing_queue and self.network_active:
+            if max_steps is not None and steps >= max_steps:
+                break
+            self.process_network_step()
+            steps += 1
+        return steps
+        
+    def process_wavefront(self, executor: Optional[Executor] = None) -> bool:
+        """Process every currently queued node as one wavefront, optionally on a pool.
+        
+        Each node gets its own seed drawn from the engine's rng in queue order, runs in
+        isolation on a copy of its data, and results are merged back in queue order -
+        so the outcome is the same for any executor or worker count.
+        """
+        if not self.processing_queue or not self.network_active:
+            return False
+            
+        tasks = []
+        while self.processing_queue:
+            node_id = self.processing_queue.pop()
+            node = self.nodes[node_id]
+            self.set_node_state(node, NodeState.PROCESSING)
+            node.processing_time = time.time()
+            analyzer = self.node_analyzers.get(node_id)
+            if getattr(analyzer, "in_parent", False):
+                # Queries engine-side state: answer here rather than ship that state to the pool
+                analyzer = PrecomputedAnalysis(analyzer(node.data, None))
+            tasks.append(NodeTask(
+                node_id=node_id,
+                node_type=node.node_type,
+                data=dict(node.data),
+                metrics=copy.copy(self.performance_metrics[node_id]),
+                seed=self.rng.getrandbits(64),
+                analyzer=analyzer
+            ))
+            
+        results = executor.map(execute_node_task, tasks) if executor else map(execute_node_task, tasks)
+        
+        for result in results:
+            node = self.nodes[result.node_id]
+            metrics = self.performance_metrics[result.node_id]
+            node.data.update(result.data_update)
+            metrics.verification_status = result.verification_status
+            metrics.processing_time_ms = result.processing_time_ms
+            self._complete_node(result.node_id, result.success)
             
         return len(self.processing_queue) > 0
         
+    def run_parallel(self, use_processes: bool = False, max_workers: Optional[int] = None) -> int:
+        """Drain the network wavefront by wavefront on a thread or process pool.
+        
+        Returns the number of wavefronts processed. The built-in node analysis is
+        pure Python, so threads only interleave it under the GIL and give no
+        speedup; use_processes is what runs nodes in parallel. Node analyzers must
+        be picklable (module-level functions) when use_processes is set, unless
+        they set in_parent, in which case the engine runs them itself.
+        """
+        pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        wavefronts = 0
+        with pool_class(max_workers=max_workers) as executor:
+            while self.processing_queue and self.network_active:
+                self.process_wavefront(executor)
+                wavefronts += 1
+        return wavefronts
+        
     def _simulate_node_processing(self, node: NetworkNode) -> bool:
         """Simulate realistic node processing with various outcomes"""
         metrics = self.performance_metrics[node.id]
+        success, data_update, verification_status, processing_time_ms = run_node_analysis(
+            node.node_type, node.data, metrics, self.rng, self.node_analyzers.get(node.id))
         
-        # Simulate processing based on node type
-        if node.node_type == NodeType.INPUT:
-            # Input nodes detect and gather data
-            success_rate = 0.95
-            node.data.update({
-                "raw_data_points": random.randint(10, 100),
-                "source_confidence": random.uniform(0.7, 0.95),
-                "detection_accuracy": random.uniform(0.85, 0.99)
-            })
-            
-        elif node.node_type == NodeType.PROCESSING:
-            # Processing nodes analyze and transform data
-            success_rate = metrics.success_probability
-            node.data.update({
-                "processed_insights": random.randint(5, 25),
-                "analysis_confidence": metrics.confidence_level,
-                "data_quality_score": metrics.data_completeness,
-                "processing_status": "completed"
-            })
-            
-        elif node.node_type == NodeType.DECISION:
-            # Decision nodes make critical choices
-            success_rate = 0.88
-            decision_score = random.uniform(0.5, 0.95)
-            node.data.update({
-                "decision_confidence": decision_score,
-                "alternatives_considered": random.randint(3, 8),
-                "risk_assessment": random.uniform(0.1, 0.7),
-                "recommendation": "proceed" if decision_score > 0.75 else "review_required"
-            })
-            
-        elif node.node_type == NodeType.OUTPUT:
-            # Output nodes execute actions
-            success_rate = 0.92
-            node.data.update({
-                "action_items": random.randint(2, 12),
-                "deployment_readiness": random.uniform(0.8, 1.0),
-                "resource_allocation": f"${random.randint(100000, 5000000):,}",
-                "timeline_estimate": f"{random.randint(4, 48)} hours"
-            })
+        node.data.update(data_update)
+        metrics.verification_status = verification_status
+        metrics.processing_time_ms = processing_time_ms
+        return success
+
+    def _rebuild_counters(self):
+        """Recount the status aggregates from scratch (after nodes are added or replaced)"""
+        self.state_counts = {state: 0 for state in NodeState}
+        for node in self.nodes.values():
+            self.state_counts[node.state] += 1
+        self.total_throughput = sum(node.throughput for node in self.nodes.values())
+        self._success_probability_sum = sum(metrics.success_probability
+                                            for metrics in self.performance_metrics.values())
+        
+    def set_node_state(self, node: NetworkNode, state: NodeState):
+        """Change a node's state, keeping the per-state counters in sync"""
+        if node.state is state:
+            return
+        self.state_counts[node.state] -= 1
+        self.state_counts[state] += 1
+        node.state = state
+        self.changed_nodes.add(node.id)
+        
+    def drain_changed_nodes(self) -> Set[str]:
+        """Return and forget the ids of nodes changed since the previous call"""
+        changed, self.changed_nodes = self.changed_nodes, set()
+        return changed
+        
+    def capture_frame(self) -> NetworkFrame:
+        """Copy out what changed since the previous frame, for rendering on another thread"""
+        return NetworkFrame(
+            nodes={node_id: copy.copy(self.nodes[node_id]) for node_id in self.drain_changed_nodes()},
+            flows=[(flow.from_node, flow.to_node) for flow in self.active_flows],
+            status=self.get_network_status(),
+            disaster=self.current_disaster)
+        
+    def set_success_probability(self, node_id: str, value: float):
+        """Update a node's success probability, keeping the network average in sync"""
+        metrics = self.performance_metrics[node_id]
+        self._success_probability_sum += value - metrics.success_probability
+        metrics.success_probability = value
+        
+    def reset_network(self, clear_incidents: bool = True):
+        """Return every node to its initial state and clear queued work and flows.
+
+        With clear_incidents=False the open incidents stay indexed, for starting the
+        next disaster on a clean network.
+        """
+        if clear_incidents:
+            self.clear_incidents()
+        for node in self.nodes.values():
+            node.state = NodeState.INACTIVE
+            node.throughput = 0
+            node.data.clear()
             
-        # Update metrics
-        metrics.verification_status = "Verified" if random.random() < success_rate else "Failed"
-        metrics.processing_time_ms = random.randint(metrics.processing_time_ms - 50, metrics.processing_time_ms + 100)
-        
-        return random.random() < success_rate
+        self.active_flows.clear()
+        self.processing_queue.clear()
+        self.network_active = False
+        self.current_disaster = None
+        self._rebuild_counters()
+        self.changed_nodes.update(self.nodes)
 
     def get_network_status(self) -> Dict[str, Any]:
-        """Get comprehensive network status"""
-        active_nodes = sum(1 for node in self.nodes.values() if node.state in [NodeState.ACTIVE, NodeState.PROCESSING, NodeState.SUCCESS])
-        total_throughput = sum(node.throughput for node in self.nodes.values())
-        avg_success_rate = sum(metrics.success_probability for metrics in self.performance_metrics.values()) / len(self.performance_metrics)
+        """Get comprehensive network status (O(1) - reads incrementally kept counters)"""
+        active_nodes = (self.state_counts[NodeState.ACTIVE] + self.state_counts[NodeState.PROCESSING]
+                        + self.state_counts[NodeState.SUCCESS])
+        avg_success_rate = self._success_probability_sum / len(self.performance_metrics)
         
         return {
             "network_active": self.network_active,
             "active_nodes": active_nodes,
             "total_nodes": len(self.nodes),
             "active_flows": len(self.active_flows),
-            "total_throughput": total_throughput,
+            "total_flows": self.active_flows.total_flows,
+            "total_throughput": self.total_throughput,
             "average_success_rate": avg_success_rate,
             "processing_queue_length": len(self.processing_queue),
-            "current_disaster": self.current_disaster.disaster_type if self.current_disaster else None
+            "current_disaster": self.current_disaster.disaster_type if self.current_disaster else None,
+            "state_counts": {state.value: count for state, count in self.state_counts.items() if count}
         }
 
+def generate_disaster() -> DisasterEvent:
+    """A random disaster scenario for the UI's simulations"""
+    # Generate realistic disaster scenarios
+    disaster_types = [
+        "Magnitude 7.2 Earthquake", "Category 4 Hurricane", "Flash Flood Emergency", 
+        "Disease Outbreak (Cholera)", "Refugee Crisis", "Wildfire Emergency",
+        "Tsunami Alert", "Volcanic Eruption", "Severe Drought", "Armed Conflict"
+    ]
+        
+    locations = [
+        {"country": "Haiti", "province": "Sud", "district": "Les Cayes", "coordinates": (18.2, -73.75)},
+        {"country": "Philippines", "province": "Leyte", "district": "Tacloban", "coordinates": (11.25, 125.0)},
+        {"country": "Bangladesh", "province": "Chittagong", "district": "Cox's Bazar", "coordinates": (21.45, 92.0)},
+        {"country": "Syria", "province": "Aleppo", "district": "Aleppo City", "coordinates": (36.2, 37.16)},
+        {"country": "Somalia", "province": "Bay", "district": "Baidoa", "coordinates": (3.11, 43.65)},
+         {"country": "India", "province": "Kashmir", "district": "Srinagar", "coordinates": (22.5, 11.91)},
+        {"country": "Yemen", "province": "Hodeidah", "district": "Al Hudaydah", "coordinates": (14.8, 42.95)}
+    ]
+        
+    disaster = DisasterEvent(
+        event_id=f"RG_{random.randint(10000, 99999)}",
+        disaster_type=random.choice(disaster_types),
+        location=random.choice(locations),
+        magnitude=random.uniform(5.0, 9.8),
+        affected_population=random.randint(5000, 500000),
+        infrastructure_damage=random.uniform(0.2, 0.9),
+        casualty_estimate=random.randint(50, 10000),
+        economic_impact_usd=random.uniform(10e6, 5e9),
+        environmental_impact=random.uniform(0.1, 0.8),
+        accessibility=random.uniform(0.3, 0.9),
+        security_level=random.choice(["Safe", "Moderate Risk", "High Risk", "Extremely Dangerous"]),
+        weather_conditions={"forecast": random.choice(["Clear", "Stormy", "Deteriorating"])},
+        time_of_occurrence=datetime.now(),
+        duration_estimate_hours=random.randint(6, 168),
+        media_attention=random.uniform(0.4, 1.0),
+        international_interest=random.uniform(0.3, 0.9),
+        coordination_complexity=random.uniform(0.5, 0.95),
+        historical_precedent=random.choice([True, False])
+    )
+    return disaster
+
 class ReliefGridNeuralUI:
     """Advanced neural network visualization interface"""
     
-    def __init__(self):
+    def __init__(self, topology=None, max_fps: float = 30.0):
         self.root = tk.Tk()
         self.root.title("Relief Grid - Neural Decision Engine")
         self.root.geometry("1800x1200")
@@ -448,10 +991,31 @@ class ReliefGridNeuralUI:
         self.font_medium = ("Segoe UI", 11)
         self.font_small = ("Segoe UI", 9)
         
-        self.engine = ReliefGridNeuralEngine()
+        self.engine = ReliefGridNeuralEngine(topology=topology)
+        # Engine calls run on this worker; the canvas is only touched from its callbacks
+        self.worker = BackgroundWorker(self.root, poll_ms=5)
         self.animation_active = False
+        
+        # Auto-run: the worker steps the engine in slices of one frame interval and the
+        # canvas is redrawn once per slice from its frame, while the next slice runs
+        self.frame_interval = 1.0 / max_fps
+        self.auto_running = False
+        self.rate_window_start = 0.0
+        self.window_steps = 0
+        self.window_frames = 0
         self.selected_node = None
         
+        # Retained canvas items, created by build_scene and updated in place
+        self.node_items: Dict[str, Dict[str, int]] = {}
+        self.edge_items: Dict[Tuple[str, str], int] = {}
+        self.flow_items: List[int] = []
+        self.item_styles: Dict[int, Dict[str, Any]] = {}
+        # Node states as last rendered; frames keep them current without reading the engine
+        self.view_nodes = {node_id: copy.copy(node) for node_id, node in self.engine.nodes.items()}
+        self.predecessors: Dict[str, List[str]] = {}
+        self.drawn_selection: Optional[str] = None
+        self.drawn_stats: Optional[str] = None
+        
         self.setup_ui()
         self.start_animations()
         
@@ -520,6 +1084,7 @@ class ReliefGridNeuralUI:
         self.create_modern_button(button_frame, "Start New Disaster", self.start_disaster_simulation, Colors.DANGER)
         self.create_modern_button(button_frame, "Process Network", self.process_network_step, Colors.SUCCESS)
         self.create_modern_button(button_frame, "Reset Network", self.reset_network, Colors.WARNING)
+        self.auto_run_button = self.create_modern_button(button_frame, "Auto Run", self.toggle_auto_run, Colors.INFO)
         
         # Network Status
         status_section = tk.Frame(right_panel, bg=Colors.SURFACE, relief=tk.RAISED, bd=1)
@@ -562,6 +1127,11 @@ class ReliefGridNeuralUI:
                                         font=self.font_small, fg=Colors.INFO, bg=Colors.SURFACE)
         self.performance_label.pack(side=tk.RIGHT, padx=20, pady=10)
         
+        self.rate_label = tk.Label(self.bottom_status,
+                                 text="Engine: - steps/s | Render: - fps",
+                                 font=self.font_small, fg=Colors.INFO, bg=Colors.SURFACE)
+        self.rate_label.pack(side=tk.RIGHT, padx=20, pady=10)
+        
     def create_modern_button(self, parent, text, command, color):
         """Create a modern styled button"""
         btn = tk.Button(parent, text=text, command=command,
@@ -572,145 +1142,200 @@ class ReliefGridNeuralUI:
         btn.pack(fill=tk.X, pady=2)
         return btn
         
-    def draw_network(self):
-        """Draw the neural network visualization"""
-        self.canvas.delete("all")
+    def draw_network(self, frame: NetworkFrame):
+        """Bring the retained canvas items up to date with a frame from the engine.
         
-        # Draw connections first (so they appear behind nodes)
-        self.draw_connections()
+        Items are created once per node/edge and then only reconfigured when
+        their node changes, so an idle frame does almost no canvas work.
+        """
+        self.view_nodes.update(frame.nodes)
+        if not self.node_items:
+            self.build_scene()
+            
+        dirty = set(frame.nodes)
+        if self.selected_node != self.drawn_selection:
+            dirty.update(node_id for node_id in (self.selected_node, self.drawn_selection) if node_id)
+            self.drawn_selection = self.selected_node
+            
+        # Connections take their colour from both endpoints
+        dirty_edges = set()
+        for node_id in dirty:
+            dirty_edges.update((node_id, target) for target in self.engine.successors.get(node_id, []))
+            dirty_edges.update((source, node_id) for source in self.predecessors.get(node_id, ()))
+        for edge in dirty_edges:
+            self.update_connection(edge)
+            
+        for node_id in dirty:
+            if node_id in self.node_items:
+                self.update_node(node_id)
+        self.update_selection_ring()
         
         # Draw active data flows
-        self.draw_data_flows()
+        self.draw_data_flows(frame.flows)
+        
+        # Draw network statistics overlay
+        self.draw_network_stats(frame.status)
         
+    def build_scene(self):
+        """Create every connection, node and overlay item once"""
+        self.canvas.delete("all")
+        self.node_items = {}
+        self.edge_items = {}
+        self.flow_items = []
+        self.item_styles = {}
+        self.predecessors = {}
+        self.drawn_selection = None
+        self.drawn_stats = None
+        
+        # Draw connections first (so they appear behind nodes)
+        for node_id, targets in self.engine.successors.items():
+            from_pos = self.engine.nodes[node_id].position
+            for connected_id in targets:
+                to_pos = self.engine.nodes[connected_id].position
+                self.edge_items[(node_id, connected_id)] = self.canvas.create_line(
+                    from_pos[0], from_pos[1], to_pos[0], to_pos[1],
+                    fill=Colors.CONNECTION_INACTIVE, width=1, smooth=True)
+                self.predecessors.setdefault(connected_id, []).append(node_id)
+                
         # Draw nodes
-        self.draw_nodes()
+        for node_id, node in self.view_nodes.items():
+            self.node_items[node_id] = self.create_node_items(node)
+            
+        self.selection_ring = self.canvas.create_oval(0, 0, 0, 0, outline=Colors.PRIMARY,
+                                                      width=3, state=tk.HIDDEN)
+        self.stats_box = self.canvas.create_rectangle(0, 0, 0, 0, fill=Colors.SURFACE,
+                                                      outline=Colors.TEXT_MUTED)
+        self.stats_text = self.canvas.create_text(0, 0, text="", font=("Segoe UI", 9),
+                                                  fill=Colors.TEXT_SECONDARY, justify=tk.CENTER)
+        self.stats_width = None
+        
+        for edge in self.edge_items:
+            self.update_connection(edge)
+        for node_id in self.node_items:
+            self.update_node(node_id)
+            
+    def create_node_items(self, node: NetworkNode) -> Dict[str, int]:
+        """Create the shape, throughput and label items for one node"""
+        x, y = node.position
+        tags = (f"node_{node.id}", "nodes")
+        size = 25
         
-        # Draw network statistics overlay
-        self.draw_network_stats()
-        
-    def draw_connections(self):
-        """Draw connections between nodes"""
-        for node_id, node in self.engine.nodes.items():
-            for connected_id in node.connections:
-                if connected_id in self.engine.nodes:
-                    from_pos = node.position
-                    to_pos = self.engine.nodes[connected_id].position
-                    
-                    # Determine connection color based on activity
-                    if (node.state in [NodeState.SUCCESS, NodeState.ACTIVE] and 
-                        self.engine.nodes[connected_id].state != NodeState.INACTIVE):
-                        color = Colors.CONNECTION_ACTIVE
-                        width = 2
-                    elif node.state == NodeState.SUCCESS:
-                        color = Colors.CONNECTION_SUCCESS
-                        width = 2
-                    else:
-                        color = Colors.CONNECTION_INACTIVE
-                        width = 1
-                        
-                    self.canvas.create_line(from_pos[0], from_pos[1], 
-                                          to_pos[0], to_pos[1],
-                                          fill=color, width=width, smooth=True)
+        # Different shapes for different node types
+        if node.node_type == NodeType.INPUT:
+            # Square for input nodes
+            shape = self.canvas.create_rectangle(x-size, y-size, x+size, y+size, tags=tags)
+        elif node.node_type == NodeType.OUTPUT:
+            # Diamond for output nodes
+            points = [x, y-size, x+size, y, x, y+size, x-size, y]
+            shape = self.canvas.create_polygon(points, tags=tags)
+        elif node.node_type == NodeType.DECISION:
+            # Hexagon for decision nodes
+            angle_offset = math.pi / 6
+            points = []
+            for i in range(6):
+                angle = i * math.pi / 3 + angle_offset
+                px = x + size * math.cos(angle)
+                py = y + size * math.sin(angle)
+                points.extend([px, py])
+            shape = self.canvas.create_polygon(points, tags=tags)
+        else:
+            # Circle for processing nodes
+            shape = self.canvas.create_oval(x-size, y-size, x+size, y+size, tags=tags)
+            
+        # Node throughput indicator (hidden until the node has processed something)
+        throughput = self.canvas.create_text(x, y-40, text="", font=("Segoe UI", 8, "bold"),
+                                             fill=Colors.SUCCESS, tags=tags, state=tk.HIDDEN)
+        
+        # Add node label
+        label = self.canvas.create_text(x, y+40, text=node.name[:20], 
+                                        font=("Segoe UI", 8), fill=Colors.TEXT_SECONDARY, 
+                                        tags=tags, width=100)
+        return {"shape": shape, "throughput": throughput, "label": label}
+        
+    def node_style(self, node: NetworkNode) -> Tuple[str, str, int]:
+        """Fill, outline colour and outline width for a node's state"""
+        if node.state == NodeState.INACTIVE:
+            return Colors.NODE_PENDING, Colors.TEXT_MUTED, 1
+        elif node.state == NodeState.PROCESSING:
+            return Colors.NODE_PROCESSING, Colors.NODE_PROCESSING, 3
+        elif node.state == NodeState.ACTIVE:
+            return Colors.NODE_ACTIVE, Colors.NODE_ACTIVE, 2
+        elif node.state == NodeState.SUCCESS:
+            return Colors.NODE_SUCCESS, Colors.NODE_SUCCESS, 2
+        elif node.state == NodeState.ERROR:
+            return Colors.NODE_ERROR, Colors.NODE_ERROR, 2
+        else:  # PENDING
+            return Colors.NODE_PENDING, Colors.NODE_PENDING, 2
+            
+    def connection_style(self, node: NetworkNode, connected: NetworkNode) -> Tuple[str, int]:
+        """Colour and width of a connection based on activity at both ends"""
+        if (node.state in [NodeState.SUCCESS, NodeState.ACTIVE] and 
+            connected.state != NodeState.INACTIVE):
+            return Colors.CONNECTION_ACTIVE, 2
+        elif node.state == NodeState.SUCCESS:
+            return Colors.CONNECTION_SUCCESS, 2
+        else:
+            return Colors.CONNECTION_INACTIVE, 1
+            
+    def configure_item(self, item: int, **style):
+        """itemconfigure only when the style actually changed"""
+        if self.item_styles.get(item) != style:
+            self.item_styles[item] = style
+            self.canvas.itemconfigure(item, **style)
+            
+    def update_connection(self, edge: Tuple[str, str]):
+        from_id, to_id = edge
+        color, width = self.connection_style(self.view_nodes[from_id], self.view_nodes[to_id])
+        self.configure_item(self.edge_items[edge], fill=color, width=width)
+        
+    def update_node(self, node_id: str):
+        node = self.view_nodes[node_id]
+        items = self.node_items[node_id]
+        color, outline_color, outline_width = self.node_style(node)
+        self.configure_item(items["shape"], fill=color, outline=outline_color, width=outline_width)
+        if node.throughput > 0:
+            self.configure_item(items["throughput"], text=f"{node.throughput}", state=tk.NORMAL)
+        else:
+            self.configure_item(items["throughput"], state=tk.HIDDEN)
+            
+    def update_selection_ring(self):
+        """Highlight selected node"""
+        node_id = self.selected_node
+        if node_id not in self.view_nodes:
+            self.configure_item(self.selection_ring, state=tk.HIDDEN)
+            return
+        x, y = self.view_nodes[node_id].position
+        self.canvas.coords(self.selection_ring, x-30, y-30, x+30, y+30)
+        self.configure_item(self.selection_ring, state=tk.NORMAL, tags=(f"node_{node_id}",))
                                           
-    def draw_data_flows(self):
-        """Draw animated data flows between nodes"""
-        for flow in self.engine.active_flows:
-            if flow.from_node in self.engine.nodes and flow.to_node in self.engine.nodes:
-                from_pos = self.engine.nodes[flow.from_node].position
-                to_pos = self.engine.nodes[flow.to_node].position
-                
-                # Calculate animation position
-                progress = (time.time() % 2) / 2  # 2-second animation cycle
+    def draw_data_flows(self, flows: List[Tuple[str, str]]):
+        """Move pooled packet items along their flows; surplus items are hidden"""
+        # Calculate animation position
+        progress = (time.time() % 2) / 2  # 2-second animation cycle
+        
+        shown = 0
+        for from_id, to_id in flows:
+            if from_id in self.view_nodes and to_id in self.view_nodes:
+                from_pos = self.view_nodes[from_id].position
+                to_pos = self.view_nodes[to_id].position
                 x = from_pos[0] + (to_pos[0] - from_pos[0]) * progress
                 y = from_pos[1] + (to_pos[1] - from_pos[1]) * progress
                 
-                # Draw animated data packet
-                self.canvas.create_oval(x-3, y-3, x+3, y+3, 
-                                      fill=Colors.PRIMARY, outline=Colors.PRIMARY)
-                                      
-    def draw_nodes(self):
-        """Draw network nodes with state-based styling"""
-        for node_id, node in self.engine.nodes.items():
-            x, y = node.position
-            
-            # Determine node appearance based on state and type
-            if node.state == NodeState.INACTIVE:
-                color = Colors.NODE_PENDING
-                outline_color = Colors.TEXT_MUTED
-                outline_width = 1
-            elif node.state == NodeState.PROCESSING:
-                color = Colors.NODE_PROCESSING
-                outline_color = Colors.NODE_PROCESSING
-                outline_width = 3
-            elif node.state == NodeState.ACTIVE:
-                color = Colors.NODE_ACTIVE
-                outline_color = Colors.NODE_ACTIVE
-                outline_width = 2
-            elif node.state == NodeState.SUCCESS:
-                color = Colors.NODE_SUCCESS
-                outline_color = Colors.NODE_SUCCESS
-                outline_width = 2
-            elif node.state == NodeState.ERROR:
-                color = Colors.NODE_ERROR
-                outline_color = Colors.NODE_ERROR
-                outline_width = 2
-            else:  # PENDING
-                color = Colors.NODE_PENDING
-                outline_color = Colors.NODE_PENDING
-                outline_width = 2
+                if shown == len(self.flow_items):
+                    # Animated data packet, kept between connections and nodes
+                    item = self.canvas.create_oval(0, 0, 0, 0, fill=Colors.PRIMARY, outline=Colors.PRIMARY)
+                    self.canvas.tag_lower(item, "nodes")
+                    self.flow_items.append(item)
+                item = self.flow_items[shown]
+                self.canvas.coords(item, x-3, y-3, x+3, y+3)
+                self.configure_item(item, state=tk.NORMAL)
+                shown += 1
                 
-            # Different shapes for different node types
-            if node.node_type == NodeType.INPUT:
-                # Square for input nodes
-                size = 25
-                self.canvas.create_rectangle(x-size, y-size, x+size, y+size,
-                                           fill=color, outline=outline_color, 
-                                           width=outline_width, tags=f"node_{node_id}")
-            elif node.node_type == NodeType.OUTPUT:
-                # Diamond for output nodes
-                size = 25
-                points = [x, y-size, x+size, y, x, y+size, x-size, y]
-                self.canvas.create_polygon(points, fill=color, outline=outline_color,
-                                         width=outline_width, tags=f"node_{node_id}")
-            elif node.node_type == NodeType.DECISION:
-                # Hexagon for decision nodes
-                size = 25
-                angle_offset = math.pi / 6
-                points = []
-                for i in range(6):
-                    angle = i * math.pi / 3 + angle_offset
-                    px = x + size * math.cos(angle)
-                    py = y + size * math.sin(angle)
-                    points.extend([px, py])
-                self.canvas.create_polygon(points, fill=color, outline=outline_color,
-                                         width=outline_width, tags=f"node_{node_id}")
-            else:
-                # Circle for processing nodes
-                size = 25
-                self.canvas.create_oval(x-size, y-size, x+size, y+size,
-                                      fill=color, outline=outline_color,
-                                      width=outline_width, tags=f"node_{node_id}")
-                                      
-            # Add node throughput indicator
-            if node.throughput > 0:
-                self.canvas.create_text(x, y-40, text=f"{node.throughput}", 
-                                      font=("Segoe UI", 8, "bold"), 
-                                      fill=Colors.SUCCESS, tags=f"node_{node_id}")
-                                      
-            # Add node label
-            self.canvas.create_text(x, y+40, text=node.name[:20], 
-                                  font=("Segoe UI", 8), fill=Colors.TEXT_SECONDARY, 
-                                  tags=f"node_{node_id}", width=100)
-                                  
-            # Highlight selected node
-            if self.selected_node == node_id:
-                self.canvas.create_oval(x-30, y-30, x+30, y+30, 
-                                      outline=Colors.PRIMARY, width=3, 
-                                      tags=f"node_{node_id}")
+        for item in self.flow_items[shown:]:
+            self.configure_item(item, state=tk.HIDDEN)
                                       
-    def draw_network_stats(self):
-        """Draw real-time network statistics overlay"""
-        status = self.engine.get_network_status()
+    def draw_network_stats(self, status: Dict[str, Any]):
+        """Update the real-time network statistics overlay"""
         
         # Top-right statistics box
         stats_text = f"""NETWORK STATUS
@@ -719,15 +1344,20 @@ class ReliefGridNeuralUI:
             Throughput: {status['total_throughput']} ops
             Success Rate: {status['average_success_rate']:.1%}
             Queue: {status['processing_queue_length']} pending"""
-        self.canvas.create_rectangle(self.canvas.winfo_width()-200, 10, 
-                                   self.canvas.winfo_width()-10, 130,
-                                   fill=Colors.SURFACE, outline=Colors.TEXT_MUTED)
-        self.canvas.create_text(self.canvas.winfo_width()-105, 70, 
-                              text=stats_text, font=("Segoe UI", 9),
-                              fill=Colors.TEXT_SECONDARY, justify=tk.CENTER)
+        if stats_text != self.drawn_stats:
+            self.drawn_stats = stats_text
+            self.canvas.itemconfigure(self.stats_text, text=stats_text)
+            
+        width = self.canvas.winfo_width()
+        if width != self.stats_width:
+            self.stats_width = width
+            self.canvas.coords(self.stats_box, width-200, 10, width-10, 130)
+            self.canvas.coords(self.stats_text, width-105, 70)
                               
     def on_node_click(self, event):
         """Handle node click events"""
+        if self.worker.busy:
+            return
         # Find clicked node
         clicked_items = self.canvas.find_closest(event.x, event.y)
         for item in clicked_items:
@@ -738,7 +1368,7 @@ class ReliefGridNeuralUI:
                     if node_id in self.engine.nodes:
                         self.selected_node = node_id
                         self.show_node_details(node_id)
-                        self.draw_network()
+                        self.draw_network(self.engine.capture_frame())
                         return
                         
     def show_node_details(self, node_id: str):
@@ -748,6 +1378,7 @@ class ReliefGridNeuralUI:
             
         node = self.engine.nodes[node_id]
         metrics = self.engine.performance_metrics[node_id]
+        connections = self.engine.successors[node_id]
         
         details = f"""NODE DETAILS: {node.name}
 {'='*50}
@@ -772,11 +1403,12 @@ PERFORMANCE METRICS:
 OPERATIONAL STATUS:
 • Verification Status: {metrics.verification_status}
 • Total Throughput: {node.throughput} operations
-• Connected Nodes: {len(node.connections)}
+• Connected Nodes: {len(connections)}
+• Data Flows Sent: {sum(self.engine.active_flows.edge_totals.get((node_id, conn), 0) for conn in connections)}
 • Processing Time: {node.processing_time:.2f}s
 
 CONNECTIONS:
-{chr(10).join(f"• → {conn}" for conn in node.connections)}
+{chr(10).join(f"• → {conn}" for conn in connections)}
 
 CURRENT DATA:
 """
@@ -785,7 +1417,7 @@ CURRENT DATA:
             for key, value in node.data.items():
                 if isinstance(value, float):
                     details += f"• {key.replace('_', ' ').title()}: {value:.3f}\n"
-                elif isinstance(value, dict):
+                elif isinstance(value, Mapping):
                     details += f"• {key.replace('_', ' ').title()}: {len(value)} items\n"
                 else:
                     details += f"• {key.replace('_', ' ').title()}: {value}\n"
@@ -803,84 +1435,144 @@ DESCRIPTION:
         
     def start_disaster_simulation(self):
         """Start a new disaster simulation"""
-        # Generate realistic disaster scenarios
-        disaster_types = [
-            "Magnitude 7.2 Earthquake", "Category 4 Hurricane", "Flash Flood Emergency", 
-            "Disease Outbreak (Cholera)", "Refugee Crisis", "Wildfire Emergency",
-            "Tsunami Alert", "Volcanic Eruption", "Severe Drought", "Armed Conflict"
-        ]
-        
-        locations = [
-            {"country": "Haiti", "province": "Sud", "district": "Les Cayes", "coordinates": (18.2, -73.75)},
-            {"country": "Philippines", "province": "Leyte", "district": "Tacloban", "coordinates": (11.25, 125.0)},
-            {"country": "Bangladesh", "province": "Chittagong", "district": "Cox's Bazar", "coordinates": (21.45, 92.0)},
-            {"country": "Syria", "province": "Aleppo", "district": "Aleppo City", "coordinates": (36.2, 37.16)},
-            {"country": "Somalia", "province": "Bay", "district": "Baidoa", "coordinates": (3.11, 43.65)},
-             {"country": "India", "province": "Kashmir", "district": "Srinagar", "coordinates": (22.5, 11.91)},
-            {"country": "Yemen", "province": "Hodeidah", "district": "Al Hudaydah", "coordinates": (14.8, 42.95)}
-        ]
-        
-        disaster = DisasterEvent(
-            event_id=f"RG_{random.randint(10000, 99999)}",
-            disaster_type=random.choice(disaster_types),
-            location=random.choice(locations),
-            magnitude=random.uniform(5.0, 9.8),
-            affected_population=random.randint(5000, 500000),
-            infrastructure_damage=random.uniform(0.2, 0.9),
-            casualty_estimate=random.randint(50, 10000),
-            economic_impact_usd=random.uniform(10e6, 5e9),
-            environmental_impact=random.uniform(0.1, 0.8),
-            accessibility=random.uniform(0.3, 0.9),
-            security_level=random.choice(["Safe", "Moderate Risk", "High Risk", "Extremely Dangerous"]),
-            weather_conditions={"forecast": random.choice(["Clear", "Stormy", "Deteriorating"])},
-            time_of_occurrence=datetime.now(),
-            duration_estimate_hours=random.randint(6, 168),
-            media_attention=random.uniform(0.4, 1.0),
-            international_interest=random.uniform(0.3, 0.9),
-            coordination_complexity=random.uniform(0.5, 0.95),
-            historical_precedent=random.choice([True, False])
-        )
+        if self.worker.busy:
+            self.status_label.config(text="Still processing - please wait")
+            return
         
         # Reset network and start processing
-        self.reset_network()
+        disaster = generate_disaster()
+        self.selected_node = None
+        self.status_label.config(text=f"Dispatching: {disaster.disaster_type} in {disaster.location['district']}")
+        self.worker.submit(self._start_disaster, disaster,
+                           on_done=self._disaster_started, on_error=self._engine_failed)
+
+    def _start_disaster(self, disaster: DisasterEvent) -> DisasterEvent:
+        """Worker thread: reset the network and feed it the disaster"""
+        self.engine.reset_network(clear_incidents=False)
         self.engine.process_disaster_event(disaster)
-        
+        return disaster
+
+    def _disaster_started(self, disaster: DisasterEvent):
         self.status_label.config(text=f"Processing: {disaster.disaster_type} in {disaster.location['district']}")
         
         # Update status display
-        self.update_status_display()
+        self.redraw()
         
     def process_network_step(self):
         """Process one step of the neural network"""
+        if self.worker.busy:
+            return
+        self.worker.submit(self._network_step, on_done=self._network_stepped, on_error=self._engine_failed)
+
+    def _network_step(self) -> bool:
+        """Worker thread: process one node; False once the network has settled"""
         if self.engine.process_network_step():
+            return True
+        self.engine.network_active = False
+        return False
+
+    def _network_stepped(self, active: bool):
+        if active:
             self.status_label.config(text="Network processing... click again to continue")
         else:
             self.status_label.config(text="Network processing complete - all nodes processed")
-            self.engine.network_active = False
             
-        self.update_status_display()
-        self.draw_network()
+        self.redraw()
         
     def reset_network(self):
         """Reset the neural network to initial state"""
-        for node in self.engine.nodes.values():
-            node.state = NodeState.INACTIVE
-            node.throughput = 0
-            node.data.clear()
-            
-        self.engine.active_flows.clear()
-        self.engine.processing_queue.clear()
-        self.engine.network_active = False
-        self.engine.current_disaster = None
+        if self.worker.busy:
+            self.status_label.config(text="Still processing - please wait")
+            return
         self.selected_node = None
-        
+        self.worker.submit(self.engine.reset_network, on_done=self._network_reset, on_error=self._engine_failed)
+
+    def _network_reset(self, _):
         self.status_label.config(text="Network reset - ready for new disaster simulation")
-        self.update_status_display()
-        self.draw_network()
+        self.redraw()
+
+    def toggle_auto_run(self):
+        """Start or stop continuous processing; settled networks restart with a new disaster"""
+        if self.auto_running:
+            # The slice in flight finishes, and its callback draws the final frame
+            self.auto_running = False
+            self.auto_run_button.config(text="Auto Run")
+            return
+        if self.worker.busy:
+            self.status_label.config(text="Still processing - please wait")
+            return
+        self.auto_running = True
+        self.auto_run_button.config(text="Stop Auto Run")
+        self.status_label.config(text="Auto-run active - processing continuously")
+        self.rate_window_start = time.perf_counter()
+        self.window_steps = self.window_frames = 0
+        self._submit_slice()
+
+    def _submit_slice(self):
+        self.worker.submit(self._run_slice, self.frame_interval,
+                           on_done=self._slice_done, on_error=self._auto_run_failed)
+
+    def _run_slice(self, seconds: float) -> Tuple[int, Optional[DisasterEvent], NetworkFrame]:
+        """Worker thread: process nodes for seconds, starting a new disaster whenever the
+        network settles; (nodes processed, last disaster started if any, frame to draw)"""
+        engine = self.engine
+        started = None
+        deadline = time.perf_counter() + seconds
+        steps = 0
+        while time.perf_counter() < deadline:
+            if not (engine.processing_queue and engine.network_active):
+                started = generate_disaster()
+                engine.reset_network(clear_incidents=False)
+                engine.process_disaster_event(started)
+            engine.process_network_step()
+            steps += 1
+        if not engine.processing_queue:
+            engine.network_active = False
+        return steps, started, engine.capture_frame()
+
+    def _slice_done(self, result: Tuple[int, Optional[DisasterEvent], NetworkFrame]):
+        steps, started, frame = result
+        if self.auto_running:
+            # The engine runs the next slice while Tk renders this one's frame
+            self._submit_slice()
+        self.window_steps += steps
+        if started is not None:
+            self.selected_node = None
+            self.status_label.config(text=f"Auto-run: {started.disaster_type} in {started.location['district']}")
+
+        self.update_status_display(frame)
+        self.draw_network(frame)
+        self.window_frames += 1
+
+        now = time.perf_counter()
+        elapsed = now - self.rate_window_start
+        if elapsed >= 1.0 or not self.auto_running:
+            self.rate_label.config(text=f"Engine: {self.window_steps / elapsed:,.0f} steps/s | "
+                                        f"Render: {self.window_frames / elapsed:.1f} fps")
+            self.rate_window_start = now
+            self.window_steps = self.window_frames = 0
+
+        if not self.auto_running:
+            self.status_label.config(text="Auto-run stopped")
+
+    def _auto_run_failed(self, error: Exception):
+        self.auto_running = False
+        self.auto_run_button.config(text="Auto Run")
+        self._engine_failed(error)
+
+    def _engine_failed(self, error: Exception):
+        self.status_label.config(text=f"Engine error: {error}")
+        self.redraw()
+        
+    def redraw(self):
+        """Draw straight from the engine; only while the worker is idle"""
+        frame = self.engine.capture_frame()
+        self.update_status_display(frame)
+        self.draw_network(frame)
         
-    def update_status_display(self):
+    def update_status_display(self, frame: NetworkFrame):
         """Update the network status display"""
-        status = self.engine.get_network_status()
+        status = frame.status
         
         status_text = f"""RELIEF GRID NEURAL ENGINE STATUS
 {'='*50}
@@ -890,6 +1582,7 @@ NETWORK OVERVIEW:
 • Active Nodes: {status['active_nodes']}/{status['total_nodes']}
 • Processing Queue: {status['processing_queue_length']} pending
 • Active Data Flows: {status['active_flows']}
+• Total Data Flows: {status['total_flows']}
 • Total Network Throughput: {status['total_throughput']} operations
 
 PERFORMANCE METRICS:
@@ -904,17 +1597,11 @@ CURRENT DISASTER:
 NODES BY STATE:
 """
         
-        # Count nodes by state
-        state_counts = {}
-        for node in self.engine.nodes.values():
-            state = node.state.value.title()
-            state_counts[state] = state_counts.get(state, 0) + 1
-            
-        for state, count in state_counts.items():
-            status_text += f"• {state}: {count} nodes\n"
+        for state, count in status['state_counts'].items():
+            status_text += f"• {state.title()}: {count} nodes\n"
             
-        if self.engine.current_disaster:
-            disaster = self.engine.current_disaster
+        if frame.disaster:
+            disaster = frame.disaster
             status_text += f"""
 
 DISASTER DETAILS:
@@ -948,7 +1635,9 @@ DISASTER DETAILS:
     def animate(self):
         """Animation loop for real-time updates"""
         if self.animation_active:
-            self.draw_network()
+            # Engine state belongs to the worker while it is busy; its callbacks redraw
+            if not self.worker.busy:
+                self.draw_network(self.engine.capture_frame())
             # Update every 500ms for smooth animation
             self.root.after(500, self.animate)
             
@@ -960,6 +1649,8 @@ DISASTER DETAILS:
     def on_closing(self):
         """Handle application closing"""
         self.animation_active = False
+        self.auto_running = False
+        self.worker.shutdown()
         self.root.destroy()
 
 if __name__ == "__main__":
@@ -967,5 +1658,19 @@ if __name__ == "__main__":
     print("Advanced humanitarian response coordination with AI-powered decision making")
     print("Click nodes to see detailed analysis | Use controls to simulate disaster scenarios")
     
-    app = ReliefGridNeuralUI()
+    parser = argparse.ArgumentParser(description="Relief Grid neural decision engine UI")
+    parser.add_argument("topology", nargs="?", help="topology file to load instead of the built-in network")
+    parser.add_argument("--fps", type=float, default=30.0, help="redraw cap while auto-running")
+    parser.add_argument("--auto-run", action="store_true", help="start processing continuously (soak test)")
+    args = parser.parse_args()
+    
+    topology = None
+    if args.topology:
+        from topology import load_topology
+        topology = load_topology(args.topology)
+        print(f"Loaded topology with {len(topology):,} nodes from {args.topology}")
+    
+    app = ReliefGridNeuralUI(topology, max_fps=args.fps)
+    if args.auto_run:
+        app.toggle_auto_run()
     app.run()
\ No newline at end of file
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Outcome Log
+Append-only, columnar on-disk log of funnel outcomes. Rows are buffered in typed NumPy
+arrays and written in chunks, one .npy file per column, so a reader can memory-map any
+column of any chunk and scan far more rows than fit in memory.
+
+Layout:
+    <log>/manifest.json              columns, chunk row counts, category vocabularies
+    <log>/chunk_000000/<column>.npy  one array per column
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from funnel import FunnelStage
+
+FORMAT_VERSION = 1
+CATEGORY = "category"  # strings stored as int32 codes into a per-log vocabulary
+
+STAGES = list(FunnelStage)
+
+# Score column written for each stage that produces a score
+SCORE_COLUMNS = {
+    FunnelStage.DISASTER_OCCURS: "detection_probability",
+    FunnelStage.VERIFICATION: "verification_score",
+    FunnelStage.DATA_GATHERING: "data_completeness",
+    FunnelStage.SITUATION_ASSESSMENT: "severity_score",
+    FunnelStage.LOCAL_SUPPORT_ASSESSMENT: "local_capacity",
+    FunnelStage.DIRECTOR_APPROVAL: "approval_score"
+}
+
+OUTCOME_COLUMNS = {
+    "case_index": "int64",
+    "exit_stage": "int8",  # index into list(FunnelStage)
+    "mobilized": "bool",
+    "reason": CATEGORY,  # exit message without its embedded score
+    "disaster_type": CATEGORY,
+    "country": CATEGORY,
+    "security_level": CATEGORY,
+    "magnitude": "float64",
+    "affected_population": "int64",
+    "casualty_estimate": "int64",
+    "infrastructure_damage": "float64",
+    "accessibility": "float64",
+    "report_count": "int32",
+    **{column: "float64" for column in SCORE_COLUMNS.values()}  # NaN for stages not reached
+}
+
+def _empty(dtype: str, capacity: int) -> np.ndarray:
+    if dtype == CATEGORY:
+        return np.zeros(capacity, dtype=np.int32)
+    if np.dtype(dtype).kind == "f":
+        return np.full(capacity, np.nan, dtype=dtype)
+    return np.zeros(capacity, dtype=dtype)
+
+# ===== BUFFERING =====
+class OutcomeBuffer:
+    """Fixed-capacity columnar row buffer with its own category vocabularies.
+
+    Worker processes fill one of these and ship it back whole; the writer remaps
+    its category codes into the log's vocabulary.
+    """
+
+    def __init__(self, capacity: int = 65536):
+        self.capacity = capacity
+        self.rows = 0
+        self.arrays = {name: _empty(dtype, capacity) for name, dtype in OUTCOME_COLUMNS.items()}
+        self.vocabularies: Dict[str, Dict[str, int]] = {
+            name: {} for name, dtype in OUTCOME_COLUMNS.items() if dtype == CATEGORY}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def full(self) -> bool:
+        return self.rows >= self.capacity
+
+    def append(self, row: Mapping[str, Any]):
+        """Add one row; columns missing from it keep their default (NaN or 0)"""
+        if self.full:
+            raise ValueError("OutcomeBuffer is full")
+        index = self.rows
+        for name, value in row.items():
+            vocabulary = self.vocabularies.get(name)
+            if vocabulary is not None:
+                value = vocabulary.setdefault(value, len(vocabulary))
+            self.arrays[name][index] = value
+        self.rows += 1
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {name: values[:self.rows] for name, values in self.arrays.items()}
+
+    def clear(self):
+        self.rows = 0
+        for name, dtype in OUTCOME_COLUMNS.items():
+            self.arrays[name][:] = _empty(dtype, 1)[0]
+        for vocabulary in self.vocabularies.values():
+            vocabulary.clear()
+
+# ===== WRITING =====
+class OutcomeLogWriter:
+    """Appends rows to a log directory, flushing one chunk every chunk_rows rows.
+
+    Opening an existing log continues it. The manifest is rewritten atomically after
+    each chunk, so readers only ever see complete chunks.
+    """
+
+    def __init__(self, path: str, chunk_rows: int = 65536):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        os.makedirs(path, exist_ok=True)
+        manifest_path = os.path.join(path, "manifest.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                self.manifest = json.load(f)
+            if self.manifest["columns"] != OUTCOME_COLUMNS:
+                raise ValueError(f"{path} was written with a different column layout")
+        else:
+            self.manifest = {"version": FORMAT_VERSION, "columns": OUTCOME_COLUMNS, "chunks": [],
+                             "categories": {name: [] for name, dtype in OUTCOME_COLUMNS.items() if dtype == CATEGORY}}
+        self.codes = {name: {value: code for code, value in enumerate(values)}
+                      for name, values in self.manifest["categories"].items()}
+        self.buffer = OutcomeBuffer(chunk_rows)
+
+    def append(self, row: Mapping[str, Any]):
+        """Append one row; columns missing from it keep their default (NaN or 0)"""
+        index = self.buffer.rows
+        for name, value in row.items():
+            self.buffer.arrays[name][index] = self._code(name, value) if name in self.codes else value
+        self.buffer.rows += 1
+        if self.buffer.full:
+            self.flush()
+
+    def _code(self, name: str, value: str) -> int:
+        codes = self.codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self.manifest["categories"][name].append(value)
+        return code
+
+    def extend(self, batch: OutcomeBuffer):
+        """Append every row of a worker's buffer"""
+        columns = batch.columns()
+        for name, vocabulary in batch.vocabularies.items():
+            remap = np.zeros(max(len(vocabulary), 1), dtype=np.int32)
+            for value, code in vocabulary.items():
+                remap[code] = self._code(name, value)
+            columns[name] = remap[columns[name]]
+
+        start = 0
+        while start < batch.rows:
+            room = self.buffer.capacity - self.buffer.rows
+            stop = min(batch.rows, start + room)
+            at = self.buffer.rows
+            for name, values in columns.items():
+                self.buffer.arrays[name][at:at + stop - start] = values[start:stop]
+            self.buffer.rows += stop - start
+            start = stop
+            if self.buffer.full:
+                self.flush()
+
+    def flush(self):
+        """Write buffered rows as a new chunk"""
+        if not self.buffer.rows:
+            return
+        chunk = f"chunk_{len(self.manifest['chunks']):06d}"
+        # A chunk left behind by an interrupted flush is not in the manifest and is overwritten
+        os.makedirs(os.path.join(self.path, chunk), exist_ok=True)
+        for name, values in self.buffer.columns().items():
+            np.save(os.path.join(self.path, chunk, f"{name}.npy"), values)
+        self.manifest["chunks"].append({"name": chunk, "rows": self.buffer.rows})
+        self._write_manifest()
+        self.buffer.clear()
+
+    def _write_manifest(self):
+        staging = os.path.join(self.path, "manifest.json.tmp")
+        with open(staging, "w") as f:
+            json.dump(self.manifest, f)
+        os.replace(staging, os.path.join(self.path, "manifest.json"))
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self) -> "OutcomeLogWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# ===== READING =====
+class OutcomeLogReader:
+    """Memory-mapped access to an outcome log, chunk by chunk"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "manifest.json")) as f:
+            self.manifest = json.load(f)
+        if self.manifest["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported outcome log version {self.manifest['version']}")
+        self.columns = list(self.manifest["columns"])
+
+    def __len__(self) -> int:
+        return sum(chunk["rows"] for chunk in self.manifest["chunks"])
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self.manifest["chunks"])
+
+    def chunk(self, index: int, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Memory-mapped arrays for one chunk (nothing is read until the arrays are touched)"""
+        name = self.manifest["chunks"][index]["name"]
+        return {column: np.load(os.path.join(self.path, name, f"{column}.npy"), mmap_mode="r")
+                for column in (columns or self.columns)}
+
+    def scan(self, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """Iterate over every chunk's memory-mapped columns in write order"""
+        for index in range(self.chunk_count):
+            yield self.chunk(index, columns)
+
+    def read(self, column: str) -> np.ndarray:
+        """One whole column in memory - prefer scan() for very large logs"""
+        parts = [chunk[column] for chunk in self.scan([column])]
+        return np.concatenate(parts) if parts else _empty(self.manifest["columns"][column], 0)
+
+    def categories(self, column: str) -> List[str]:
+        return self.manifest["categories"][column]
+
+    def decode(self, column: str, codes: np.ndarray) -> np.ndarray:
+        """Category codes (or exit_stage indexes) back to their values"""
+        if column == "exit_stage":
+            return np.array(STAGES, dtype=object)[codes]
+        return np.array(self.categories(column), dtype=object)[codes]
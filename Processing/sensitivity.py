@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Weight Sensitivity
+How approval and verification pass rates move when the hand-picked scorer weights
+change. A fixed population of cases is reduced to an N x K matrix of unweighted factor
+terms once; every weight setting is then one column of a K x S matrix, and all S
+settings are scored in a single matrix product per chunk of cases.
+"""
+
+import argparse
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from funnel import STAGE_THRESHOLDS, CaseGenerator, FunnelStage
+from scoring import approval_columns, verification_columns
+
+@dataclass
+class ScoreModel:
+    """A linear scorer: factor terms, their baseline weights and the pass thresholds"""
+    name: str
+    factor_names: List[str]
+    baseline: np.ndarray
+    thresholds: Dict[str, float]  # outcome name -> score must be above this
+
+# Mirrors ReliefGridDecisionEngine._approval_factors with the weights pulled out
+APPROVAL_MODEL = ScoreModel(
+    name="approval",
+    factor_names=["mandate_alignment", "success_probability", "funding_available", "security_risk",
+                  "reputation_risk", "donor_interest", "media_attention", "operational_complexity",
+                  "political_sensitivity"],
+    baseline=np.array([20, 15, 15, 15, 10, 10, 5, 5, 5], dtype=np.float64),
+    thresholds={"approved": STAGE_THRESHOLDS[FunnelStage.DIRECTOR_APPROVAL][1],
+                "full_approval": STAGE_THRESHOLDS[FunnelStage.DIRECTOR_APPROVAL][0]}
+)
+
+# Mirrors ReliefGridDecisionEngine._verification_factors
+VERIFICATION_MODEL = ScoreModel(
+    name="verification",
+    factor_names=["satellite_imagery", "satellite_damage", "source_correlation", "government_confirm",
+                  "media_coverage", "social_verification", "expert_analysis", "pattern_match"],
+    baseline=np.array([0.25, 0.2, 0.2, 0.15, 0.1, 0.05, 0.1, 0.05], dtype=np.float64),
+    thresholds={"verified": STAGE_THRESHOLDS[FunnelStage.VERIFICATION][0],
+                "medium_confidence": STAGE_THRESHOLDS[FunnelStage.VERIFICATION][1]}
+)
+
+MODELS = {model.name: model for model in (APPROVAL_MODEL, VERIFICATION_MODEL)}
+
+# ===== FACTOR MATRICES =====
+def approval_factor_matrix(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """N x K unweighted approval terms from scoring.approval_columns"""
+    return np.column_stack([
+        columns["organizational_mandate_alignment"],
+        columns["success_probability"],
+        np.minimum(columns["funding_total"] / columns["total_estimated_cost"], 1),
+        1 - columns["security_risk_to_staff"],
+        1 - columns["reputation_risk_assessment"],
+        columns["donor_interest_likelihood"],
+        np.minimum(columns["media_attention_level"] / 50, 1),
+        1 - columns["operational_complexity"],
+        1 - columns["political_sensitivity_score"]
+    ]).astype(np.float64)
+
+def verification_factor_matrix(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """N x K unweighted verification terms from scoring.verification_columns"""
+    return np.column_stack([
+        columns["satellite_imagery_available"],
+        columns["satellite_damage_assessment"],
+        columns["multiple_source_correlation"],
+        columns["government_confirmation"],
+        columns["international_media_coverage"],
+        columns["social_media_verification_score"],
+        columns["expert_analysis_available"],
+        columns["historical_disaster_pattern_match"]
+    ]).astype(np.float64)
+
+# ===== WEIGHT SETTINGS =====
+def sample_weights(model: ScoreModel, settings: int, spread: float = 0.5,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """S x K weights: each baseline weight scaled by an independent factor in [1 - spread, 1 + spread]"""
+    rng = rng if rng is not None else np.random.default_rng()
+    scale = rng.uniform(1 - spread, 1 + spread, size=(settings, len(model.baseline)))
+    return scale * model.baseline
+
+def weight_grid(model: ScoreModel, levels: Dict[str, Sequence[float]]) -> np.ndarray:
+    """S x K weights for every combination of the given multipliers; unlisted factors keep their baseline"""
+    axes = [np.asarray(levels.get(name, [1.0]), dtype=np.float64) for name in model.factor_names]
+    mesh = np.meshgrid(*axes, indexing="ij")
+    return np.stack([m.ravel() for m in mesh], axis=1) * model.baseline
+
+def one_at_a_time(model: ScoreModel, step: float = 0.1) -> np.ndarray:
+    """2K x K weights: each factor's weight moved down then up by step, the rest at baseline"""
+    weights = np.tile(model.baseline, (2 * len(model.baseline), 1))
+    for factor in range(len(model.baseline)):
+        weights[2 * factor, factor] *= 1 - step
+        weights[2 * factor + 1, factor] *= 1 + step
+    return weights
+
+# ===== SWEEP =====
+def sweep(model: ScoreModel, factors: np.ndarray, weights: np.ndarray, chunk_rows: int = 1024,
+          dtype=np.float64) -> Dict[str, np.ndarray]:
+    """Pass rate of every outcome for every weight setting.
+
+    Scores are factors @ weights.T, computed chunk_rows cases at a time so the score
+    block stays cache-sized whatever the population size. float32 is roughly 1.5x
+    faster, at the cost of cases within float32 rounding of a threshold.
+    """
+    weights = np.atleast_2d(weights)
+    passed = {outcome: np.zeros(len(weights), dtype=np.int64) for outcome in model.thresholds}
+    factors = factors.astype(dtype, copy=False)
+    transposed = np.ascontiguousarray(weights.T, dtype=dtype)
+    for start in range(0, len(factors), chunk_rows):
+        scores = factors[start:start + chunk_rows] @ transposed
+        for outcome, threshold in model.thresholds.items():
+            passed[outcome] += np.count_nonzero(scores > threshold, axis=0)
+    return {outcome: count / max(len(factors), 1) for outcome, count in passed.items()}
+
+def factor_sensitivity(model: ScoreModel, factors: np.ndarray, step: float = 0.1) -> List[Dict]:
+    """Change in each pass rate when one factor's weight moves by -step and +step"""
+    baseline = sweep(model, factors, model.baseline)
+    rates = sweep(model, factors, one_at_a_time(model, step))
+    rows = []
+    for index, name in enumerate(model.factor_names):
+        row = {"factor": name, "baseline_weight": float(model.baseline[index])}
+        for outcome in model.thresholds:
+            row[f"{outcome}_down"] = float(rates[outcome][2 * index] - baseline[outcome][0])
+            row[f"{outcome}_up"] = float(rates[outcome][2 * index + 1] - baseline[outcome][0])
+        rows.append(row)
+    return rows
+
+# ===== POPULATIONS =====
+def generate_factors(model: ScoreModel, cases: int, seed: int = 0) -> np.ndarray:
+    """Factor matrix for a generated population of cases"""
+    generator = CaseGenerator(rng=random.Random(seed), reference_time=datetime(2025, 1, 1))
+    generator.generate_disaster()
+    if model is APPROVAL_MODEL:
+        return approval_factor_matrix(approval_columns(
+            [generator.generate_approval_factors() for _ in range(cases)]))
+    return verification_factor_matrix(verification_columns(
+        [generator.generate_verification_data() for _ in range(cases)]))
+
+def main():
+    parser = argparse.ArgumentParser(description="Sensitivity of funnel pass rates to scorer weights")
+    parser.add_argument("--model", choices=sorted(MODELS), default="approval")
+    parser.add_argument("--cases", type=int, default=100000)
+    parser.add_argument("--settings", type=int, default=1000, help="random weight settings to evaluate")
+    parser.add_argument("--spread", type=float, default=0.5, help="relative range each weight is varied over")
+    parser.add_argument("--step", type=float, default=0.1, help="one-at-a-time weight change")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--float32", action="store_true", help="score in single precision")
+    args = parser.parse_args()
+    dtype = np.float32 if args.float32 else np.float64
+
+    model = MODELS[args.model]
+    print(f"Generating {args.cases:,} cases...")
+    factors = generate_factors(model, args.cases, args.seed)
+
+    started = time.perf_counter()
+    baseline = sweep(model, factors, model.baseline)
+    weights = sample_weights(model, args.settings, args.spread, np.random.default_rng(args.seed))
+    rates = sweep(model, factors, weights, dtype=dtype)
+    elapsed = time.perf_counter() - started
+    print(f"Scored {args.settings:,} weight settings x {args.cases:,} cases in {elapsed:.2f}s")
+
+    for outcome in model.thresholds:
+        shifted = rates[outcome] - baseline[outcome][0]
+        print(f"\n{outcome}: baseline {baseline[outcome][0]:.2%}, "
+              f"range {rates[outcome].min():.2%} - {rates[outcome].max():.2%} "
+              f"(5th-95th percentile shift {np.percentile(shifted, 5):+.2%} / {np.percentile(shifted, 95):+.2%})")
+
+    print(f"\nOne weight at a time (+/-{args.step:.0%}):")
+    for row in factor_sensitivity(model, factors, args.step):
+        changes = "  ".join(f"{outcome} {row[f'{outcome}_down']:+.2%}/{row[f'{outcome}_up']:+.2%}"
+                            for outcome in model.thresholds)
+        print(f"  {row['factor']:<24} w={row['baseline_weight']:<5g} {changes}")
+
+if __name__ == "__main__":
+    main()
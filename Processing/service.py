@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Scoring Service
+Local HTTP/JSON front end to ReliefGridDecisionEngine for programmatic case submission.
+Requests that arrive within a few milliseconds of each other are coalesced into one
+micro-batch, and the stages with a vectorized scorer are scored in one NumPy call per
+stage.
+
+    POST /score   {"stage": "DIRECTOR_APPROVAL", "input": {...}}
+                  {"cases": [{"stage": ..., "input": ...}, ...]}
+    GET  /stats   request latency (p50/p99), scoring time and batch sizes
+    GET  /health
+
+Stage inputs are the fields of the stage's dataclass (DisasterEvent for DISASTER_OCCURS,
+a list of DisasterReport for DISASTER_REPORTED); datetimes are ISO 8601 strings.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, get_args, get_origin
+
+import numpy as np
+
+from funnel import (FINE_LATENCY_BUCKETS_US, STAGE_MESSAGES, DirectorApprovalFactors, DisasterEvent, DisasterReport,
+                    FunnelStage, LatencyHistogram, LocalSupportAssessment, MultiSourceData, NeedsVsWantsAnalysis,
+                    ReliefGridDecisionEngine, SituationAssessment, VerificationData)
+from calibration import PASS_RULES
+from scoring import (approval_columns, batch_approval_score, batch_local_capacity, batch_severity_score,
+                     batch_verification_score, local_capacity_columns, severity_columns, verification_columns)
+
+STAGE_INPUT_TYPES = {
+    FunnelStage.DISASTER_OCCURS: DisasterEvent,
+    FunnelStage.DISASTER_REPORTED: DisasterReport,  # the input is a list of these
+    FunnelStage.VERIFICATION: VerificationData,
+    FunnelStage.DATA_GATHERING: MultiSourceData,
+    FunnelStage.SITUATION_ASSESSMENT: SituationAssessment,
+    FunnelStage.NEEDS_VS_WANTS: NeedsVsWantsAnalysis,
+    FunnelStage.LOCAL_SUPPORT_ASSESSMENT: LocalSupportAssessment,
+    FunnelStage.DIRECTOR_APPROVAL: DirectorApprovalFactors
+}
+
+# Stages scored a whole micro-batch at a time: column extraction and the batch scorer
+VECTOR_SCORERS = {
+    FunnelStage.VERIFICATION: (verification_columns, batch_verification_score),
+    FunnelStage.SITUATION_ASSESSMENT: (severity_columns, batch_severity_score),
+    FunnelStage.LOCAL_SUPPORT_ASSESSMENT: (local_capacity_columns, batch_local_capacity),
+    FunnelStage.DIRECTOR_APPROVAL: (approval_columns, batch_approval_score)
+}
+
+# Names of the bands a stage's cut-offs split its scores into, in the order they are checked
+STAGE_BANDS = {
+    FunnelStage.VERIFICATION: ("verified", "medium_confidence", "low_confidence", "false_alarm"),
+    FunnelStage.DATA_GATHERING: ("sufficient", "insufficient"),
+    FunnelStage.SITUATION_ASSESSMENT: ("critical", "serious", "moderate", "low"),
+    FunnelStage.LOCAL_SUPPORT_ASSESSMENT: ("insufficient", "limited", "adequate"),
+    FunnelStage.DIRECTOR_APPROVAL: ("full", "limited", "conditional", "denied")
+}
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+class RequestError(ValueError):
+    """A malformed request; reported to the client as 400"""
+
+# ===== INPUT DECODING =====
+def _matches(annotation, value) -> bool:
+    """Whether a decoded JSON value fits a dataclass field annotation"""
+    origin = get_origin(annotation)
+    if origin is Union:  # Optional[...]
+        return any(_matches(arg, value) for arg in get_args(annotation))
+    if origin is list:
+        (item,) = get_args(annotation)
+        return isinstance(value, list) and all(_matches(item, v) for v in value)
+    if origin is tuple:  # JSON arrays
+        items = get_args(annotation)
+        return (isinstance(value, (list, tuple)) and len(value) == len(items)
+                and all(_matches(item, v) for item, v in zip(items, value)))
+    if origin is dict:
+        return isinstance(value, dict)
+    if annotation is type(None):
+        return value is None
+    if annotation is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if annotation is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, annotation)
+
+def _from_json(cls, data: Any):
+    if not isinstance(data, dict):
+        raise RequestError(f"{cls.__name__} must be a JSON object")
+    values = dict(data)
+    for f in fields(cls):
+        if f.name not in values:
+            continue  # reported by the constructor below
+        if f.type is datetime and isinstance(values[f.name], str):
+            try:
+                values[f.name] = datetime.fromisoformat(values[f.name])
+            except ValueError as e:
+                raise RequestError(f"{cls.__name__}.{f.name}: {e}") from None
+        # Checked here, so a bad case is rejected alone instead of failing the micro-batch it joins
+        if not _matches(f.type, values[f.name]):
+            expected = getattr(f.type, "__name__", str(f.type).replace("typing.", ""))
+            raise RequestError(f"{cls.__name__}.{f.name}: expected {expected}, "
+                               f"got {type(values[f.name]).__name__}")
+    try:
+        return cls(**values)
+    except TypeError as e:
+        raise RequestError(f"{cls.__name__}: {e}") from None
+
+def decode_case(case: Any) -> Tuple[FunnelStage, Any]:
+    """A {"stage": ..., "input": ...} object as (stage, stage input dataclass)"""
+    if not isinstance(case, dict) or "stage" not in case or "input" not in case:
+        raise RequestError('Each case needs "stage" and "input"')
+    try:
+        stage = FunnelStage[str(case["stage"]).upper()]
+    except KeyError:
+        raise RequestError(f"Unknown stage: {case['stage']}") from None
+    if stage not in STAGE_INPUT_TYPES:
+        raise RequestError(f"Stage has no processing step: {stage.name}")
+    if stage == FunnelStage.DISASTER_REPORTED:
+        if not isinstance(case["input"], list):
+            raise RequestError("DISASTER_REPORTED input must be a list of reports")
+        return stage, [_from_json(DisasterReport, report) for report in case["input"]]
+    return stage, _from_json(STAGE_INPUT_TYPES[stage], case["input"])
+
+def stage_bands(stage: FunnelStage, scores: np.ndarray, thresholds: Sequence[float]) -> np.ndarray:
+    """Index into STAGE_BANDS[stage] for each score, matching the engine's if/elif chain"""
+    cutoffs = np.asarray(thresholds, dtype=np.float64)[:, None]
+    if PASS_RULES[stage].below:
+        return np.count_nonzero(scores >= cutoffs, axis=0)
+    return np.count_nonzero(scores <= cutoffs, axis=0)
+
+# ===== SCORING =====
+class BatchScorer:
+    """Scores a mixed list of (stage, input) cases.
+
+    Stages in VECTOR_SCORERS are scored together per stage; the rest go through the
+    engine one case at a time, with its per-case state cleared after each.
+    """
+
+    def __init__(self, engine: Optional[ReliefGridDecisionEngine] = None):
+        self.engine = engine if engine is not None else ReliefGridDecisionEngine()
+
+    def __call__(self, cases: List[Tuple[FunnelStage, Any]]) -> List[Dict]:
+        results: List[Optional[Dict]] = [None] * len(cases)
+        by_stage: Dict[FunnelStage, List[int]] = {}
+        for index, (stage, stage_input) in enumerate(cases):
+            if stage in VECTOR_SCORERS:
+                by_stage.setdefault(stage, []).append(index)
+            else:
+                results[index] = self._evaluate(stage, stage_input)
+
+        for stage, indexes in by_stage.items():
+            columns, scorer = VECTOR_SCORERS[stage]
+            scores = scorer(**columns([cases[index][1] for index in indexes]))
+            bands = stage_bands(stage, scores, self.engine.thresholds[stage])
+            labels, messages = STAGE_BANDS[stage], STAGE_MESSAGES[stage]
+            for index, score, band in zip(indexes, scores.tolist(), bands.tolist()):
+                results[index] = {"stage": stage.name, "passed": band <= PASS_RULES[stage].index, "score": score,
+                                  "message": messages[band].format(score=score), "band": labels[band]}
+        return results
+
+    def _evaluate(self, stage: FunnelStage, stage_input: Any) -> Dict:
+        engine = self.engine
+        engine.current_funnel_stage = stage
+        try:
+            if stage == FunnelStage.DISASTER_OCCURS:
+                passed = engine.process_disaster_occurrence(stage_input)
+                message = "Disaster detected and reported" if passed else "Disaster occurred but was not detected"
+            else:
+                passed, message = engine.process_stage(stage, stage_input)
+            score = engine.stage_score(stage)
+        finally:
+            engine.funnel_data.clear()
+            engine.stage_results.clear()
+
+        result = {"stage": stage.name, "passed": passed, "score": score, "message": message}
+        if stage in STAGE_BANDS:
+            result["band"] = STAGE_BANDS[stage][int(stage_bands(stage, np.array([score]), engine.thresholds[stage])[0])]
+        return result
+
+class MicroBatcher:
+    """Coalesces cases submitted within max_delay of the first pending one into a single scorer call.
+
+    A batch is flushed early once it holds max_batch cases. Scoring runs on the event
+    loop, so max_batch also bounds how long one flush can hold up other requests.
+    """
+
+    def __init__(self, scorer: BatchScorer, max_delay: float = 0.002, max_batch: int = 1024):
+        self.scorer = scorer
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.pending: List[Tuple[List[Tuple[FunnelStage, Any]], asyncio.Future]] = []
+        self.pending_cases = 0
+        self.scoring = LatencyHistogram(FINE_LATENCY_BUCKETS_US)  # scorer time per flush
+        self.batch_sizes: Dict[int, int] = {}  # cases per flush -> flushes
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, cases: List[Tuple[FunnelStage, Any]]) -> List[Dict]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((cases, future))
+        self.pending_cases += len(cases)
+        if self.pending_cases >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+        return await future
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self.pending, self.pending_cases = self.pending, [], 0
+        if not batch:
+            return
+        flat = [case for cases, _ in batch for case in cases]
+        started = time.perf_counter_ns()
+        try:
+            results = self.scorer(flat)
+        except Exception:
+            # Rescore each request on its own so only those whose cases raise fail
+            outcomes = [self._score_alone(cases) for cases, _ in batch]
+        else:
+            outcomes, start = [], 0
+            for cases, _ in batch:
+                outcomes.append((True, results[start:start + len(cases)]))
+                start += len(cases)
+        self.scoring.record(time.perf_counter_ns() - started)
+        self.batch_sizes[len(flat)] = self.batch_sizes.get(len(flat), 0) + 1
+
+        for (_, future), (succeeded, value) in zip(batch, outcomes):
+            if future.done():  # the client may have gone away
+                continue
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def _score_alone(self, cases: List[Tuple[FunnelStage, Any]]) -> Tuple[bool, Any]:
+        try:
+            return True, self.scorer(cases)
+        except Exception as e:
+            return False, e
+
+    def snapshot(self) -> Dict:
+        flushes = sum(self.batch_sizes.values())
+        cases = sum(size * count for size, count in self.batch_sizes.items())
+        return {
+            "flushes": flushes,
+            "cases": cases,
+            "mean_batch": cases / flushes if flushes else 0.0,
+            "max_batch": max(self.batch_sizes, default=0),
+            "scoring": self.scoring.snapshot()
+        }
+
+# ===== HTTP =====
+class ScoringService:
+    """Minimal HTTP/1.1 server (keep-alive, Content-Length bodies) over asyncio streams"""
+
+    def __init__(self, batcher: MicroBatcher):
+        self.batcher = batcher
+        self.latency = LatencyHistogram(FINE_LATENCY_BUCKETS_US)  # request body received -> response ready
+        self.requests = 0
+        self.errors = 0
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8787) -> Tuple[str, int]:
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            # Idle keep-alive connections would otherwise linger; closing them ends their handlers
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "Request body too large"})
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._dispatch(method, path, body)
+                await self._respond(writer, status, payload)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/stats":
+            return 200, self.stats()
+        if path != "/score":
+            return 404, {"error": f"Not found: {path}"}
+        if method != "POST":
+            return 405, {"error": "Use POST"}
+
+        started = time.perf_counter_ns()
+        self.requests += 1
+        try:
+            request = json.loads(body)
+            if isinstance(request, dict) and "cases" in request:
+                if not isinstance(request["cases"], list):
+                    raise RequestError('"cases" must be a list')
+                results = await self.batcher.submit([decode_case(case) for case in request["cases"]])
+                payload = {"results": results}
+            else:
+                payload = {"result": (await self.batcher.submit([decode_case(request)]))[0]}
+        except (RequestError, json.JSONDecodeError, ValueError) as e:
+            self.errors += 1
+            return 400, {"error": str(e)}
+        except Exception as e:
+            self.errors += 1
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+        self.latency.record(time.perf_counter_ns() - started)
+        return 200, payload
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: Dict):
+        body = json.dumps(payload).encode()
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                  413: "Payload Too Large", 500: "Internal Server Error"}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+
+    def stats(self) -> Dict:
+        latency = self.latency.snapshot()
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency_p50_us": latency["p50_us"],
+            "latency_p99_us": latency["p99_us"],
+            "latency": latency,
+            "batching": self.batcher.snapshot()
+        }
+
+def load_thresholds(path: str) -> Dict[FunnelStage, Tuple[float, ...]]:
+    """Thresholds written by calibration.py --output"""
+    with open(path) as f:
+        return {FunnelStage[name]: tuple(values) for name, values in json.load(f).items()}
+
+async def serve(host: str, port: int, batcher: MicroBatcher, report_every: float):
+    service = ScoringService(batcher)
+    host, port = await service.start(host, port)
+    print(f"Relief Grid scoring service on http://{host}:{port}")
+    try:
+        while True:
+            await asyncio.sleep(report_every)
+            if service.requests:
+                stats = service.stats()
+                print(f"{stats['requests']:,} requests, p50 {stats['latency_p50_us']:.0f}us, "
+                      f"p99 {stats['latency_p99_us']:.0f}us, mean batch {stats['batching']['mean_batch']:.1f} cases")
+    finally:
+        await service.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON scoring service with request micro-batching")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="how long a batch waits for more requests")
+    parser.add_argument("--max-batch", type=int, default=1024, help="cases that flush a batch immediately")
+    parser.add_argument("--thresholds", help="stage cut-offs from calibration.py --output")
+    parser.add_argument("--report-every", type=float, default=10.0, help="seconds between latency reports")
+    args = parser.parse_args()
+
+    engine = ReliefGridDecisionEngine(thresholds=load_thresholds(args.thresholds) if args.thresholds else None)
+    batcher = MicroBatcher(BatchScorer(engine), args.max_delay_ms / 1000, args.max_batch)
+    try:
+        asyncio.run(serve(args.host, args.port, batcher, args.report_every))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
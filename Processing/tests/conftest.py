@@ -0,0 +1,16 @@
+import os
+import random
+import sys
+from datetime import datetime
+
+import pytest
+
+# The modules live flat in Processing/, next to this tests/ directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from funnel import CaseGenerator  # noqa: E402
+
+@pytest.fixture
+def generator() -> CaseGenerator:
+    """Seeded, eager generator with a pinned clock"""
+    return CaseGenerator(rng=random.Random(1234), reference_time=datetime(2025, 1, 1), lazy=False)
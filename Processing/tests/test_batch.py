@@ -0,0 +1,61 @@
+"""Seeded batches are reproducible, and any case can be replayed on its own"""
+
+import os
+
+import numpy as np
+import pytest
+
+from batch import main, replay_case, run_batch
+from runlog import SCORE_COLUMNS, STAGES, OutcomeLogReader
+
+SEED = 42
+CASES = 300
+# Fields that describe the run rather than its outcome
+RUN_FIELDS = ("workers", "chunk_size", "elapsed_seconds", "cases_per_second", "completed_at", "outcome_log")
+
+def _outcome(summary):
+    return {key: value for key, value in summary.items() if key not in RUN_FIELDS}
+
+@pytest.fixture(scope="module")
+def logged_batch(tmp_path_factory):
+    path = os.path.join(tmp_path_factory.mktemp("batch"), "log")
+    summary = run_batch(CASES, workers=1, chunk_size=64, seed=SEED, log_path=path)
+    return summary, OutcomeLogReader(path)
+
+def test_same_outcome_for_any_worker_count(logged_batch):
+    summary, _ = logged_batch
+    sharded = run_batch(CASES, workers=2, chunk_size=37, seed=SEED)
+    assert _outcome(sharded) == _outcome(summary)
+
+def test_replay_reproduces_logged_cases(logged_batch):
+    _, reader = logged_batch
+    exits = reader.read("exit_stage")
+    mobilized = reader.read("mobilized")
+    reasons = reader.decode("reason", reader.read("reason"))
+    scores = {column: reader.read(column) for column in SCORE_COLUMNS.values()}
+    for case_index in (0, 1, 17, 150, CASES - 1):
+        row = {}
+        outcome = replay_case(SEED, case_index, row=row)
+        assert STAGES.index(outcome.exit_stage) == exits[case_index]
+        assert outcome.mobilized == mobilized[case_index]
+        assert outcome.reason == reasons[case_index]
+        for column, values in scores.items():
+            if column in row:
+                assert row[column] == values[case_index]
+            else:
+                assert np.isnan(values[case_index])
+
+def test_replay_depends_on_seed():
+    rows = [{}, {}, {}]
+    replay_case(SEED, 5, row=rows[0])
+    replay_case(SEED, 5, row=rows[1])
+    replay_case(SEED + 1, 5, row=rows[2])
+    assert rows[0] == rows[1]
+    assert rows[0] != rows[2]
+
+def test_replay_command_line(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["batch.py", "--seed", str(SEED), "--replay", "17"])
+    main()
+    outcome = replay_case(SEED, 17)
+    assert capsys.readouterr().out.strip() == (
+        f"Case 17 (seed {SEED}): exited at {outcome.exit_stage.value} - {outcome.message}")
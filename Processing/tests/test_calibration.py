@@ -0,0 +1,67 @@
+"""The calibrator's predictions match what a real batch does"""
+
+import math
+import os
+
+import numpy as np
+import pytest
+
+from batch import run_batch
+from calibration import PASS_RULES, FunnelCalibrator, ScoreDistribution, with_cutoff
+from funnel import STAGE_THRESHOLDS, FunnelStage
+from runlog import OutcomeLogReader
+
+SEED = 5
+CASES = 20000
+
+@pytest.fixture(scope="module")
+def batch(tmp_path_factory):
+    path = os.path.join(tmp_path_factory.mktemp("calibration"), "log")
+    summary = run_batch(CASES, workers=1, chunk_size=5000, seed=SEED, log_path=path)
+    return summary, OutcomeLogReader(path)
+
+def test_log_calibrator_reproduces_batch(batch):
+    summary, reader = batch
+    calibrator = FunnelCalibrator.from_log(reader)
+    rates = calibrator.pass_rates()
+    for stage in summary["stages"]:
+        assert rates[FunnelStage(stage["stage"])] == pytest.approx(stage["pass_rate"], abs=1e-12)
+    assert calibrator.throughput() == pytest.approx(summary["mobilization_rate"], abs=1e-12)
+
+def test_generated_calibrator_predicts_batch(batch):
+    summary, _ = batch
+    calibrator = FunnelCalibrator.generate(CASES, seed=SEED)
+    rates = calibrator.pass_rates()
+    for stage in summary["stages"]:
+        # Both sides are samples; allow four standard errors of the batch's estimate
+        rate, reached = stage["pass_rate"], stage["reached"]
+        tolerance = 4 * math.sqrt(rate * (1 - rate) / reached) + 0.01
+        assert rates[FunnelStage(stage["stage"])] == pytest.approx(rate, abs=tolerance)
+    assert calibrator.throughput() == pytest.approx(summary["mobilization_rate"], rel=0.2)
+
+def test_solve_hits_target(batch):
+    _, reader = batch
+    calibrator = FunnelCalibrator.from_log(reader)
+    target = calibrator.throughput() / 2
+    assert calibrator.throughput(calibrator.solve(target)) == pytest.approx(target, rel=0.05)
+
+def test_distribution_pass_rate_and_bands():
+    scores = np.array([0.1, 0.2, 0.2, 0.5, 0.9, np.nan])
+    verification = ScoreDistribution(FunnelStage.VERIFICATION, scores)
+    assert len(verification) == 5  # NaN marks a stage the case never reached
+    assert verification.pass_rate(0.2) == pytest.approx(2 / 5)  # strictly above
+    np.testing.assert_allclose(verification.bands((0.8, 0.4, 0.15)), [0.2, 0.2, 0.4, 0.2])
+    local = ScoreDistribution(FunnelStage.LOCAL_SUPPORT_ASSESSMENT, scores)
+    assert local.pass_rate(0.2) == pytest.approx(1 / 5)  # strictly below
+    for rate in (0.0, 0.2, 0.4, 1.0):
+        assert verification.pass_rate(verification.cutoff_for(rate)) == pytest.approx(rate)
+    # The two 0.2 scores pass or fail together, so 0.6 lands on a neighbouring rate
+    assert verification.pass_rate(verification.cutoff_for(0.6)) in (pytest.approx(0.4), pytest.approx(0.8))
+
+@pytest.mark.parametrize("stage", list(PASS_RULES))
+def test_with_cutoff_keeps_bands_ordered(stage):
+    thresholds = STAGE_THRESHOLDS[stage]
+    for cutoff in (min(thresholds) / 2, max(thresholds) * 2):
+        adjusted = with_cutoff(stage, thresholds, cutoff)
+        assert adjusted[PASS_RULES[stage].index] == cutoff
+        assert list(adjusted) == sorted(adjusted, reverse=not PASS_RULES[stage].below)
@@ -0,0 +1,56 @@
+"""CaseStore round-trips lazy and eager cases back to the original dataclasses"""
+
+import dataclasses
+import random
+from datetime import datetime
+
+import pytest
+
+from casestore import CaseStore, CategoryColumn, NumericDictColumn
+from funnel import CaseGenerator, DirectorApprovalFactors
+
+CASES = 300
+
+def _cases(lazy: bool):
+    """(case id, record) pairs covering every dataclass with a schema"""
+    generator = CaseGenerator(rng=random.Random(99), reference_time=datetime(2025, 1, 1), lazy=lazy)
+    records = []
+    for case_id in range(CASES):
+        records.append((case_id, generator.generate_disaster()))
+        records.extend((case_id, report) for report in generator.generate_disaster_reports())
+        records.append((case_id, generator.generate_verification_data()))
+        records.append((case_id, generator.generate_situation_assessment()))
+        records.append((case_id, generator.generate_local_assessment()))
+        records.append((case_id, generator.generate_approval_factors()))
+    return records
+
+@pytest.mark.parametrize("lazy", [True, False], ids=["lazy", "eager"])
+def test_round_trip(lazy):
+    store = CaseStore()
+    records = _cases(lazy)
+    for case_id, record in records:
+        store.add(case_id, record)
+    for record_type in {type(record) for _, record in records}:
+        for case_id in (0, CASES // 2, CASES - 1):
+            expected = [record for owner, record in records if owner == case_id and type(record) is record_type]
+            assert store.records_for(case_id, record_type) == expected
+
+def test_mismatched_dict_keys_fall_back_to_objects(generator):
+    store = CaseStore()
+    records = [generator.generate_approval_factors() for _ in range(20)]
+    records.insert(10, dataclasses.replace(records[10], funding_source_availability={
+        "emergency_fund": 1000.0, "private_foundation": 2500.0}))
+    for case_id, record in enumerate(records):
+        store.add(case_id, record)
+    table = store.table(DirectorApprovalFactors)
+    assert isinstance(table.columns["funding_source_availability"], CategoryColumn)
+    assert isinstance(table.columns["staff_availability"], NumericDictColumn)
+    assert [row.to_dataclass() for row in table] == records
+
+def test_nbytes_counts_vocabulary():
+    column = CategoryColumn()
+    empty = column.nbytes
+    column.set(0, {"country": "Haiti", "coordinates": (18.5, -72.3)})
+    assert column.nbytes > empty == column.data.nbytes
+    column.set(1, {"country": "Haiti", "coordinates": (18.5, -72.3)})
+    assert len(column.vocabulary) == 1
@@ -0,0 +1,49 @@
+"""Batch scorers must be bit-identical to the engine's scalar scorers"""
+
+import random
+
+import numpy as np
+
+from funnel import ReliefGridDecisionEngine
+from scoring import (approval_columns, batch_approval_score, batch_detection_probability,
+                     batch_local_capacity, batch_severity_score, batch_verification_score,
+                     detection_columns, local_capacity_columns, severity_columns,
+                     verification_columns)
+
+CASES = 500
+
+def _scalar(scorer, items) -> np.ndarray:
+    return np.array([scorer(item) for item in items], dtype=np.float64)
+
+def test_detection_probability(generator):
+    disasters = [generator.generate_disaster() for _ in range(CASES)]
+    engine = ReliefGridDecisionEngine(rng=random.Random(7))
+    expected = _scalar(engine._calculate_detection_probability, disasters)
+    # The scalar scorer draws media presence from the engine's RNG; replay the same draws
+    draws = random.Random(7)
+    media_presence = [draws.uniform(0.3, 0.9) for _ in range(CASES)]
+    actual = batch_detection_probability(**detection_columns(disasters), media_presence=media_presence)
+    np.testing.assert_array_equal(actual, expected)
+
+def test_verification_score(generator):
+    items = [generator.generate_verification_data() for _ in range(CASES)]
+    expected = _scalar(ReliefGridDecisionEngine()._calculate_verification_score, items)
+    np.testing.assert_array_equal(batch_verification_score(**verification_columns(items)), expected)
+
+def test_severity_score(generator):
+    items = []
+    for _ in range(CASES):
+        generator.generate_disaster()
+        items.append(generator.generate_situation_assessment())
+    expected = _scalar(ReliefGridDecisionEngine()._calculate_severity_score, items)
+    np.testing.assert_array_equal(batch_severity_score(**severity_columns(items)), expected)
+
+def test_local_capacity(generator):
+    items = [generator.generate_local_assessment() for _ in range(CASES)]
+    expected = _scalar(ReliefGridDecisionEngine()._calculate_local_capacity, items)
+    np.testing.assert_array_equal(batch_local_capacity(**local_capacity_columns(items)), expected)
+
+def test_approval_score(generator):
+    items = [generator.generate_approval_factors() for _ in range(CASES)]
+    expected = _scalar(ReliefGridDecisionEngine()._calculate_approval_score, items)
+    np.testing.assert_array_equal(batch_approval_score(**approval_columns(items)), expected)
@@ -0,0 +1,87 @@
+"""Scored stages record what they decided from and exit through the configured cut-offs"""
+
+import random
+
+import pytest
+
+from calibration import PASS_RULES
+from funnel import (STAGE_MESSAGES, STAGE_THRESHOLDS, FunnelStage, ReliefGridDecisionEngine,
+                    StageResult)
+
+SCORERS = {
+    FunnelStage.VERIFICATION: "_calculate_verification_score",
+    FunnelStage.DATA_GATHERING: "_assess_data_completeness",
+    FunnelStage.SITUATION_ASSESSMENT: "_calculate_severity_score",
+    FunnelStage.LOCAL_SUPPORT_ASSESSMENT: "_calculate_local_capacity",
+    FunnelStage.DIRECTOR_APPROVAL: "_calculate_approval_score"
+}
+
+def _band(stage: FunnelStage, score: float, thresholds) -> int:
+    """Index of the band a score falls in, in the order the stage checks its cut-offs"""
+    below = PASS_RULES[stage].below
+    for index, cutoff in enumerate(thresholds):
+        if (score < cutoff) if below else (score > cutoff):
+            return index
+    return len(thresholds)
+
+def _input_key(stage: FunnelStage) -> str:
+    return {
+        FunnelStage.VERIFICATION: "verification",
+        FunnelStage.DATA_GATHERING: "multi_source_data",
+        FunnelStage.SITUATION_ASSESSMENT: "situation_assessment",
+        FunnelStage.LOCAL_SUPPORT_ASSESSMENT: "local_support",
+        FunnelStage.DIRECTOR_APPROVAL: "approval_factors"
+    }[stage]
+
+def _run(engine: ReliefGridDecisionEngine, generator, stage: FunnelStage):
+    generator.generate_disaster()
+    engine.current_funnel_stage = stage
+    return engine.process_stage(stage, generator.generate_stage_input(stage))
+
+def test_every_band_has_a_message():
+    assert set(STAGE_MESSAGES) == set(STAGE_THRESHOLDS) == set(PASS_RULES)
+    for stage, thresholds in STAGE_THRESHOLDS.items():
+        assert len(STAGE_MESSAGES[stage]) == len(thresholds) + 1
+
+@pytest.mark.parametrize("stage", list(SCORERS))
+def test_result_matches_scorer_and_message(stage, generator):
+    engine = ReliefGridDecisionEngine(rng=random.Random(3))
+    for _ in range(200):
+        passed, message = _run(engine, generator, stage)
+        result = engine.stage_results[stage]
+        assert isinstance(result, StageResult) and result.stage == stage
+        assert result.score == getattr(engine, SCORERS[stage])(engine.funnel_data[_input_key(stage)])
+        band = _band(stage, result.score, STAGE_THRESHOLDS[stage])
+        assert message == STAGE_MESSAGES[stage][band].format(score=result.score)
+        assert passed == (band <= PASS_RULES[stage].index)
+
+@pytest.mark.parametrize("stage", list(SCORERS))
+def test_custom_thresholds_move_the_exit(stage, generator):
+    rule = PASS_RULES[stage]
+    # Put every cut-off beyond any score so nothing passes, then so everything does
+    closed = tuple(float("-inf") if rule.below else float("inf") for _ in STAGE_THRESHOLDS[stage])
+    opened = tuple(float("inf") if rule.below else float("-inf") for _ in STAGE_THRESHOLDS[stage])
+    for thresholds, expected in ((closed, False), (opened, True)):
+        engine = ReliefGridDecisionEngine(rng=random.Random(3), thresholds={stage: thresholds})
+        assert engine.thresholds[stage] == thresholds
+        for _ in range(50):
+            passed, message = _run(engine, generator, stage)
+            assert passed is expected
+            band = len(thresholds) if not expected else 0
+            assert message == STAGE_MESSAGES[stage][band].format(score=engine.stage_score(stage))
+
+def test_unscored_stage_records_factors(generator):
+    engine = ReliefGridDecisionEngine(rng=random.Random(3))
+    assert engine.stage_score(FunnelStage.DISASTER_REPORTED) is None
+    generator.generate_disaster()
+    engine.process_disaster_reporting(generator.generate_disaster_reports())
+    result = engine.stage_results[FunnelStage.DISASTER_REPORTED]
+    assert result.score is None
+    assert result.factors["total_reports"] >= 0
+    assert "duplicates_collapsed" in result.factors
+
+def test_detection_records_its_probability(generator):
+    engine = ReliefGridDecisionEngine(rng=random.Random(3))
+    engine.process_disaster_occurrence(generator.generate_disaster())
+    result = engine.stage_results[FunnelStage.DISASTER_OCCURS]
+    assert result.score == sum(result.factors.values()) / len(result.factors)
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Network Topologies
+Load and save ReliefGridNeuralEngine graphs as JSON or as a compact binary format,
+with successors held in compressed-sparse-row (CSR) form.
+
+JSON layout:
+    {"nodes": [{"id": ..., "name": ..., "type": "input", "position": [x, y]}, ...],
+     "edges": [["from_id", "to_id"], ...]}
+
+Binary layout (.rgt, little-endian):
+    header    b"RGTP", version u16, node count u32, edge count u32
+    node type u8[N], positions f32[2N], indptr u32[N + 1], indices u32[E]
+    strings   u32 byte length + UTF-8 text of ids and names, each joined by "\\n"
+"""
+
+import argparse
+import json
+import random
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Sequence, Tuple
+
+from neural import CSRAdjacency, NodeType, ReliefGridNeuralEngine
+
+MAGIC = b"RGTP"
+VERSION = 1
+_HEADER = struct.Struct("<4sHII")
+
+# Stable type codes for the binary format
+NODE_TYPE_CODES = {node_type: code for code, node_type in enumerate(NodeType)}
+NODE_TYPES = list(NodeType)
+
+class Topology:
+    """A network graph: node attributes in flat arrays plus CSR successors"""
+
+    def __init__(self, node_ids: List[str], names: List[str], node_types: array,
+                 positions: array, adjacency: CSRAdjacency):
+        self.node_ids = node_ids
+        self.names = names
+        self.node_types = node_types  # array("B") of NODE_TYPE_CODES
+        self.positions = positions  # array("f") of x, y pairs
+        self.adjacency = adjacency
+
+    @classmethod
+    def from_nodes_and_edges(cls, nodes: Sequence[Tuple[str, str, NodeType, Tuple[float, float]]],
+                             edges: Iterable[Tuple[str, str]]) -> "Topology":
+        """Build from (id, name, type, position) tuples and (from, to) pairs"""
+        node_ids = [node[0] for node in nodes]
+        if len(set(node_ids)) != len(node_ids):
+            raise ValueError("Duplicate node ids in topology")
+        names = [node[1] for node in nodes]
+        node_types = array("B", (NODE_TYPE_CODES[node[2]] for node in nodes))
+        positions = array("f")
+        for node in nodes:
+            positions.extend(node[3])
+        return cls(node_ids, names, node_types, positions, CSRAdjacency.from_edges(node_ids, edges))
+
+    @classmethod
+    def from_engine(cls, engine: ReliefGridNeuralEngine) -> "Topology":
+        nodes = [(node.id, node.name, node.node_type, node.position) for node in engine.nodes.values()]
+        edges = [(node_id, target) for node_id, targets in engine.successors.items() for target in targets]
+        return cls.from_nodes_and_edges(nodes, edges)
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def node_type(self, position: int) -> NodeType:
+        return NODE_TYPES[self.node_types[position]]
+
+    def position(self, position: int) -> Tuple[float, float]:
+        return (self.positions[2 * position], self.positions[2 * position + 1])
+
+    def edges(self) -> Iterable[Tuple[str, str]]:
+        indptr, indices, node_ids = self.adjacency.indptr, self.adjacency.indices, self.node_ids
+        for source, node_id in enumerate(node_ids):
+            for target in indices[indptr[source]:indptr[source + 1]]:
+                yield node_id, node_ids[target]
+
+# ===== JSON =====
+def load_json(path: str) -> Topology:
+    with open(path) as f:
+        document = json.load(f)
+    nodes = []
+    for entry in document["nodes"]:
+        position = entry.get("position", (0, 0))
+        nodes.append((entry["id"], entry.get("name", entry["id"]), NodeType(entry["type"]),
+                      (float(position[0]), float(position[1]))))
+    return Topology.from_nodes_and_edges(nodes, (tuple(edge) for edge in document["edges"]))
+
+def save_json(topology: Topology, path: str):
+    document = {
+        "nodes": [{"id": node_id, "name": topology.names[position],
+                   "type": topology.node_type(position).value,
+                   "position": list(topology.position(position))}
+                  for position, node_id in enumerate(topology.node_ids)],
+        "edges": [list(edge) for edge in topology.edges()]
+    }
+    with open(path, "w") as f:
+        json.dump(document, f)
+
+# ===== BINARY =====
+def _little_endian(values: array) -> array:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+def save_binary(topology: Topology, path: str):
+    adjacency = topology.adjacency
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(topology), adjacency.edge_count))
+        f.write(topology.node_types.tobytes())
+        f.write(_little_endian(topology.positions).tobytes())
+        f.write(_little_endian(array("I", adjacency.indptr)).tobytes())
+        f.write(_little_endian(array("I", adjacency.indices)).tobytes())
+        for strings in (topology.node_ids, topology.names):
+            if any("\n" in text for text in strings):
+                raise ValueError("Node ids and names cannot contain newlines in the binary format")
+            encoded = "\n".join(strings).encode("utf-8")
+            f.write(struct.pack("<I", len(encoded)))
+            f.write(encoded)
+
+def _read_array(data: memoryview, offset: int, typecode: str, count: int) -> Tuple[array, int]:
+    values = array(typecode)
+    end = offset + values.itemsize * count
+    values.frombytes(data[offset:end])
+    return _little_endian(values), end
+
+def load_binary(path: str) -> Topology:
+    with open(path, "rb") as f:
+        data = memoryview(f.read())
+    magic, version, node_count, edge_count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a Relief Grid topology file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported topology format version {version}")
+
+    offset = _HEADER.size
+    node_types, offset = _read_array(data, offset, "B", node_count)
+    positions, offset = _read_array(data, offset, "f", 2 * node_count)
+    indptr, offset = _read_array(data, offset, "I", node_count + 1)
+    indices, offset = _read_array(data, offset, "I", edge_count)
+
+    strings = []
+    for _ in range(2):
+        (length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        text = bytes(data[offset:offset + length]).decode("utf-8")
+        strings.append(text.split("\n") if node_count else [])
+        offset += length
+    node_ids, names = strings
+
+    adjacency = CSRAdjacency(node_ids, array("q", indptr), array("i", indices))
+    return Topology(node_ids, names, node_types, positions, adjacency)
+
+def load_topology(path: str) -> Topology:
+    """Load a topology, choosing the format from the file extension"""
+    return load_json(path) if path.endswith(".json") else load_binary(path)
+
+def save_topology(topology: Topology, path: str):
+    if path.endswith(".json"):
+        save_json(topology, path)
+    else:
+        save_binary(topology, path)
+
+# ===== GENERATION =====
+def generate_regional_topology(districts: int, fan_out: int = 3, seed: int = 0) -> Topology:
+    """Layered graph sized for a regional deployment.
+
+    Each district gets its own input, verification and field aggregation nodes;
+    these feed a shared assessment, decision and output backbone.
+    """
+    rng = random.Random(seed)
+    nodes: List[Tuple[str, str, NodeType, Tuple[float, float]]] = []
+    edges: List[Tuple[str, str]] = []
+
+    backbone = {
+        "processing2": [f"assessor_{i}" for i in range(max(4, districts // 50))],
+        "decision": [f"decider_{i}" for i in range(max(3, districts // 200))],
+        "output": [f"output_{i}" for i in range(max(2, districts // 500))]
+    }
+
+    for district in range(districts):
+        y = float(district * 10)
+        inputs = [f"d{district}_sensor", f"d{district}_reports"]
+        verifier, aggregator = f"d{district}_verification", f"d{district}_field_aggregator"
+        for node_id in inputs:
+            nodes.append((node_id, f"District {district} {node_id.split('_')[-1].title()}", NodeType.INPUT, (100.0, y)))
+        nodes.append((verifier, f"District {district} Verification", NodeType.PROCESSING, (300.0, y)))
+        nodes.append((aggregator, f"District {district} Field Aggregator", NodeType.PROCESSING, (300.0, y + 5)))
+        edges.extend((node_id, verifier) for node_id in inputs)
+        edges.append((inputs[1], aggregator))
+        for source in (verifier, aggregator):
+            edges.extend((source, target) for target in rng.sample(backbone["processing2"],
+                                                                   min(fan_out, len(backbone["processing2"]))))
+
+    layers = [("processing2", NodeType.PROCESSING, 500.0), ("decision", NodeType.DECISION, 700.0),
+              ("output", NodeType.OUTPUT, 900.0)]
+    for layer_index, (layer, node_type, x) in enumerate(layers):
+        for position, node_id in enumerate(backbone[layer]):
+            nodes.append((node_id, node_id.replace("_", " ").title(), node_type, (x, float(position * 40))))
+            if layer_index + 1 < len(layers):
+                next_layer = backbone[layers[layer_index + 1][0]]
+                edges.extend((node_id, target) for target in rng.sample(next_layer, min(fan_out, len(next_layer))))
+
+    return Topology.from_nodes_and_edges(nodes, edges)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate or convert Relief Grid network topologies")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser("generate", help="generate a regional topology")
+    generate.add_argument("--districts", type=int, default=1000)
+    generate.add_argument("--fan-out", type=int, default=3)
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument("output", help="output path (.json or .rgt)")
+
+    convert = subparsers.add_parser("convert", help="convert between JSON and binary")
+    convert.add_argument("input")
+    convert.add_argument("output")
+
+    export = subparsers.add_parser("export-default", help="write the built-in 25-node network")
+    export.add_argument("output")
+
+    args = parser.parse_args()
+    if args.command == "generate":
+        topology = generate_regional_topology(args.districts, args.fan_out, args.seed)
+    elif args.command == "convert":
+        topology = load_topology(args.input)
+    else:
+        topology = Topology.from_engine(ReliefGridNeuralEngine())
+    save_topology(topology, args.output)
+    print(f"Wrote {len(topology):,} nodes and {topology.adjacency.edge_count:,} edges to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Relief Grid Background Worker
+Runs engine work off the Tk main loop for the funnel and network UIs, handing
+results back to the UI thread through root.after polling.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+class BackgroundWorker:
+    """Runs engine work on a background thread and hands the results back to the Tk thread.
+
+    Jobs run one at a time, in submission order, on a single daemon thread, so an
+    engine is never used from two threads at once. Results come back through a
+    queue that is polled with root.after, and the done/error callbacks - which may
+    touch widgets - always run on the Tk main loop. While busy, the UI should leave
+    engine state alone and read it from the callbacks instead.
+    """
+
+    def __init__(self, root, poll_ms: int = 15, budget_ms: float = 10.0):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.budget_ms = budget_ms  # callback time per poll before yielding back to Tk
+        self.pending = 0  # submitted jobs whose callbacks have not run yet (Tk thread only)
+        self._jobs: queue.Queue = queue.Queue()
+        self._results: queue.Queue = queue.Queue()
+        self._poll_id: Optional[str] = None
+        self._thread = threading.Thread(target=self._work, name="relief-grid-engine", daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        return self.pending > 0
+
+    def submit(self, work: Callable, *args, on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None):
+        """Queue work(*args); on_done(result) or on_error(exception) follows on the Tk thread"""
+        self.pending += 1
+        self._jobs.put((work, args, on_done, on_error))
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
+
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            work, args, on_done, on_error = job
+            try:
+                outcome = (True, work(*args))
+            except Exception as e:
+                outcome = (False, e)
+            self._results.put((outcome, on_done, on_error))
+
+    def _poll(self):
+        self._poll_id = None
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        while time.perf_counter() < deadline:
+            try:
+                (succeeded, value), on_done, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if succeeded:
+                if on_done is not None:
+                    on_done(value)
+            elif on_error is not None:
+                on_error(value)
+            else:
+                self.root.report_callback_exception(type(value), value, value.__traceback__)
+        if self.pending and self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
+
+    def shutdown(self):
+        """Stop the worker thread once queued jobs finish; their callbacks are dropped"""
+        self._jobs.put(None)
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None